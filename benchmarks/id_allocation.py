@@ -0,0 +1,73 @@
+"""Benchmark creating item IDs with linear probing and with IdAllocator.
+
+Linear probing is quadratic, so it is measured on at most PROBE_LIMIT IDs.
+
+Run from the repository root:
+
+    python benchmarks/id_allocation.py [count]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.alarms_and_reminders.ids import IdAllocator  # noqa: E402
+
+PROBE_LIMIT = 10000
+
+
+def _probe(prefix: str, items: dict) -> str:
+    """The previous _get_next_available_id."""
+    counter = 1
+    while True:
+        potential_id = f"{prefix}_{counter}"
+        if potential_id not in items:
+            return potential_id
+        counter += 1
+
+
+def _create_probing(count: int) -> None:
+    items = {}
+    for _ in range(count):
+        items[_probe("alarm", items)] = None
+
+
+def _create_allocator(count: int) -> None:
+    items = {}
+    ids = IdAllocator()
+    for _ in range(count):
+        items[ids.allocate("alarm", items)] = None
+
+
+def _create_with_churn(count: int) -> None:
+    """Create count IDs while releasing every other one again."""
+    items = {}
+    ids = IdAllocator()
+    for index in range(count):
+        item_id = ids.allocate("alarm", items)
+        items[item_id] = None
+        if index % 2:
+            del items[item_id]
+            ids.release(item_id)
+
+
+def _time(func, count: int) -> float:
+    start = time.perf_counter()
+    func(count)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    print(f"creating {count} IDs")
+    print(f"  IdAllocator:             {_time(_create_allocator, count) * 1000:10.1f} ms")
+    print(f"  IdAllocator with reuse:  {_time(_create_with_churn, count) * 1000:10.1f} ms")
+    probe_count = min(count, PROBE_LIMIT)
+    print(f"creating {probe_count} IDs")
+    print(f"  IdAllocator:             {_time(_create_allocator, probe_count) * 1000:10.1f} ms")
+    print(f"  linear probing:          {_time(_create_probing, probe_count) * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark memory held by items as plain dicts and as AlarmReminderItem.
+
+Run from the repository root:
+
+    python benchmarks/item_memory.py [items]
+"""
+import sys
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.alarms_and_reminders.model import (  # noqa: E402
+    AlarmReminderItem,
+    ItemStatus,
+    Repeat,
+)
+
+
+def _dict_items(count: int, now) -> dict:
+    """Items as the coordinator used to hold them."""
+    return {
+        f"alarm_{index}": {
+            "scheduled_time": now + timedelta(minutes=index),
+            "satellite": "assist_satellite.kitchen",
+            "media_players": [],
+            "message": "",
+            "is_alarm": True,
+            # Values parsed from storage are separate string objects per item
+            "repeat": "".join(["dai", "ly"]),
+            "repeat_days": [],
+            "rrule": None,
+            "status": "".join(["sched", "uled"]),
+            "name": f"alarm_{index}",
+            "entity_id": f"alarm_{index}",
+            "unique_id": f"alarm_{index}",
+            "sound_file": "/custom_components/alarms_and_reminders/sounds/alarms/birds.mp3",
+        }
+        for index in range(count)
+    }
+
+
+def _model_items(count: int, now) -> dict:
+    return {
+        f"alarm_{index}": AlarmReminderItem(
+            item_id=f"alarm_{index}",
+            name=f"alarm_{index}",
+            is_alarm=True,
+            scheduled_time=now + timedelta(minutes=index),
+            status=ItemStatus("".join(["sched", "uled"])),
+            satellite="assist_satellite.kitchen",
+            repeat=Repeat("".join(["dai", "ly"])),
+            sound_file="/custom_components/alarms_and_reminders/sounds/alarms/birds.mp3",
+        )
+        for index in range(count)
+    }
+
+
+def _measure(factory, count: int, now) -> int:
+    tracemalloc.start()
+    items = factory(count, now)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    now = dt_util.now()
+    before = _measure(_dict_items, count, now)
+    after = _measure(_model_items, count, now)
+    print(f"{count} items")
+    print(f"  dict items:        {before / 1024:10.1f} KiB ({before / count:6.0f} B/item)")
+    print(f"  AlarmReminderItem: {after / 1024:10.1f} KiB ({after / count:6.0f} B/item)")
+
+
+if __name__ == "__main__":
+    main()
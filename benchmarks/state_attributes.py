@@ -0,0 +1,84 @@
+"""Benchmark bytes the recorder stores per item and sensor state change.
+
+Compares the attributes as they used to be written with the slim schema
+and its unrecorded attributes, encoded the way the recorder encodes them.
+Run from the repository root:
+
+    python benchmarks/state_attributes.py [items]
+"""
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.helpers.json import json_bytes  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.alarms_and_reminders.const import (  # noqa: E402
+    DEFAULT_ACTIVE_ITEMS_LIMIT,
+    DOMAIN,
+)
+from custom_components.alarms_and_reminders.model import (  # noqa: E402
+    STATE_UNRECORDED_ATTRIBUTES,
+    AlarmReminderItem,
+    Repeat,
+)
+from custom_components.alarms_and_reminders.sensor import ActiveItemsSensor  # noqa: E402
+
+
+def _items(count: int, now) -> list:
+    return [
+        AlarmReminderItem(
+            item_id=f"alarm_{index}",
+            name=f"alarm_{index}",
+            is_alarm=True,
+            scheduled_time=now + timedelta(minutes=index),
+            satellite="assist_satellite.kitchen",
+            message="Time to get up",
+            repeat=Repeat.DAILY,
+            sound_file="/custom_components/alarms_and_reminders/sounds/alarms/birds.mp3",
+        )
+        for index in range(count)
+    ]
+
+
+def _recorded(attrs: dict, unrecorded=frozenset()) -> int:
+    return len(json_bytes({key: value for key, value in attrs.items() if key not in unrecorded}))
+
+
+def _sensor_entries(items: list) -> dict:
+    return {
+        item.item_id: {
+            "name": item.name,
+            "status": item.status,
+            "scheduled_time": item.scheduled_time.isoformat(),
+            "entity_id": f"{DOMAIN}.{item.item_id}",
+        }
+        for item in items
+    }
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    items = _items(count, dt_util.now())
+    button = {"service": f"{DOMAIN}.stop_all_alarms", "name": "Stop All Alarms"}
+
+    item_before = _recorded(items[0].to_storage())
+    item_after = _recorded(items[0].to_state_attrs(), STATE_UNRECORDED_ATTRIBUTES)
+    sensor_before = _recorded({"active_items": _sensor_entries(items), "stop_all_button": button})
+    sensor_after = _recorded(
+        {
+            "active_items": _sensor_entries(items[:DEFAULT_ACTIVE_ITEMS_LIMIT]),
+            "total_items": count,
+            "stop_all_button": button,
+        },
+        ActiveItemsSensor._unrecorded_attributes,
+    )
+    print(f"Recorded attribute bytes per state change, {count} items")
+    print(f"  item state:   {item_before:10} B before {item_after:10} B after")
+    print(f"  sensor state: {sensor_before:10} B before {sensor_after:10} B after")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""Benchmark event loop time spent saving and loading the storage snapshot.
+
+Before: the snapshot was encoded with json.dumps(indent=4) on the event loop.
+After: the loop only builds the organized records; encoding with json_bytes
+(orjson) and checksumming run in the executor.
+
+Run from the repository root:
+
+    python benchmarks/storage_serialization.py [items]
+"""
+import hashlib
+import json
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from homeassistant.helpers.json import JSONEncoder  # noqa: E402
+from homeassistant.util import dt as dt_util  # noqa: E402
+
+from custom_components.alarms_and_reminders.model import (  # noqa: E402
+    AlarmReminderItem,
+    Repeat,
+)
+from custom_components.alarms_and_reminders.storage import (  # noqa: E402
+    BaseItemStorage,
+    _decode_snapshot,
+    _encode_snapshot,
+    _organize,
+)
+
+ROUNDS = 5
+
+
+def _items(count: int) -> dict:
+    now = dt_util.now()
+    return {
+        f"alarm_{index}": AlarmReminderItem(
+            item_id=f"alarm_{index}",
+            name=f"alarm_{index}",
+            is_alarm=index % 2 == 0,
+            scheduled_time=now + timedelta(minutes=index),
+            satellite="assist_satellite.kitchen",
+            media_players=["media_player.kitchen"],
+            message=f"Alarm number {index}",
+            repeat=Repeat.DAILY,
+            repeat_days=["mon", "tue", "wed", "thu", "fri"],
+        )
+        for index in range(count)
+    }
+
+
+def _organized(items: dict) -> dict:
+    return _organize(
+        (item_id, BaseItemStorage._to_record(data)) for item_id, data in items.items()
+    )
+
+
+def _save_before(items: dict) -> None:
+    organized = _organized(items)
+    for data in organized.values():
+        payload = json.dumps(data, cls=JSONEncoder, indent=4)
+        hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _save_after(items: dict) -> None:
+    _organized(items)
+
+
+def _best(func, *args, **kwargs) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    items = _items(count)
+    organized = _organized(items)
+    pretty = json.dumps(organized["alarms"], cls=JSONEncoder, indent=4)
+    envelope = _encode_snapshot(organized["alarms"])
+
+    print(f"{count} items, best of {ROUNDS} runs")
+    print("save, time blocking the event loop:")
+    print(f"  before (json.dumps indent=4 on loop): {_best(_save_before, items):8.2f} ms")
+    print(f"  after  (records only on loop):        {_best(_save_after, items):8.2f} ms")
+    print("encode one snapshot file (after: runs in executor):")
+    dumps = _best(json.dumps, organized["alarms"], cls=JSONEncoder, indent=4)
+    print(f"  json.dumps indent=4: {dumps:8.2f} ms")
+    print(f"  json_bytes + sha256: {_best(_encode_snapshot, organized['alarms']):8.2f} ms")
+    print("decode one snapshot file (runs in executor):")
+    print(f"  json.loads:           {_best(json.loads, pretty):8.2f} ms")
+    print(f"  json_loads + sha256:  {_best(_decode_snapshot, envelope):8.2f} ms")
+    print(f"snapshot size: {len(pretty.encode())} bytes before, {len(envelope)} bytes after")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,15 +2,20 @@
 from __future__ import annotations
 
 import logging
+from time import monotonic
 import voluptuous as vol
+from functools import partial
 from pathlib import Path
 from typing import Union
 from datetime import time, datetime
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType
+from homeassistant.util import dt as dt_util
+from homeassistant.util.yaml import load_yaml
 from homeassistant.const import ATTR_NAME  # Use HA's built-in ATTR_NAME
 
 from .const import (
@@ -31,6 +36,12 @@ from .const import (
     SERVICE_DELETE_ALL_ALARMS,  
     SERVICE_DELETE_ALL_REMINDERS,  
     SERVICE_DELETE_ALL,  
+    SERVICE_BULK_SET,
+    SERVICE_IMPORT_ICS,
+    SERVICE_EXPORT_ICS,
+    SERVICE_EXPORT_ITEMS,
+    SERVICE_RESYNC,
+    SERVICE_LIST_ITEMS,
     ATTR_DATETIME,
     ATTR_SATELLITE,
     ATTR_MESSAGE,
@@ -44,18 +55,36 @@ from .const import (
     DEFAULT_SATELLITE,
     DEFAULT_SNOOZE_MINUTES,
     CONF_MEDIA_PLAYER,
+    CONF_SAVE_DELAY,
+    CONF_STORAGE_BACKEND,
+    CONF_PUBLISH_WINDOW,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_STORAGE_BACKEND,
+    DEFAULT_PUBLISH_WINDOW,
+    DEFAULT_LIST_LIMIT,
+    MAX_LIST_LIMIT,
 )  
 
-from .coordinator import AlarmAndReminderCoordinator
+from .coordinator import AlarmAndReminderCoordinator, InvalidCursorError
 from .media_player import MediaHandler
 from .announcer import Announcer
+from .ical import convert_events, iter_events, write_calendar_file
 from .intents import async_setup_intents
+from .model import ItemStatus
+from .recurrence import parse_rrule
 from .sensor import async_setup_entry as async_setup_sensor_entry
+from .storage import create_storage
+from .websocket import async_setup_websocket
 
 __all__ = ["AlarmAndReminderCoordinator"]
 
 _LOGGER = logging.getLogger(__name__)
 
+BULK_ITEM_TYPES = ("alarm", "reminder")
+
+# Events parsed per executor job while importing a calendar
+ICS_BATCH_SIZE = 500
+
 REPEAT_OPTIONS = [
     "once",
     "daily",
@@ -89,7 +118,37 @@ async def _get_satellites(hass: HomeAssistant) -> list:
         _LOGGER.error("Error getting satellites list: %s", err, exc_info=True)
         return []
 
-PLATFORMS = ["sensor"]
+def validate_rrule(value) -> str:
+    """Validate an RFC 5545 RRULE string."""
+    value = cv.string(value).strip()
+    try:
+        parse_rrule(value)
+    except (ValueError, TypeError) as err:
+        raise vol.Invalid(f"Invalid rrule: {err}") from err
+    return value
+
+def _config_path(config_dir: str, file_name: str) -> Path:
+    """Resolve a file name that must stay inside the config directory."""
+    root = Path(config_dir).resolve()
+    path = (root / file_name).resolve()
+    if root not in path.parents:
+        raise vol.Invalid(f"{file_name} is not inside the config directory")
+    return path
+
+def _load_bulk_file(config_dir: str, file_name: str) -> list:
+    """Load bulk_set items from a YAML or JSON file under the config directory."""
+    path = _config_path(config_dir, file_name)
+    try:
+        content = load_yaml(str(path))
+    except (OSError, HomeAssistantError) as err:
+        raise vol.Invalid(f"Cannot read {file_name}: {err}") from err
+    if isinstance(content, dict):
+        content = content.get("items")
+    if not isinstance(content, list):
+        raise vol.Invalid(f"{file_name} must contain a list of items")
+    return content
+
+PLATFORMS = ["sensor", "calendar"]
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Alarms and Reminders integration."""
@@ -129,6 +188,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 cv.ensure_list,
                 [vol.In(["mon", "tue", "wed", "thu", "fri", "sat", "sun"])]
             ),
+            vol.Optional("rrule"): validate_rrule,
             vol.Optional("sound_file", default=DEFAULT_ALARM_SOUND): cv.string,
             vol.Optional(ATTR_NOTIFY_DEVICE): vol.Any(
                 cv.string,  # Single device
@@ -148,6 +208,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 cv.ensure_list,
                 [vol.In(["mon", "tue", "wed", "thu", "fri", "sat", "sun"])]
             ),
+            vol.Optional("rrule"): validate_rrule,
             vol.Optional("sound_file", default=DEFAULT_REMINDER_SOUND): cv.string,
             vol.Optional(ATTR_NOTIFY_DEVICE): vol.Any(
                 cv.string,  # Single device
@@ -157,11 +218,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
         # Store coordinator for future access
         hass.data[DOMAIN]["coordinator"] = coordinator
+        async_setup_websocket(hass)
 
-        def validate_target(call: ServiceCall) -> dict:
+        def validate_target(data: dict) -> dict:
             """Validate that either satellite or media_player is provided."""
-            satellite = call.data.get(ATTR_SATELLITE)
-            media_players = call.data.get(ATTR_MEDIA_PLAYER, [])
+            satellite = data.get(ATTR_SATELLITE)
+            media_players = data.get(ATTR_MEDIA_PLAYER, [])
 
             if not satellite and not media_players:
                 raise vol.Invalid("No valid target found. Configure a satellite or specify one or more media players.")
@@ -171,12 +233,12 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
         async def async_schedule_alarm(call: ServiceCall):
             """Handle the alarm service call."""
-            target = validate_target(call)
+            target = validate_target(call.data)
             await coordinator.schedule_item(call, is_alarm=True, target=target)
 
         async def async_schedule_reminder(call: ServiceCall):
             """Handle the reminder service call."""
-            target = validate_target(call)
+            target = validate_target(call.data)
             await coordinator.schedule_item(call, is_alarm=False, target=target)
 
         # Register services with updated schema
@@ -194,6 +256,196 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             schema=REMINDER_SERVICE_SCHEMA,
         )
 
+        def validate_bulk_spec(spec: dict) -> tuple:
+            """Validate one bulk_set item the way set_alarm/set_reminder would."""
+            if not isinstance(spec, dict):
+                raise vol.Invalid("Item must be a mapping")
+            spec = dict(spec)
+            item_type = spec.pop("type", None)
+            if item_type not in BULK_ITEM_TYPES:
+                raise vol.Invalid(f"type must be one of {', '.join(BULK_ITEM_TYPES)}")
+            is_alarm = item_type == "alarm"
+            data = (ALARM_SERVICE_SCHEMA if is_alarm else REMINDER_SERVICE_SCHEMA)(spec)
+            return is_alarm, data, validate_target(data)
+
+        async def async_bulk_set(call: ServiceCall) -> ServiceResponse:
+            """Handle bulk set service call."""
+            specs = list(call.data.get("items", []))
+            if "file" in call.data:
+                specs.extend(await hass.async_add_executor_job(
+                    _load_bulk_file, hass.config.config_dir, call.data["file"]
+                ))
+
+            # Validate everything before anything is scheduled
+            results = [None] * len(specs)
+            valid = []
+            for index, spec in enumerate(specs):
+                try:
+                    valid.append((index, validate_bulk_spec(spec)))
+                except vol.Invalid as err:
+                    results[index] = {"error": str(err)}
+
+            scheduled = coordinator.async_schedule_items(spec for _, spec in valid)
+            for (index, _), result in zip(valid, scheduled):
+                results[index] = result
+
+            for index, result in enumerate(results):
+                result["index"] = index
+                result["success"] = "error" not in result
+            return {"results": results}
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_BULK_SET,
+            async_bulk_set,
+            schema=vol.All(
+                vol.Schema({
+                    vol.Optional("items"): vol.All(cv.ensure_list, [dict]),
+                    vol.Optional("file"): cv.string,
+                }),
+                cv.has_at_least_one_key("items", "file"),
+            ),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+        async def async_import_ics(call: ServiceCall) -> ServiceResponse:
+            """Handle iCalendar import service call."""
+            path = _config_path(hass.config.config_dir, call.data["file"])
+            defaults = {
+                "type": call.data["type"],
+                ATTR_SATELLITE: call.data.get(ATTR_SATELLITE),
+                ATTR_MEDIA_PLAYER: call.data.get(ATTR_MEDIA_PLAYER),
+            }
+            try:
+                file = await hass.async_add_executor_job(
+                    partial(open, path, encoding="utf-8")
+                )
+            except OSError as err:
+                raise vol.Invalid(f"Cannot read {call.data['file']}: {err}") from err
+
+            imported = 0
+            failed = []
+            now = dt_util.now()
+            try:
+                events = iter_events(file)
+                # Parse a batch in the executor, then schedule it in one pass
+                while batch := await hass.async_add_executor_job(
+                    convert_events, events, ICS_BATCH_SIZE, now, defaults
+                ):
+                    valid = []
+                    for event in batch:
+                        if "error" not in event:
+                            try:
+                                valid.append((event["uid"], validate_bulk_spec(event["spec"])))
+                                continue
+                            except vol.Invalid as err:
+                                event["error"] = str(err)
+                        failed.append({"uid": event["uid"], "error": event["error"]})
+
+                    results = coordinator.async_schedule_items(spec for _, spec in valid)
+                    for (uid, _), result in zip(valid, results):
+                        if "error" in result:
+                            failed.append({"uid": uid, "error": result["error"]})
+                        else:
+                            imported += 1
+            finally:
+                await hass.async_add_executor_job(file.close)
+
+            _LOGGER.info("Imported %d events from %s, %d skipped", imported, path, len(failed))
+            return {"imported": imported, "failed": failed}
+
+        async def async_export_ics(call: ServiceCall) -> ServiceResponse:
+            """Handle iCalendar export service call."""
+            path = _config_path(hass.config.config_dir, call.data["file"])
+            records = [(item_id, item.to_storage()) for item_id, item in coordinator.items()]
+            exported = await hass.async_add_executor_job(write_calendar_file, path, records)
+            return {"exported": exported}
+
+        async def async_export_items(call: ServiceCall) -> ServiceResponse:
+            """Handle readable storage export service call."""
+            path = _config_path(hass.config.config_dir, call.data["file"])
+            # Export what is stored, including changes still in the quiet window
+            await coordinator.storage.async_flush()
+            return {"exported": await coordinator.storage.async_export(path)}
+
+        async def async_resync(call: ServiceCall) -> None:
+            """Handle resync service call."""
+            await coordinator.async_load_items(resync=True)
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_IMPORT_ICS,
+            async_import_ics,
+            schema=vol.Schema({
+                vol.Required("file"): cv.string,
+                vol.Optional("type", default="alarm"): vol.In(BULK_ITEM_TYPES),
+                vol.Optional(ATTR_SATELLITE): cv.entity_id,
+                vol.Optional(ATTR_MEDIA_PLAYER): vol.All(cv.ensure_list, [cv.entity_id]),
+            }),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT_ICS,
+            async_export_ics,
+            schema=vol.Schema({
+                vol.Required("file"): cv.string,
+            }),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_EXPORT_ITEMS,
+            async_export_items,
+            schema=vol.Schema({
+                vol.Required("file"): cv.string,
+            }),
+            supports_response=SupportsResponse.OPTIONAL,
+        )
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_RESYNC,
+            async_resync,
+        )
+
+        async def async_list_items(call: ServiceCall) -> ServiceResponse:
+            """Handle list items service call."""
+            start = call.data.get("start")
+            end = call.data.get("end")
+            try:
+                return coordinator.list_items(
+                    is_alarm=call.data["type"] == "alarm" if "type" in call.data else None,
+                    statuses=call.data.get("status"),
+                    target=call.data.get("target"),
+                    start=dt_util.as_local(start) if start else None,
+                    end=dt_util.as_local(end) if end else None,
+                    limit=call.data["limit"],
+                    cursor=call.data.get("cursor"),
+                )
+            except InvalidCursorError as err:
+                raise vol.Invalid(f"Invalid cursor: {call.data.get('cursor')}") from err
+
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_LIST_ITEMS,
+            async_list_items,
+            schema=vol.Schema({
+                vol.Optional("type"): vol.In(BULK_ITEM_TYPES),
+                vol.Optional("status"): vol.All(cv.ensure_list, [vol.In(list(ItemStatus))]),
+                vol.Optional("target"): cv.entity_id,
+                vol.Optional("start"): cv.datetime,
+                vol.Optional("end"): cv.datetime,
+                vol.Optional("limit", default=DEFAULT_LIST_LIMIT): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=MAX_LIST_LIMIT)
+                ),
+                vol.Optional("cursor"): cv.string,
+            }),
+            supports_response=SupportsResponse.ONLY,
+        )
+
         # Register reminder-specific services
         async def async_stop_reminder(call: ServiceCall):
             """Handle stop reminder service call."""
@@ -715,22 +967,37 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up from a config entry."""
+    setup_start = monotonic()
     try:
         # Initialize data structure if not exists
         if DOMAIN not in hass.data:
             hass.data[DOMAIN] = {}
 
-        # Initialize components
-        sounds_dir = Path(__file__).parent / "sounds"
-        media_handler = MediaHandler(
+        # Reuse the coordinator the services were registered with so there is
+        # a single set of items and a single trigger scheduler
+        coordinator = hass.data[DOMAIN].get("coordinator")
+        if coordinator is None:
+            sounds_dir = Path(__file__).parent / "sounds"
+            media_handler = MediaHandler(
+                hass,
+                str(sounds_dir / "alarms" / "birds.mp3"),
+                str(sounds_dir / "reminders" / "ringtone.mp3")
+            )
+            announcer = Announcer(hass)
+            coordinator = AlarmAndReminderCoordinator(
+                hass, media_handler, announcer
+            )
+            hass.data[DOMAIN]["coordinator"] = coordinator
+
+        # Write saves queued on the storage in use before replacing it
+        await coordinator.storage.async_flush()
+        await coordinator.storage.async_close()
+        coordinator.storage = create_storage(
             hass,
-            str(sounds_dir / "alarms" / "birds.mp3"),
-            str(sounds_dir / "reminders" / "ringtone.mp3")
-        )
-        announcer = Announcer(hass)
-        coordinator = AlarmAndReminderCoordinator(
-            hass, media_handler, announcer
+            entry.options.get(CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND),
+            entry.options.get(CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY),
         )
+        coordinator.publisher.window = entry.options.get(CONF_PUBLISH_WINDOW, DEFAULT_PUBLISH_WINDOW)
 
         # Load saved items
         await coordinator.async_load_items()
@@ -746,7 +1013,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         
         # Set up update listener
         entry.async_on_unload(entry.add_update_listener(update_listener))
-        
+
+        _LOGGER.info(
+            "Set up config entry in %.3f s", monotonic() - setup_start
+        )
         return True
 
     except Exception as err:
@@ -756,7 +1026,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data["coordinator"].async_shutdown()
+        await entry_data["coordinator"].storage.async_flush()
+        await entry_data["coordinator"].storage.async_close()
     return unload_ok
 
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
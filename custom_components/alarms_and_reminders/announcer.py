@@ -2,26 +2,46 @@
 import logging
 import asyncio
 from datetime import datetime
+from typing import Optional
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util 
 
 _LOGGER = logging.getLogger(__name__)
 
+
+async def wait_for_stop(stop_event: Optional[asyncio.Event], timeout: float) -> bool:
+    """Wait up to timeout seconds for a stop request and return True if one came."""
+    if stop_event is None:
+        await asyncio.sleep(timeout)
+        return False
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+def signal_stopped(stopped: Optional[asyncio.Future]) -> None:
+    """Tell whoever is stopping a playback session that it has finished."""
+    if stopped is not None and not stopped.done():
+        stopped.set_result(None)
+
+
 class Announcer:
     """Handles announcements and sounds on satellites."""
     
     def __init__(self, hass: HomeAssistant):
         """Initialize announcer."""
         self.hass = hass
-        self._stop_event = None
 
     async def announce_on_satellite(self, satellite: str, message: str, sound_file: str, 
-                                    stop_event=None, name: str = None, is_alarm: bool = False) -> None:
-        """Make announcement and play sound on satellite."""
-        try:
-            # Store stop event
-            self._stop_event = stop_event
+                                    stop_event=None, name: str = None, is_alarm: bool = False,
+                                    stopped: Optional[asyncio.Future] = None) -> None:
+        """Make announcement and play sound on satellite.
 
+        stopped is resolved once the loop has exited, however it ended.
+        """
+        try:
             # Ensure proper entity_id format
             satellite_entity_id = (
                 satellite if satellite.startswith("assist_satellite.") 
@@ -29,7 +49,7 @@ class Announcer:
             )
 
             while True:
-                if self._stop_event and self._stop_event.is_set():
+                if stop_event and stop_event.is_set():
                     _LOGGER.debug("Announcement loop stopped")
                     break
 
@@ -70,9 +90,8 @@ class Announcer:
 
                     # 3. Wait for satellite to be idle
                     while not await self._is_satellite_idle(satellite_entity_id):
-                        if self._stop_event and self._stop_event.is_set():
+                        if await wait_for_stop(stop_event, 1):
                             return
-                        await asyncio.sleep(1)
 
                     # 4. Play ringtone
                     await self.hass.services.async_call(
@@ -86,18 +105,13 @@ class Announcer:
                     )
 
                     # 5. Wait for one minute or until stopped
-                    try:
-                        if self._stop_event:
-                            await asyncio.wait_for(self._stop_event.wait(), timeout=60)
-                            break
-                        else:
-                            await asyncio.sleep(60)
-                    except asyncio.TimeoutError:
-                        continue
+                    if await wait_for_stop(stop_event, 60):
+                        break
 
                 except Exception as err:
                     _LOGGER.error("Error in announcement loop: %s", err)
-                    await asyncio.sleep(5)
+                    if await wait_for_stop(stop_event, 5):
+                        break
 
         except Exception as err:
             _LOGGER.error(
@@ -106,6 +120,8 @@ class Announcer:
                 str(err),
                 exc_info=True
             )
+        finally:
+            signal_stopped(stopped)
 
     async def _is_satellite_idle(self, satellite_entity_id: str) -> bool:
         """Check if satellite is idle."""
@@ -0,0 +1,94 @@
+"""Calendar platform for Alarms and Reminders."""
+from datetime import datetime, timedelta
+import logging
+from typing import List, Optional
+
+from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .index import repeats
+from .model import AlarmReminderItem
+
+_LOGGER = logging.getLogger(__name__)
+
+# Items ring at an instant; events need an end, so each one lasts this long
+EVENT_DURATION = timedelta(minutes=1)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the calendar platform."""
+    try:
+        coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+        async_add_entities([
+            AlarmsAndRemindersCalendar(coordinator, is_alarm=True),
+            AlarmsAndRemindersCalendar(coordinator, is_alarm=False),
+        ])
+    except Exception as err:
+        _LOGGER.error("Error setting up calendar platform: %s", err)
+
+
+def _event(start: datetime, item: AlarmReminderItem) -> CalendarEvent:
+    """Return the calendar event for one ring of an item."""
+    start = dt_util.as_local(start)
+    return CalendarEvent(
+        start=start,
+        end=start + EVENT_DURATION,
+        summary=item.name,
+        description=item.message or None,
+        uid=item.item_id,
+        recurrence_id=start.isoformat() if repeats(item) else None,
+    )
+
+
+class AlarmsAndRemindersCalendar(CalendarEntity):
+    """Calendar of upcoming alarms or reminders."""
+
+    def __init__(self, coordinator, is_alarm: bool):
+        """Initialize the calendar."""
+        self.coordinator = coordinator
+        self.is_alarm = is_alarm
+        self._attr_unique_id = f"alarms_and_reminders_{'alarms' if is_alarm else 'reminders'}_calendar"
+        self._attr_name = "Alarms" if is_alarm else "Reminders"
+        self._attr_icon = "mdi:alarm" if is_alarm else "mdi:reminder"
+        self._attr_should_poll = False
+
+    @property
+    def event(self) -> Optional[CalendarEvent]:
+        """Return the ringing or next upcoming event."""
+        occurrence = self.coordinator.next_occurrence(
+            self.is_alarm, dt_util.now() - EVENT_DURATION
+        )
+        return _event(*occurrence) if occurrence else None
+
+    async def async_get_events(
+        self,
+        hass: HomeAssistant,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> List[CalendarEvent]:
+        """Return the events overlapping a datetime range."""
+        return [
+            _event(start, item)
+            for start, item in self.coordinator.occurrences_between(
+                self.is_alarm, start_date - EVENT_DURATION, end_date
+            )
+        ]
+
+    async def async_added_to_hass(self):
+        """Register callbacks."""
+        @callback
+        def _state_changed(event):
+            """Handle state changes."""
+            self.async_write_ha_state()
+
+        self.async_on_remove(
+            self.hass.bus.async_listen(f"{DOMAIN}_state_changed", _state_changed)
+        )
@@ -13,10 +13,19 @@ from .const import (
     CONF_ALARM_SOUND,
     CONF_REMINDER_SOUND,
     CONF_MEDIA_PLAYER,
+    CONF_SAVE_DELAY,
+    CONF_STORAGE_BACKEND,
+    CONF_PUBLISH_WINDOW,
+    CONF_ACTIVE_ITEMS_LIMIT,
     DEFAULT_ALARM_SOUND,
     DEFAULT_REMINDER_SOUND,
     DEFAULT_MEDIA_PLAYER,
-    DEFAULT_NAME
+    DEFAULT_NAME,
+    DEFAULT_SAVE_DELAY,
+    DEFAULT_STORAGE_BACKEND,
+    DEFAULT_PUBLISH_WINDOW,
+    DEFAULT_ACTIVE_ITEMS_LIMIT,
+    STORAGE_BACKENDS,
 )
 
 @config_entries.HANDLERS.register(DOMAIN)
@@ -79,5 +88,29 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     CONF_MEDIA_PLAYER,
                     default=self.config_entry.options.get(CONF_MEDIA_PLAYER, "none")
                 ): vol.In(media_players),
+                vol.Optional(
+                    CONF_SAVE_DELAY,
+                    default=self.config_entry.options.get(
+                        CONF_SAVE_DELAY, DEFAULT_SAVE_DELAY
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                vol.Optional(
+                    CONF_STORAGE_BACKEND,
+                    default=self.config_entry.options.get(
+                        CONF_STORAGE_BACKEND, DEFAULT_STORAGE_BACKEND
+                    ),
+                ): vol.In(STORAGE_BACKENDS),
+                vol.Optional(
+                    CONF_PUBLISH_WINDOW,
+                    default=self.config_entry.options.get(
+                        CONF_PUBLISH_WINDOW, DEFAULT_PUBLISH_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+                vol.Optional(
+                    CONF_ACTIVE_ITEMS_LIMIT,
+                    default=self.config_entry.options.get(
+                        CONF_ACTIVE_ITEMS_LIMIT, DEFAULT_ACTIVE_ITEMS_LIMIT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=500)),
             })
         )
\ No newline at end of file
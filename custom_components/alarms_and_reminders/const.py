@@ -21,6 +21,12 @@ SERVICE_DELETE_REMINDER = "delete_reminder"
 SERVICE_DELETE_ALL_ALARMS = "delete_all_alarms"
 SERVICE_DELETE_ALL_REMINDERS = "delete_all_reminders"
 SERVICE_DELETE_ALL = "delete_all"
+SERVICE_BULK_SET = "bulk_set"
+SERVICE_IMPORT_ICS = "import_ics"
+SERVICE_EXPORT_ICS = "export_ics"
+SERVICE_EXPORT_ITEMS = "export_items"
+SERVICE_RESYNC = "resync"
+SERVICE_LIST_ITEMS = "list_items"
 
 # Attributes
 ATTR_DATETIME = "datetime"      # A string containing the reminder time
@@ -38,6 +44,15 @@ ATTR_NOTIFY_TITLE = "Alarm & Reminder"
 CONF_ALARM_SOUND = "alarm_sound"
 CONF_REMINDER_SOUND = "reminder_sound"
 CONF_MEDIA_PLAYER = "media_player"
+CONF_SAVE_DELAY = "save_delay"
+CONF_STORAGE_BACKEND = "storage_backend"
+CONF_PUBLISH_WINDOW = "publish_window"
+CONF_ACTIVE_ITEMS_LIMIT = "active_items_limit"
+
+# Storage backends
+STORAGE_BACKEND_JSON = "json"
+STORAGE_BACKEND_SQLITE = "sqlite"
+STORAGE_BACKENDS = [STORAGE_BACKEND_JSON, STORAGE_BACKEND_SQLITE]
 
 # Defaults
 DEFAULT_NAME = "Alarms and Reminders"  # Config flow
@@ -48,3 +63,11 @@ DEFAULT_REMINDER_SOUND = "/custom_components/alarms_and_reminders/sounds/reminde
 DEFAULT_MEDIA_PLAYER = None
 DEFAULT_SNOOZE_MINUTES = 5 # Default snooze time in minutes
 DEFAULT_NOTIFICATION_TITLE = "Alarm & Reminder"
+DEFAULT_SAVE_DELAY = 2  # Quiet window in seconds before changes are written to disk
+DEFAULT_STORAGE_BACKEND = STORAGE_BACKEND_JSON
+DEFAULT_PUBLISH_WINDOW = 0  # Seconds item state changes are batched for; 0 publishes on the next loop iteration
+DEFAULT_ACTIVE_ITEMS_LIMIT = 20  # Upcoming items listed in the sensors' active_items attribute
+
+# Page size of list_items and the items websocket command
+DEFAULT_LIST_LIMIT = 50
+MAX_LIST_LIMIT = 500
@@ -1,21 +1,54 @@
 """Coordinator for scheduling alarms and reminders."""
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple, Union
 import asyncio
+import heapq
+import math
+from bisect import bisect_right
 from datetime import datetime, timedelta
 import re
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.util import dt as dt_util
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.start import async_at_started
+from homeassistant.helpers.storage import Store
+from .announcer import signal_stopped, wait_for_stop
 from .const import DOMAIN
-from .entity import AlarmReminderEntity
+from .ids import IdAllocator
+from .index import ItemIndex, TimeIndex
+from .publisher import StatePublisher
+from .model import AlarmReminderItem, ItemStatus, Repeat
+from .recurrence import Recurrence, RRuleRecurrence, bound_rrule_text, compile_recurrence
+from .scheduler import ItemScheduler
 from .storage import AlarmReminderStorage
 
 _LOGGER = logging.getLogger(__name__)
 
-__all__ = ["AlarmAndReminderCoordinator"]
+__all__ = ["AlarmAndReminderCoordinator", "InvalidCursorError"]
+
+ID_STORAGE_VERSION = 1
+
+# Statuses of items that are still going to ring
+LIVE_STATUSES = (ItemStatus.SCHEDULED, ItemStatus.ACTIVE)
+
+# Longest a stop waits for playback to acknowledge before the trigger is cancelled
+STOP_ACK_TIMEOUT = 2
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a list_items cursor cannot be decoded."""
+
+
+def _decode_cursor(cursor: str) -> Tuple[float, str]:
+    """Return the (timestamp, item_id) entry a list_items cursor points at."""
+    timestamp, separator, item_id = cursor.partition("|")
+    try:
+        position = float(timestamp)
+    except ValueError as err:
+        raise InvalidCursorError(cursor) from err
+    if not separator or not item_id or not math.isfinite(position):
+        raise InvalidCursorError(cursor)
+    return position, item_id
 
 class AlarmAndReminderCoordinator:
     """Coordinates scheduling of alarms and reminders."""
@@ -25,48 +58,19 @@ class AlarmAndReminderCoordinator:
         self.hass = hass
         self.media_handler = media_handler
         self.announcer = announcer
-        self._active_items: Dict[str, Dict[str, Any]] = {}
+        self._active_items: Dict[str, AlarmReminderItem] = {}
         self._stop_events: Dict[str, asyncio.Event] = {}
-        self.async_add_entities = None
-        self._alarm_counter = 0
-        self._reminder_counter = 0
+        self._trigger_tasks: Dict[str, asyncio.Task] = {}
+        # Resolved by the playback loops once a ringing item has gone quiet
+        self._playback_stopped: Dict[str, asyncio.Future] = {}
+        self._recurrences: Dict[str, Union[Recurrence, RRuleRecurrence]] = {}
+        self._index = ItemIndex()
+        self._times = TimeIndex()
+        self._ids = IdAllocator()
+        self._id_store = Store(hass, ID_STORAGE_VERSION, f"{DOMAIN}.ids")
         self.storage = AlarmReminderStorage(hass)
-        
-        # Load existing items from states with better logging
-        _LOGGER.debug("Starting to load existing items")
-        try:
-            for state in hass.states.async_all():
-                if state.entity_id.startswith(f"{DOMAIN}."):
-                    item_id = state.entity_id.split(".")[-1]
-                    _LOGGER.debug("Found entity: %s with state: %s and attributes: %s", 
-                                 state.entity_id, state.state, state.attributes)
-                    
-                    # Convert the scheduled_time back to datetime if it exists
-                    attributes = dict(state.attributes)
-                    if "scheduled_time" in attributes:
-                        try:
-                            if isinstance(attributes["scheduled_time"], str):
-                                attributes["scheduled_time"] = dt_util.parse_datetime(
-                                    attributes["scheduled_time"]
-                                )
-                        except Exception as err:
-                            _LOGGER.error("Error parsing scheduled_time: %s", err)
-                    
-                    self._active_items[item_id] = attributes
-                    if state.state == "active":
-                        self._stop_events[item_id] = asyncio.Event()
-                    
-                    # Update counters
-                    if attributes.get("is_alarm"):
-                        counter_num = int(item_id.split("_")[-1]) if item_id.startswith("alarm_") else 0
-                        self._alarm_counter = max(self._alarm_counter, counter_num)
-                    
-                    _LOGGER.debug("Loaded item: %s with attributes: %s", 
-                                item_id, self._active_items[item_id])
-            
-            _LOGGER.debug("Finished loading items. Active items: %s", self._active_items)
-        except Exception as err:
-            _LOGGER.error("Error loading existing items: %s", err, exc_info=True)
+        self.scheduler = ItemScheduler(hass, self._async_fire_item)
+        self.publisher = StatePublisher(hass, self.get_item)
         
         # Ensure domain data structure exists
         if DOMAIN not in self.hass.data:
@@ -79,178 +83,535 @@ class AlarmAndReminderCoordinator:
             if "entities" not in self.hass.data[DOMAIN][config_entry.entry_id]:
                 self.hass.data[DOMAIN][config_entry.entry_id]["entities"] = []
 
-        # Add these new methods
-        self._used_alarm_ids = set()  # Track used alarm IDs
-        self._used_reminder_ids = set()  # Track used reminder IDs
-
+    @callback
     def _get_next_available_id(self, prefix: str) -> str:
         """Get next available ID for alarms."""
-        counter = 1
-        while True:
-            potential_id = f"{prefix}_{counter}"
-            if potential_id not in self._active_items:
-                return potential_id
-            counter += 1
-
-    async def async_load_items(self) -> None:
-        """Load items from storage and update used IDs."""
+        item_id = self._ids.allocate(prefix, self._active_items)
+        self._async_save_ids()
+        return item_id
+
+    @callback
+    def _async_release_id(self, item_id: str) -> None:
+        """Make a removed item's ID available again."""
+        self._ids.release(item_id)
+        self._async_save_ids()
+
+    @callback
+    def _async_save_ids(self) -> None:
+        """Persist the ID allocator with the item storage quiet window."""
+        self._id_store.async_delay_save(self._ids.as_dict, self.storage.save_delay)
+
+    async def async_load_items(self, resync: bool = False) -> None:
+        """Load items from storage and update used IDs.
+
+        Storage is the only source of items; their entities are restored
+        from it and the entity registry keeps their entity ids. With resync,
+        pending changes are written first and the files are read again.
+        """
         try:
-            self._active_items = await self.storage.async_load()
-            
-            # Update used IDs from loaded items
-            self._used_alarm_ids.clear()
-            self._used_reminder_ids.clear()
+            previous_ids = list(self._active_items)
+            if resync:
+                self._active_items = await self.storage.async_resync()
+            else:
+                self._active_items = await self.storage.async_load()
             
-            for item_id, item in self._active_items.items():
-                if item.get("is_alarm"):
-                    self._used_alarm_ids.add(item_id)
-                else:
-                    self._used_reminder_ids.add(item_id)
+            # Restore the ID allocator and make sure it covers every loaded item
+            self._ids = IdAllocator.from_dict(await self._id_store.async_load())
+            for item_id in self._active_items:
+                self._ids.observe(item_id)
             
             _LOGGER.debug("Loaded items from storage: %s", self._active_items)
             
-            # Recreate stop events for active items
+            # Recreate stop events for active items, keeping those of
+            # items already ringing
             for item_id, item in self._active_items.items():
-                if item["status"] == "active":
-                    self._stop_events[item_id] = asyncio.Event()
+                if item.status == ItemStatus.ACTIVE:
+                    self._stop_events.setdefault(item_id, asyncio.Event())
             
-            # Schedule active items
+            # Compile repeat rules and schedule active items in one heap build
+            self.scheduler.async_stop()
+            self._recurrences.clear()
             now = dt_util.now()
+            triggers = []
             for item_id, item in self._active_items.items():
-                if item["status"] == "scheduled":
-                    delay = (item["scheduled_time"] - now).total_seconds()
-                    if delay > 0:
-                        self.hass.loop.call_later(
-                            delay,
-                            lambda: self.hass.async_create_task(
-                                self._trigger_item(item_id)
-                            )
-                        )
+                self._compile_recurrence(item_id)
+                if item.status != ItemStatus.SCHEDULED:
+                    continue
+                if item.scheduled_time <= now:
+                    # Missed while Home Assistant was down; move repeating
+                    # items on to their next occurrence
+                    new_time = self._calculate_next_occurrence(item_id, now)
+                    if new_time is None:
+                        continue
+                    item.scheduled_time = new_time
+                triggers.append((item_id, item.scheduled_time))
+            self.scheduler.schedule_many(triggers)
+            self._rebuild_indexes()
+
+            self._async_publish(*previous_ids, *self._active_items)
+            # Registry entries of vanished items show up as restored states
+            # once Home Assistant has started
+            async_at_started(self.hass, self._async_remove_orphans)
+            _LOGGER.info("Loaded %d items, %d scheduled", len(self._active_items), len(triggers))
         except Exception as err:
             _LOGGER.error("Error loading items: %s", err, exc_info=True)
 
+    @callback
+    def _async_remove_orphans(self, _hass: HomeAssistant) -> None:
+        """Remove item entities left in the registry without an item."""
+        self.publisher.async_remove_orphans()
+
+    def count_items(self, is_alarm: bool, statuses: Iterable[str]) -> int:
+        """Return the number of items of a type in any of the statuses."""
+        return self._index.count(is_alarm, statuses)
+
+    def item_ids(self, is_alarm: bool, statuses: Iterable[str]) -> List[str]:
+        """Return the ids of items of a type in any of the statuses."""
+        return self._index.ids(is_alarm, statuses)
+
+    def get_item(self, item_id: str) -> Optional[AlarmReminderItem]:
+        """Return an item by id, or None if it does not exist."""
+        return self._active_items.get(item_id)
+
+    def items(self) -> Iterator[Tuple[str, AlarmReminderItem]]:
+        """Return (item_id, item) pairs for every item."""
+        return iter(self._active_items.items())
+
+    def occurrences_between(
+        self, is_alarm: bool, start: datetime, end: datetime
+    ) -> List[Tuple[datetime, AlarmReminderItem]]:
+        """Return the upcoming rings of a type in [start, end), earliest first.
+
+        Repeating items are expanded from their next scheduled time.
+        Stopped items and items in error do not ring.
+        """
+        occurrences = []
+        for item_id in self._times.between(is_alarm, start, end):
+            item = self._active_items[item_id]
+            if item.status in LIVE_STATUSES:
+                occurrences.append((item.scheduled_time, item))
+
+        for item_id in self._times.before(is_alarm, end):
+            item = self._active_items[item_id]
+            if item.status not in LIVE_STATUSES:
+                continue
+            first = item.scheduled_time
+            if first >= start:
+                occurrences.append((first, item))
+            recurrence = self._recurrences.get(item_id)
+            if recurrence is not None:
+                occurrences.extend(
+                    (occurrence, item)
+                    for occurrence in recurrence.between(max(start, first), end)
+                    if occurrence > first
+                )
+
+        occurrences.sort(key=lambda occurrence: occurrence[0])
+        return occurrences
+
+    def next_occurrence(
+        self, is_alarm: bool, start: datetime
+    ) -> Optional[Tuple[datetime, AlarmReminderItem]]:
+        """Return the first upcoming ring of a type at or after start."""
+        # A repeating item's scheduled time is already its next occurrence
+        candidates = []
+        for repeating in (False, True):
+            for item_id in self._times.iter_from(is_alarm, start, repeating):
+                item = self._active_items[item_id]
+                if item.status in LIVE_STATUSES:
+                    candidates.append((item.scheduled_time, item))
+                    break
+        return min(candidates, key=lambda occurrence: occurrence[0], default=None)
+
+    def list_items(
+        self,
+        is_alarm: Optional[bool] = None,
+        statuses: Optional[Iterable[str]] = None,
+        target: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return one page of items in scheduled time order.
+
+        Items are filtered by type, status, the satellite or media player
+        they ring on and a [start, end) window on their scheduled time. Pass
+        the returned next_cursor back to get the following page.
+
+        Raises InvalidCursorError when the cursor cannot be decoded.
+        """
+        types = (True, False) if is_alarm is None else (is_alarm,)
+        statuses = set(statuses) if statuses else None
+        after = (start.timestamp(),) if start is not None else (float("-inf"),)
+        if cursor:
+            after = max(after, _decode_cursor(cursor))
+        end_ts = end.timestamp() if end is not None else float("inf")
+
+        if target is not None:
+            # Target buckets are small; sort just those
+            entries = sorted(
+                (self._active_items[item_id].scheduled_time.timestamp(), item_id)
+                for item_id in self._index.ids_for_target(target)
+                if self._active_items[item_id].is_alarm in types
+            )
+            entries = entries[bisect_right(entries, after):]
+        else:
+            entries = heapq.merge(*(
+                self._times.iter_entries(item_type, repeating, after)
+                for item_type in types
+                for repeating in (False, True)
+            ))
+
+        page = []
+        last_entry = None
+        next_cursor = None
+        for entry in entries:
+            if entry[0] >= end_ts:
+                break
+            item = self._active_items[entry[1]]
+            if statuses is not None and item.status not in statuses:
+                continue
+            if len(page) == limit:
+                next_cursor = f"{last_entry[0]!r}|{last_entry[1]}"
+                break
+            page.append(item)
+            last_entry = entry
+
+        return {
+            "items": [
+                {
+                    "item_id": item.item_id,
+                    "entity_id": f"{DOMAIN}.{item.item_id}",
+                    "name": item.name,
+                    "type": "alarm" if item.is_alarm else "reminder",
+                    "status": item.status.value,
+                    "scheduled_time": item.scheduled_time.isoformat(),
+                    "message": item.message,
+                    "satellite": item.satellite,
+                    "media_players": list(item.media_players),
+                    "repeat": item.repeat.value,
+                    "rrule": item.rrule,
+                }
+                for item in page
+            ],
+            "next_cursor": next_cursor,
+        }
+
+    def _rebuild_indexes(self) -> None:
+        """Index every item from scratch."""
+        self._index.rebuild(self._active_items)
+        self._times.rebuild(self._active_items)
+
+    @callback
+    def _async_reindex(self, *item_ids: str) -> None:
+        """Update the indexes for added, changed or removed items."""
+        for item_id in item_ids:
+            item = self._active_items.get(item_id)
+            if item is None:
+                self._index.remove(item_id)
+                self._times.remove(item_id)
+            else:
+                self._index.update(item_id, item)
+                self._times.update(item_id, item)
+
+    @staticmethod
+    def _update_fields(item: AlarmReminderItem, changes: dict, fields) -> None:
+        """Copy edited fields onto an item."""
+        for field in fields:
+            if field not in changes:
+                continue
+            if field == "media_player":
+                item.media_players = [changes[field]]
+            else:
+                setattr(item, field, changes[field])
+
+    def _compile_recurrence(self, item_id: str) -> None:
+        """Compile and cache the repeat rule of an item."""
+        item = self._active_items[item_id]
+        recurrence = compile_recurrence(
+            item.repeat,
+            item.repeat_days,
+            item.scheduled_time,
+            item.rrule,
+        )
+        if recurrence is None:
+            self._recurrences.pop(item_id, None)
+        else:
+            self._recurrences[item_id] = recurrence
+
+    def _snap_to_recurrence(self, item_id: str) -> None:
+        """Move an item's scheduled time to the first occurrence its rule allows."""
+        recurrence = self._recurrences.get(item_id)
+        if recurrence is None:
+            return
+        item = self._active_items[item_id]
+        first_time = recurrence.next_after(item.scheduled_time, inclusive=True)
+        if first_time is not None:
+            item.scheduled_time = first_time
+
+    def _calculate_next_occurrence(self, item_id: str, after: datetime) -> Optional[datetime]:
+        """Return the next occurrence of a repeating item after a moment."""
+        recurrence = self._recurrences.get(item_id)
+        if recurrence is None:
+            return None
+        return recurrence.next_after(after)
+
+    @callback
+    def _async_rearm_recurring(self, item_id: str) -> bool:
+        """Schedule the next occurrence of a repeating item."""
+        item = self._active_items.get(item_id)
+        if item is None:
+            return False
+        new_time = self._calculate_next_occurrence(
+            item_id, max(dt_util.now(), item.scheduled_time)
+        )
+        if new_time is None:
+            return False
+
+        item.scheduled_time = new_time
+        item.status = ItemStatus.SCHEDULED
+        self.scheduler.schedule(item_id, new_time)
+        _LOGGER.debug("Re-armed repeating item %s for %s", item_id, new_time)
+        return True
+
+    @callback
+    def _async_fire_item(self, item_id: str) -> None:
+        """Start the trigger task for an item whose scheduled time has come."""
+        task = self.hass.async_create_task(
+            self._trigger_item(item_id),
+            name=f"trigger_{item_id}"
+        )
+        self._trigger_tasks[item_id] = task
+
+        @callback
+        def _task_done(done_task: asyncio.Task) -> None:
+            if self._trigger_tasks.get(item_id) is done_task:
+                del self._trigger_tasks[item_id]
+
+        task.add_done_callback(_task_done)
+
+    async def _async_cancel_item(self, item_id: str) -> None:
+        """Cancel the pending trigger and any running playback for an item."""
+        self.scheduler.cancel(item_id)
+
+        stop_event = self._stop_events.pop(item_id, None)
+        if stop_event is not None:
+            stop_event.set()
+            stopped = self._playback_stopped.get(item_id)
+            if stopped is not None:
+                try:
+                    await asyncio.wait_for(asyncio.shield(stopped), STOP_ACK_TIMEOUT)
+                except asyncio.TimeoutError:
+                    _LOGGER.warning("Playback for %s did not stop within %ss", item_id, STOP_ACK_TIMEOUT)
+
+        task = self._trigger_tasks.pop(item_id, None)
+        if task is not None and not task.done():
+            task.cancel()
+            _LOGGER.debug("Cancelled running trigger for %s", item_id)
+
+    async def _async_cancel_items(self, item_ids: Iterable[str]) -> None:
+        """Cancel several items, waiting for their playback to stop concurrently."""
+        await asyncio.gather(*(self._async_cancel_item(item_id) for item_id in item_ids))
+
+    async def async_stop_items(self, item_ids: Iterable[str]) -> List[str]:
+        """Stop a batch of items with one save and one sensor update.
+
+        Returns the ids that were actually stopped.
+        """
+        stopped_ids = [
+            item_id for item_id in item_ids
+            if item_id in self._active_items
+            and self._active_items[item_id].status in (ItemStatus.ACTIVE, ItemStatus.SCHEDULED)
+        ]
+        if not stopped_ids:
+            return stopped_ids
+
+        was_active = {
+            item_id for item_id in stopped_ids
+            if self._active_items[item_id].status == ItemStatus.ACTIVE
+        }
+        await self._async_cancel_items(stopped_ids)
+
+        now = dt_util.now().isoformat()
+        for item_id in stopped_ids:
+            item = self._active_items[item_id]
+            # Repeating items that were ringing move on to their next occurrence
+            if not (item_id in was_active and self._async_rearm_recurring(item_id)):
+                item.status = ItemStatus.STOPPED
+            item.last_stopped = now
+
+        self._async_schedule_save(*stopped_ids)
+        self._async_publish(*stopped_ids)
+        return stopped_ids
+
+    async def async_delete_items(self, item_ids: Iterable[str]) -> List[str]:
+        """Delete a batch of items with one save and one sensor update.
+
+        Returns the ids that were actually deleted.
+        """
+        deleted_ids = [item_id for item_id in item_ids if item_id in self._active_items]
+        if not deleted_ids:
+            return deleted_ids
+
+        await self._async_cancel_items(deleted_ids)
+
+        for item_id in deleted_ids:
+            self._active_items.pop(item_id)
+            self._ids.release(item_id)
+            self._recurrences.pop(item_id, None)
+
+        self._async_save_ids()
+        self._async_schedule_save(*deleted_ids)
+        self._async_publish(*deleted_ids)
+        return deleted_ids
+
+    @callback
+    def _async_publish(self, *item_ids: str) -> None:
+        """Publish the states of changed or removed items on the next flush."""
+        self.publisher.async_mark(*item_ids)
+
+    @callback
+    def _async_schedule_save(self, *item_ids: str) -> None:
+        """Index and persist changed items once the storage quiet window has passed."""
+        self._async_reindex(*item_ids)
+        self.storage.async_delay_save(lambda: self._active_items, item_ids)
+
+    @property
+    def registry_counts(self) -> Dict[str, int]:
+        """Return sizes of the per-item trigger registries."""
+        return {
+            "pending_triggers": len(self.scheduler),
+            "trigger_tasks": len(self._trigger_tasks),
+            "stop_events": len(self._stop_events),
+            "playback_sessions": len(self._playback_stopped),
+        }
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Cancel all pending triggers and running playback."""
+        self.scheduler.async_stop()
+        for stop_event in self._stop_events.values():
+            stop_event.set()
+        for task in self._trigger_tasks.values():
+            task.cancel()
+        self._trigger_tasks.clear()
+        for stopped in self._playback_stopped.values():
+            signal_stopped(stopped)
+        self._playback_stopped.clear()
+        self.publisher.async_flush()
+
+    def _new_item(self, data: dict, is_alarm: bool, target: dict, now: datetime) -> AlarmReminderItem:
+        """Create and add an item from set_alarm/set_reminder data.
+
+        Raises ValueError when the item cannot be scheduled, leaving nothing behind.
+        """
+        # Handle item naming with proper ID generation
+        provided_name = (data.get("name") or "").strip()
+        safe_name = re.sub(r'[^a-z0-9_]', '_', provided_name.lower())
+        if not is_alarm:
+            # For reminders: name is required and used directly as the ID
+            if not provided_name:
+                raise ValueError("Name is required for reminders")
+            if safe_name in self._active_items:
+                raise ValueError(f"A reminder with name '{provided_name}' already exists")
+
+        time_input = data.get("time")
+        date_input = data.get("date")
+        rrule_text = data.get("rrule")
+
+        # Convert time input to datetime
+        if isinstance(time_input, str):
+            parsed = dt_util.parse_time(time_input)
+            if parsed is None:
+                raise ValueError(f"Invalid time format: {time_input}")
+            time_input = parsed
+
+        if date_input:
+            scheduled_time = dt_util.as_local(datetime.combine(date_input, time_input))
+        else:
+            scheduled_time = dt_util.as_local(datetime.combine(now.date(), time_input))
+            if scheduled_time < now:
+                scheduled_time = scheduled_time + timedelta(days=1)
+
+        if scheduled_time < now:
+            raise ValueError(f"Scheduled time {scheduled_time} is in the past")
+
+        if rrule_text:
+            rrule_text = bound_rrule_text(rrule_text, scheduled_time)
+
+        if is_alarm:
+            # For alarms: generate ID if no name provided, else keep it unique
+            item_id = self._ids.allocate(safe_name if provided_name else "alarm", self._active_items)
+        else:
+            item_id = safe_name
+
+        # Create item data with all necessary fields
+        item = AlarmReminderItem(
+            item_id=item_id,
+            name=provided_name or item_id,
+            is_alarm=is_alarm,
+            scheduled_time=scheduled_time,
+            satellite=target.get("satellite"),
+            media_players=list(target.get("media_players", [])),
+            message=data.get("message", ""),
+            repeat=Repeat(data.get("repeat", "once")),
+            repeat_days=list(data.get("repeat_days", [])),
+            rrule=rrule_text,
+            # Get sound file from the data or use default
+            sound_file=data.get(
+                "sound_file",
+                self.media_handler.alarm_sound if is_alarm else self.media_handler.reminder_sound
+            ),
+        )
+
+        self._active_items[item_id] = item
+        self._compile_recurrence(item_id)
+        recurrence = self._recurrences.get(item_id)
+        if recurrence is not None:
+            # Start on the first occurrence the rule allows
+            first_time = recurrence.next_after(scheduled_time, inclusive=True)
+            if first_time is None:
+                del self._active_items[item_id]
+                self._recurrences.pop(item_id, None)
+                if is_alarm:
+                    self._ids.release(item_id)
+                raise ValueError(
+                    f"Repeat rule {rrule_text} has no occurrences after {scheduled_time}"
+                )
+            item.scheduled_time = first_time
+        return item
+
     async def schedule_item(self, call: ServiceCall, is_alarm: bool, target: dict) -> None:
         """Schedule an alarm or reminder."""
         try:
             _LOGGER.debug("Scheduling %s with data: %s", 
                          "alarm" if is_alarm else "reminder", 
                          call.data)
-            
-            # Handle item naming with proper ID generation
-            provided_name = call.data.get("name", "").strip()
-            
-            if is_alarm:
-                # For alarms: generate ID if no name provided
-                if not provided_name:
-                    item_name = self._get_next_available_id("alarm")
-                    display_name = item_name
-                else:
-                    # Use provided name but ensure unique ID
-                    safe_name = re.sub(r'[^a-z0-9_]', '_', provided_name.lower())
-                    item_name = self._get_next_available_id(safe_name)
-                    display_name = provided_name
-            else:
-                # For reminders: name is required
-                if not provided_name:
-                    _LOGGER.error("Name is required for reminders")
-                    return
-                # Use provided name directly for reminders
-                safe_name = re.sub(r'[^a-z0-9_]', '_', provided_name.lower())
-                item_name = safe_name
-                display_name = provided_name
-                # Check if reminder name already exists
-                if item_name in self._active_items:
-                    _LOGGER.error("A reminder with name '%s' already exists", provided_name)
-                    return
-
-            time_input = call.data.get("time")
-            date_input = call.data.get("date")
-            message = call.data.get("message", "")
-            repeat = call.data.get("repeat", "once")
-            repeat_days = call.data.get("repeat_days", [])
-
-            # Convert time input to datetime
-            now = dt_util.now()
-            if isinstance(time_input, str):
-                try:
-                    hour, minute = map(int, time_input.split(':'))
-                    time_input = datetime.time(hour, minute)
-                except ValueError as err:
-                    _LOGGER.error("Invalid time format: %s", err)
-                    return
 
-            if date_input:
-                scheduled_time = datetime.combine(date_input, time_input)
-                scheduled_time = dt_util.as_local(scheduled_time)
-            else:
-                scheduled_time = datetime.combine(now.date(), time_input)
-                scheduled_time = dt_util.as_local(scheduled_time)
-                if scheduled_time < now:
-                    scheduled_time = scheduled_time + timedelta(days=1)
-
-            delay = (scheduled_time - now).total_seconds()
-            if delay < 0:
-                _LOGGER.warning("Scheduled time %s is in the past. Ignoring request.", scheduled_time)
+            try:
+                item_data = self._new_item(call.data, is_alarm, target, dt_util.now())
+            except ValueError as err:
+                _LOGGER.error("Cannot schedule %s: %s", "alarm" if is_alarm else "reminder", err)
                 return
+            item_name = item_data.item_id
+            if is_alarm:
+                self._async_save_ids()
 
-            # Create entity_id and store item
-            entity_id = f"{DOMAIN}.{item_name}"
-            
             # Create stop event
             self._stop_events[item_name] = asyncio.Event()
             
-            # Get sound file from service call or use default
-            sound_file = call.data.get(
-                "sound_file", 
-                self.media_handler.alarm_sound if is_alarm else self.media_handler.reminder_sound
-            )
-
-            # Create item data with all necessary fields
-            item_data = {
-                "scheduled_time": scheduled_time,
-                "satellite": target.get("satellite"),
-                "media_players": target.get("media_players", []),
-                "message": message,
-                "is_alarm": is_alarm,
-                "repeat": repeat,
-                "repeat_days": repeat_days,
-                "status": "scheduled",
-                "name": display_name,
-                "entity_id": item_name,
-                "unique_id": item_name,
-                "sound_file": sound_file  
-            }
-            
-            # Store in active items and save to storage
-            self._active_items[item_name] = item_data
-            await self.storage.async_save(self._active_items)
-            
-            # Create and register entity state with datetime conversion
-            state_data = dict(item_data)
-            state_data["scheduled_time"] = item_data["scheduled_time"].isoformat()
-            self.hass.states.async_set(entity_id, "scheduled", state_data)
-            
-            # Create entity object
-            entity = AlarmReminderEntity(self.hass, item_name, item_data)
+            # Save to storage
+            self._async_schedule_save(item_name)
             
-            # Store in HA registry using the new method
-            entity_registry = er.async_get(self.hass)
-            entity_registry.async_get_or_create(
-                domain=DOMAIN,
-                platform="alarms_and_reminders",
-                unique_id=item_name,
-                suggested_object_id=item_name,
-                original_name=display_name
-            )
+            # Publish entity state
+            self._async_publish(item_name)
 
             _LOGGER.debug("Created item %s with data: %s", item_name, item_data)
             _LOGGER.debug("Active items after creation: %s", self._active_items)
 
             # Schedule the action
-            self.hass.loop.call_later(
-                delay,
-                lambda: self.hass.async_create_task(self._trigger_item(item_name))
-            )
+            self.scheduler.schedule(item_name, item_data.scheduled_time)
 
             return item_name
 
@@ -258,65 +619,114 @@ class AlarmAndReminderCoordinator:
             _LOGGER.error("Error scheduling: %s", err, exc_info=True)
             raise
 
+    @callback
+    def async_schedule_items(self, specs: Iterable[tuple]) -> List[Dict[str, Any]]:
+        """Schedule many items with one save, one scheduler pass and one sensor update.
+
+        Each spec is an (is_alarm, data, target) tuple with set_alarm or
+        set_reminder data. Returns one result per spec, holding either the
+        new item_id and scheduled_time or the error that stopped it.
+        """
+        now = dt_util.now()
+        results = []
+        created = []
+        for is_alarm, data, target in specs:
+            try:
+                item = self._new_item(data, is_alarm, target, now)
+            except ValueError as err:
+                results.append({"error": str(err)})
+                continue
+            created.append(item)
+            results.append({
+                "item_id": item.item_id,
+                "scheduled_time": item.scheduled_time.isoformat(),
+            })
+
+        if not created:
+            return results
+
+        item_ids = [item.item_id for item in created]
+        self._async_save_ids()
+        self._async_schedule_save(*item_ids)
+        self._async_publish(*item_ids)
+        self.scheduler.schedule_many((item.item_id, item.scheduled_time) for item in created)
+        _LOGGER.info("Scheduled %d of %d items", len(created), len(results))
+        return results
+
     async def _trigger_item(self, item_id: str) -> None:
         """Trigger the scheduled item."""
         if item_id not in self._active_items:
             return
 
+        stopped = self.hass.loop.create_future()
+        self._playback_stopped[item_id] = stopped
         try:
             item = self._active_items[item_id]
             
             # Set status to active first
-            item["status"] = "active"
+            item.status = ItemStatus.ACTIVE
             self._active_items[item_id] = item
+            self._async_reindex(item_id)
             
-            # Update entity state immediately
-            self.hass.states.async_set(
-                f"{DOMAIN}.{item_id}",
-                "active",
-                item
-            )
+            # Update entity state
+            self._async_publish(item_id)
             
             # Create new stop event
             stop_event = asyncio.Event()
             self._stop_events[item_id] = stop_event
 
             # Send notification if configured
-            if item.get("notify_device"):
-                _LOGGER.debug("Sending notification to device: %s", item["notify_device"])
+            if item.notify_device:
+                _LOGGER.debug("Sending notification to device: %s", item.notify_device)
                 await self._send_notification(item_id, item)
 
             # Start playback based on target type
-            if item["satellite"]:
-                await self._satellite_playback_loop(item, stop_event)
-            elif item["media_players"]:
-                await self._media_player_playback_loop(item, stop_event)
+            if item.satellite:
+                await self._satellite_playback_loop(item, stop_event, stopped)
+            elif item.media_players:
+                await self._media_player_playback_loop(item, stop_event, stopped)
 
         except Exception as err:
             _LOGGER.error("Error triggering item %s: %s", item_id, err)
-            item["status"] = "error"
-            self.hass.states.async_set(f"{DOMAIN}.{item_id}", "error", item)
-
-    async def _send_notification(self, item_id: str, item: dict) -> None:
+            item.status = ItemStatus.ERROR
+            self._async_reindex(item_id)
+            self._async_publish(item_id)
+            return
+        finally:
+            signal_stopped(stopped)
+            if self._playback_stopped.get(item_id) is stopped:
+                del self._playback_stopped[item_id]
+
+        # Playback finished without being stopped; move repeating items on
+        if (
+            self._active_items.get(item_id) is item
+            and not stop_event.is_set()
+            and item.status == ItemStatus.ACTIVE
+            and self._async_rearm_recurring(item_id)
+        ):
+            self._async_schedule_save(item_id)
+            self._async_publish(item_id)
+
+    async def _send_notification(self, item_id: str, item: AlarmReminderItem) -> None:
         """Send notification with action buttons."""
         try:
-            device_id = item.get("notify_device")
+            device_id = item.notify_device
             if not device_id:
                 return
 
             # Format the message
-            message = item.get("message") or f"It's {dt_util.now().strftime('%I:%M %p')}"
+            message = item.message or f"It's {dt_util.now().strftime('%I:%M %p')}"
             
             notification_data = {
                 "message": message,
-                "title": f"{item.get('name', 'Alarm & Reminder')} - {item['status'].title()}",
+                "title": f"{item.name} - {item.status.title()}",
                 "data": {
                     "tag": item_id,
                     "group": "alarms_and_reminders",
                     "color": "#ff9800",
                     "sticky": "true",
                     "importance": "high",
-                    "notification_icon": "mdi:alarm-bell" if item["is_alarm"] else "mdi:reminder",
+                    "notification_icon": "mdi:alarm-bell" if item.is_alarm else "mdi:reminder",
                     "channel": "Alarms and Reminders",
                     "actions": [
                         {
@@ -356,16 +766,16 @@ class AlarmAndReminderCoordinator:
                 if event.data.get("tag") == item_id:
                     action = event.data.get("action")
                     if action == "stop":
-                        self.hass.async_create_task(self.stop_item(item_id, item["is_alarm"]))
+                        self.hass.async_create_task(self.stop_item(item_id, item.is_alarm))
                     elif action == "snooze":
-                        self.hass.async_create_task(self.snooze_item(item_id, 5, item["is_alarm"]))
+                        self.hass.async_create_task(self.snooze_item(item_id, 5, item.is_alarm))
 
             # Listen for notification actions
             self.hass.bus.async_listen_once("mobile_app_notification_action", handle_action)
         except Exception as err:
             _LOGGER.error("Error sending notification for item %s: %s", item_id, err, exc_info=True)
 
-    async def _handle_notification_action(self, event, item_id: str, item: dict) -> None:
+    async def _handle_notification_action(self, event, item_id: str, item: AlarmReminderItem) -> None:
         """Handle notification action button presses."""
         try:
             if event.data.get("tag") != item_id:
@@ -373,32 +783,33 @@ class AlarmAndReminderCoordinator:
 
             action = event.data.get("action")
             if action == "STOP":
-                await self.stop_item(item_id, item["is_alarm"])
+                await self.stop_item(item_id, item.is_alarm)
             elif action == "SNOOZE":
-                await self.snooze_item(item_id, 5, item["is_alarm"])
+                await self.snooze_item(item_id, 5, item.is_alarm)
 
         except Exception as err:
             _LOGGER.error("Error handling notification action: %s", err)
 
-    async def _satellite_playback_loop(self, item: dict, stop_event: asyncio.Event) -> None:
+    async def _satellite_playback_loop(self, item: AlarmReminderItem, stop_event: asyncio.Event,
+                                       stopped: Optional[asyncio.Future] = None) -> None:
         """Handle satellite playback loop."""
         try:
             # Use item's custom sound file or fall back to default
-            sound_file = item.get(
-                "sound_file",
-                self.media_handler.alarm_sound if item["is_alarm"] else self.media_handler.reminder_sound
+            sound_file = item.sound_file or (
+                self.media_handler.alarm_sound if item.is_alarm else self.media_handler.reminder_sound
             )
             
             # Check if item is still active before starting playback
-            item_id = item["entity_id"]
-            if item_id in self._active_items and self._active_items[item_id]["status"] == "active":
+            item_id = item.item_id
+            if item_id in self._active_items and self._active_items[item_id].status == ItemStatus.ACTIVE:
                 await self.announcer.announce_on_satellite(
-                    satellite=item["satellite"],
-                    message=item["message"],
+                    satellite=item.satellite,
+                    message=item.message,
                     sound_file=sound_file,
                     stop_event=stop_event,
-                    name=item["name"], # Use the genrated/provided name
-                    is_alarm=item["is_alarm"]
+                    name=item.name, # Use the genrated/provided name
+                    is_alarm=item.is_alarm,
+                    stopped=stopped
                 )
             else:
                 _LOGGER.debug("Item %s is no longer active, stopping playback", item_id)
@@ -407,56 +818,64 @@ class AlarmAndReminderCoordinator:
 
         except Exception as err:
             _LOGGER.error("Error in satellite playback loop: %s", err)
-            item["status"] = "error"
+            item.status = ItemStatus.ERROR
+            self._async_reindex(item.item_id)
 
-    async def _media_player_playback_loop(self, item: dict, stop_event: asyncio.Event) -> None:
+    async def _media_player_playback_loop(self, item: AlarmReminderItem, stop_event: asyncio.Event,
+                                          stopped: Optional[asyncio.Future] = None) -> None:
         """Handle media player playback loop."""
-        item_id = item["entity_id"]
+        try:
+            await self._media_player_playback(item, stop_event)
+        finally:
+            signal_stopped(stopped)
+
+    async def _media_player_playback(self, item: AlarmReminderItem, stop_event: asyncio.Event) -> None:
+        """Play an item on its media players until it is stopped."""
+        item_id = item.item_id
         
         while not stop_event.is_set():
             try:
                 # Check if item is still active
-                if item_id not in self._active_items or self._active_items[item_id]["status"] != "active":
+                if item_id not in self._active_items or self._active_items[item_id].status != ItemStatus.ACTIVE:
                     _LOGGER.debug("Item %s is no longer active, stopping playback loop", item_id)
                     stop_event.set()
                     break
 
-                for media_player in item["media_players"]:
+                for media_player in item.media_players:
                     # Wait for media player to be idle
                     while not await self._is_media_player_idle(media_player):
                         # Check status again while waiting
                         if (item_id not in self._active_items or 
-                            self._active_items[item_id]["status"] != "active"):
+                            self._active_items[item_id].status != ItemStatus.ACTIVE):
                             stop_event.set()
                             return
-                        await asyncio.sleep(1)
+                        if await wait_for_stop(stop_event, 1):
+                            return
 
                     # Format message with current time
                     current_time = self._format_time()
-                    message = f"It's {current_time}. {item['message']}" if item['message'] else f"It's {current_time}"
+                    message = f"It's {current_time}. {item.message}" if item.message else f"It's {current_time}"
 
                     # Use media handler to play on media player
                     await self.media_handler.play_on_media_player(
                         media_player,
                         message,
-                        item["is_alarm"]
+                        item.is_alarm
                     )
 
                 # Wait for completion or stop event
-                try:
-                    await asyncio.wait_for(stop_event.wait(), timeout=60)
+                if await wait_for_stop(stop_event, 60):
+                    break
+                # Check status before continuing
+                if (item_id not in self._active_items or 
+                    self._active_items[item_id].status != ItemStatus.ACTIVE):
+                    stop_event.set()
                     break
-                except asyncio.TimeoutError:
-                    # Check status before continuing
-                    if (item_id not in self._active_items or 
-                        self._active_items[item_id]["status"] != "active"):
-                        stop_event.set()
-                        break
-                    continue
 
             except Exception as err:
                 _LOGGER.error("Error in media player playback loop: %s", err)
-                await asyncio.sleep(5)
+                if await wait_for_stop(stop_event, 5):
+                    break
 
     async def _is_satellite_idle(self, satellite: str) -> bool:
         """Check if satellite is idle."""
@@ -475,26 +894,6 @@ class AlarmAndReminderCoordinator:
         time_format = self.hass.config.time_zone.endswith('12h')
         return now.strftime("%I:%M %p") if time_format else now.strftime("%H:%M")
 
-    async def delete_item(self, item_id: str) -> None:
-        """Delete an alarm/reminder."""
-        if item_id in self._active_items:
-            # Stop if active
-            if item_id in self._stop_events:
-                self._stop_events[item_id].set()
-                del self._stop_events[item_id]
-            
-            # Remove from active items
-            del self._active_items[item_id]
-            
-            # Remove entity
-            self.hass.states.async_remove(f"{DOMAIN}.{item_id}")
-            
-            # Remove from storage
-            await self.storage.async_delete_item(item_id)
-            
-            # Update sensors
-            self.hass.bus.async_fire(f"{DOMAIN}_state_changed")
-
     async def stop_item(self, item_id: str, is_alarm: bool) -> None:
         """Stop an active or scheduled item."""
         try:
@@ -502,10 +901,7 @@ class AlarmAndReminderCoordinator:
             if item_id.startswith(f"{DOMAIN}."):
                 item_id = item_id.split(".")[-1]
 
-            _LOGGER.debug("Stop request for %s. Current active items: %s", 
-                         item_id, 
-                         {k: {'name': v.get('name'), 'status': v.get('status')} 
-                          for k, v in self._active_items.items()})
+            _LOGGER.debug("Stop request for %s", item_id)
 
             # Try to find the item in active items or storage
             item = None
@@ -513,52 +909,38 @@ class AlarmAndReminderCoordinator:
                 item = self._active_items[item_id]
             else:
                 # Try to find in storage
-                stored_items = await self.storage.async_load()
-                if item_id in stored_items:
-                    item = stored_items[item_id]
+                item = self.storage.get_item(item_id)
+                if item is not None:
                     self._active_items[item_id] = item
                     _LOGGER.debug("Restored item %s from storage", item_id)
 
             if item:
                 # Verify item type matches
-                if item["is_alarm"] != is_alarm:
+                if item.is_alarm != is_alarm:
                     _LOGGER.warning(
                         "Attempted to stop %s with wrong service: %s", 
-                        "alarm" if item["is_alarm"] else "reminder",
+                        "alarm" if item.is_alarm else "reminder",
                         item_id
                     )
                     return
 
-                # Stop any active playback
-                if item_id in self._stop_events:
-                    self._stop_events[item_id].set()
-                    await asyncio.sleep(0.1)
-                    self._stop_events.pop(item_id)
-
-                # Cancel any scheduled triggers
-                for task in asyncio.all_tasks():
-                    if task.get_name() == f"trigger_{item_id}":
-                        task.cancel()
-                        _LOGGER.debug("Cancelled scheduled trigger for %s", item_id)
-                        break
-
-                # Update item status
-                item["status"] = "stopped"
-                item["last_stopped"] = dt_util.now().isoformat()
+                was_active = item.status == ItemStatus.ACTIVE
+
+                # Cancel any scheduled trigger and stop active playback
+                await self._async_cancel_item(item_id)
+
+                # Update item status; repeating items that were ringing move
+                # on to their next occurrence
+                if not (was_active and self._async_rearm_recurring(item_id)):
+                    item.status = ItemStatus.STOPPED
+                item.last_stopped = dt_util.now().isoformat()
                 self._active_items[item_id] = item
 
                 # Save to storage
-                await self.storage.async_save(self._active_items)
+                self._async_schedule_save(item_id)
                 
-                # Update entity state
-                self.hass.states.async_set(
-                    f"{DOMAIN}.{item_id}",
-                    "stopped",
-                    item
-                )
-
-                # Force update of sensors
-                self.hass.bus.async_fire(f"{DOMAIN}_state_changed")
+                # Update entity state and sensors
+                self._async_publish(item_id)
 
                 _LOGGER.info(
                     "Successfully stopped %s: %s", 
@@ -590,7 +972,7 @@ class AlarmAndReminderCoordinator:
             item = self._active_items[item_id]
             
             # Verify item type matches
-            if item["is_alarm"] != is_alarm:
+            if item.is_alarm != is_alarm:
                 _LOGGER.error(
                     "Cannot snooze %s as %s",
                     "alarm" if is_alarm else "reminder",
@@ -598,14 +980,12 @@ class AlarmAndReminderCoordinator:
                 )
                 return
 
-            # Step 1: Stop the item using stop_item method
+            # Step 1: Stop the item using stop_item method; this returns once
+            # playback has acknowledged the stop
             await self.stop_item(item_id, is_alarm)
             
-            # Wait for stop to complete and verify status
-            await asyncio.sleep(1)  # Give time for stop to complete
-            
-            # Verify item is stopped
-            if item_id in self._active_items and self._active_items[item_id]["status"] != "stopped":
+            # Verify item is no longer ringing
+            if item_id in self._active_items and self._active_items[item_id].status == ItemStatus.ACTIVE:
                 _LOGGER.error("Failed to stop item %s before snoozing", item_id)
                 return
 
@@ -616,34 +996,21 @@ class AlarmAndReminderCoordinator:
             
             # Step 3: Update item data for rescheduling
             item = self._active_items[item_id]  # Get fresh item data
-            item["scheduled_time"] = new_time
-            item["status"] = "scheduled"
-            if "last_stopped" in item:
-                item["last_rescheduled_from"] = item["last_stopped"]
-            item["last_stopped"] = now.isoformat()
+            item.scheduled_time = new_time
+            item.status = ItemStatus.SCHEDULED
+            if item.last_stopped is not None:
+                item.last_rescheduled_from = item.last_stopped
+            item.last_stopped = now.isoformat()
             
             # Step 4: Save to storage
             self._active_items[item_id] = item
-            await self.storage.async_save(self._active_items)
+            self._async_schedule_save(item_id)
             
             # Step 5: Update entity state
-            state_data = dict(item)
-            state_data["scheduled_time"] = item["scheduled_time"].isoformat()
-            self.hass.states.async_set(
-                f"{DOMAIN}.{item_id}",
-                "scheduled",
-                state_data
-            )
+            self._async_publish(item_id)
 
             # Step 6: Schedule new trigger
-            delay = (new_time - now).total_seconds()
-            self.hass.loop.call_later(
-                delay,
-                lambda: self.hass.async_create_task(
-                    self._trigger_item(item_id),
-                    name=f"trigger_{item_id}"
-                )
-            )
+            self.scheduler.schedule(item_id, new_time)
 
             _LOGGER.info(
                 "Successfully snoozed %s %s for %d minutes. Will ring at %s",
@@ -659,34 +1026,17 @@ class AlarmAndReminderCoordinator:
     async def stop_all_items(self, is_alarm: bool = None) -> None:
         """Stop all active items. If is_alarm is None, stops both alarms and reminders."""
         try:
-            stopped_count = 0
-            for item_id, item in list(self._active_items.items()):  # Use list to avoid modification during iteration
-                if is_alarm is None or item["is_alarm"] == is_alarm:
-                    if item["status"] in ["active", "scheduled"]:
-                        # Stop the item
-                        if item_id in self._stop_events:
-                            self._stop_events[item_id].set()
-                            await asyncio.sleep(0.1)
-                            self._stop_events.pop(item_id)
-                        
-                        # Update item status
-                        item["status"] = "stopped"
-                        self._active_items[item_id] = item
-                        
-                        # Update entity state
-                        self.hass.states.async_set(
-                            f"{DOMAIN}.{item_id}",
-                            "stopped",
-                            item
-                        )
-                        stopped_count += 1
-
-            if stopped_count > 0:
-                # Force update of sensors
-                self.hass.bus.async_fire(f"{DOMAIN}_state_changed")
+            types = (True, False) if is_alarm is None else (is_alarm,)
+            stopped_ids = await self.async_stop_items([
+                item_id
+                for item_type in types
+                for item_id in self._index.ids(item_type, (ItemStatus.ACTIVE, ItemStatus.SCHEDULED))
+            ])
+
+            if stopped_ids:
                 _LOGGER.info(
                     "Successfully stopped %d %s", 
-                    stopped_count,
+                    len(stopped_ids),
                     "alarms" if is_alarm else "reminders" if is_alarm is not None else "items"
                 )
             else:
@@ -700,9 +1050,6 @@ class AlarmAndReminderCoordinator:
         try:
             _LOGGER.debug("Starting edit request for %s", item_id)
             _LOGGER.debug("Changes requested: %s", changes)
-            _LOGGER.debug("Current active items: %s", 
-                         {k: {'name': v.get('name'), 'status': v.get('status')} 
-                          for k, v in self._active_items.items()})
 
             # Remove domain prefix if present
             if item_id.startswith(f"{DOMAIN}."):
@@ -712,26 +1059,20 @@ class AlarmAndReminderCoordinator:
             found_id = None
             if item_id in self._active_items:
                 found_id = item_id
+            elif item_id.lower() in self._active_items:
+                found_id = item_id.lower()
             else:
                 # Try by name
-                name_to_find = item_id.replace("_", " ").lower()
-                for aid, item in self._active_items.items():
-                    if (item.get('name', '').lower() == name_to_find or 
-                        aid.lower() == name_to_find):
-                        found_id = aid
-                        break
+                found_id = self._index.find_by_name(item_id)
 
             if not found_id:
-                _LOGGER.error("Item %s not found in active items: %s", 
-                             item_id,
-                             [f"{k} ({v.get('name', '')}, {v.get('status', '')})" 
-                              for k, v in self._active_items.items()])
+                _LOGGER.error("Item %s not found in active items", item_id)
                 return
 
             item = self._active_items[found_id]
             
             # Verify item type matches
-            if item.get("is_alarm") != is_alarm:
+            if item.is_alarm != is_alarm:
                 _LOGGER.error(
                     "Cannot edit %s as %s", 
                     "alarm" if is_alarm else "reminder",
@@ -749,7 +1090,7 @@ class AlarmAndReminderCoordinator:
                 # Get current date or new date if provided
                 current_date = (
                     changes["date"] if "date" in changes 
-                    else item["scheduled_time"].date()
+                    else item.scheduled_time.date()
                 )
                 
                 # Create new scheduled time
@@ -761,28 +1102,25 @@ class AlarmAndReminderCoordinator:
                     if "date" not in changes:  # Only adjust if date wasn't explicitly set
                         new_time = new_time + timedelta(days=1)
                 
-                item["scheduled_time"] = new_time
+                item.scheduled_time = new_time
+                self._compile_recurrence(found_id)
+                self._snap_to_recurrence(found_id)
+
+                # Move the pending trigger to the new time
+                if item.status == ItemStatus.SCHEDULED:
+                    self.scheduler.schedule(found_id, item.scheduled_time)
 
             # Update other fields if provided
-            for field in ["name", "message", "satellite", "media_player"]:
-                if field in changes:
-                    item[field] = changes[field]
+            self._update_fields(item, changes, ("name", "message", "satellite", "media_player"))
 
             # Store updated item
             self._active_items[found_id] = item
             
             # Save to storage
-            await self.storage.async_save(self._active_items)
-
-            # Update entity state
-            self.hass.states.async_set(
-                f"{DOMAIN}.{found_id}",
-                "scheduled",
-                item
-            )
+            self._async_schedule_save(found_id)
 
-            # Force update of sensors
-            self.hass.bus.async_fire(f"{DOMAIN}_state_changed")
+            # Update entity state and sensors
+            self._async_publish(found_id)
 
             _LOGGER.info(
                 "Successfully edited %s: %s", 
@@ -807,7 +1145,7 @@ class AlarmAndReminderCoordinator:
             item = self._active_items[item_id]
             
             # Verify item type matches
-            if item["is_alarm"] != is_alarm:
+            if item.is_alarm != is_alarm:
                 _LOGGER.error(
                     "Cannot delete %s as %s", 
                     "alarm" if is_alarm else "reminder",
@@ -816,20 +1154,16 @@ class AlarmAndReminderCoordinator:
                 return
 
             # Stop if active
-            if item_id in self._stop_events:
-                self._stop_events[item_id].set()
-                await asyncio.sleep(0.1)
-                self._stop_events.pop(item_id)
+            await self._async_cancel_item(item_id)
 
-            # Remove from storage and active items
-            await self.storage.async_delete_item(item_id)
+            # Remove from active items and storage
             self._active_items.pop(item_id)
+            self._async_release_id(item_id)
+            self._recurrences.pop(item_id, None)
+            self._async_schedule_save(item_id)
 
-            # Remove entity
-            self.hass.states.async_remove(f"{DOMAIN}.{item_id}")
-
-            # Force update of sensors
-            self.hass.bus.async_fire(f"{DOMAIN}_state_changed")
+            # Remove entity and update sensors
+            self._async_publish(item_id)
 
             _LOGGER.info(
                 "Successfully deleted %s: %s",
@@ -843,31 +1177,15 @@ class AlarmAndReminderCoordinator:
     async def delete_all_items(self, is_alarm: bool = None) -> None:
         """Delete all items. If is_alarm is None, deletes both alarms and reminders."""
         try:
-            deleted_count = 0
-            for item_id in list(self._active_items.keys()):
-                item = self._active_items[item_id]
-                if is_alarm is None or item["is_alarm"] == is_alarm:
-                    # Stop if active
-                    if item_id in self._stop_events:
-                        self._stop_events[item_id].set()
-                        await asyncio.sleep(0.1)
-                        self._stop_events.pop(item_id)
-
-                    # Remove from storage and active items
-                    await self.storage.async_delete_item(item_id)
-                    self._active_items.pop(item_id)
-
-                    # Remove entity
-                    self.hass.states.async_remove(f"{DOMAIN}.{item_id}")
-                    
-                    deleted_count += 1
+            deleted_ids = await self.async_delete_items([
+                item_id for item_id, item in self._active_items.items()
+                if is_alarm is None or item.is_alarm == is_alarm
+            ])
 
-            if deleted_count > 0:
-                # Force update of sensors
-                self.hass.bus.async_fire(f"{DOMAIN}_state_changed")
+            if deleted_ids:
                 _LOGGER.info(
                     "Successfully deleted %d %s",
-                    deleted_count,
+                    len(deleted_ids),
                     "alarms" if is_alarm else "reminders" if is_alarm is not None else "items"
                 )
             else:
@@ -888,9 +1206,9 @@ class AlarmAndReminderCoordinator:
             
             if item_id not in self._active_items:
                 # Try to find item in storage
-                stored_items = await self.storage.async_load()
-                if item_id in stored_items:
-                    self._active_items[item_id] = stored_items[item_id]
+                stored_item = self.storage.get_item(item_id)
+                if stored_item is not None:
+                    self._active_items[item_id] = stored_item
                     _LOGGER.debug("Restored item %s from storage", item_id)
                 else:
                     _LOGGER.error("Item %s not found in storage or active items", item_id)
@@ -899,7 +1217,7 @@ class AlarmAndReminderCoordinator:
             item = self._active_items[item_id]
             
             # Verify item type matches
-            if item["is_alarm"] != is_alarm:
+            if item.is_alarm != is_alarm:
                 _LOGGER.error(
                     "Cannot reschedule %s as %s",
                     "alarm" if is_alarm else "reminder",
@@ -910,7 +1228,7 @@ class AlarmAndReminderCoordinator:
             # Calculate new scheduled time
             now = dt_util.now()
             if "time" in changes or "date" in changes:
-                time_input = changes.get("time", item["scheduled_time"].time())
+                time_input = changes.get("time", item.scheduled_time.time())
                 date_input = changes.get("date", now.date())
                 new_time = datetime.combine(date_input, time_input)
                 new_time = dt_util.as_local(new_time)
@@ -920,17 +1238,17 @@ class AlarmAndReminderCoordinator:
                     if "date" not in changes:  # Only adjust if date wasn't explicitly set
                         new_time = new_time + timedelta(days=1)
                 
-                item["scheduled_time"] = new_time
+                item.scheduled_time = new_time
+                self._compile_recurrence(item_id)
+                self._snap_to_recurrence(item_id)
 
             # Update other fields if provided
-            for field in ["message", "satellite", "media_player"]:
-                if field in changes:
-                    item[field] = changes[field]
+            self._update_fields(item, changes, ("message", "satellite", "media_player"))
 
             # Update status
-            item["status"] = "scheduled"
-            if "last_stopped" in item:
-                item["last_rescheduled_from"] = item["last_stopped"]
+            item.status = ItemStatus.SCHEDULED
+            if item.last_stopped is not None:
+                item.last_rescheduled_from = item.last_stopped
             
             # Create stop event if needed
             if item_id not in self._stop_events:
@@ -938,32 +1256,19 @@ class AlarmAndReminderCoordinator:
             
             # Save changes
             self._active_items[item_id] = item
-            await self.storage.async_save(self._active_items)
+            self._async_schedule_save(item_id)
             
-            # Update entity state
-            state_data = dict(item)
-            state_data["scheduled_time"] = item["scheduled_time"].isoformat()
-            self.hass.states.async_set(
-                f"{DOMAIN}.{item_id}",
-                "scheduled",
-                state_data
-            )
+            # Update entity state and sensors
+            self._async_publish(item_id)
 
-            # Schedule new trigger with task name
-            delay = (item["scheduled_time"] - now).total_seconds()
-            self.hass.loop.call_later(
-                delay,
-                lambda: self.hass.async_create_task(
-                    self._trigger_item(item_id),
-                    name=f"trigger_{item_id}"
-                )
-            )
+            # Schedule new trigger
+            self.scheduler.schedule(item_id, item.scheduled_time)
 
             _LOGGER.info(
                 "Successfully rescheduled %s %s for %s",
                 "alarm" if is_alarm else "reminder",
                 item_id,
-                item["scheduled_time"].strftime("%Y-%m-%d %H:%M:%S")
+                item.scheduled_time.strftime("%Y-%m-%d %H:%M:%S")
             )
 
         except Exception as err:
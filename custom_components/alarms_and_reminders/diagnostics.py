@@ -0,0 +1,21 @@
+"""Diagnostics support for Alarms and Reminders."""
+from typing import Any, Dict
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    next_fire_time = coordinator.scheduler.next_fire_time
+
+    return {
+        "items": len(coordinator._active_items),
+        "registry": coordinator.registry_counts,
+        "next_fire_time": next_fire_time.isoformat() if next_fire_time else None,
+    }
@@ -1,44 +1,77 @@
 """Entity definitions for Alarms and Reminders."""
-import voluptuous as vol  
+import logging
+from typing import Any, Dict
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.const import ATTR_NAME
-from homeassistant.helpers import entity_platform
+from homeassistant.helpers.entity_component import EntityComponent
 from .const import DOMAIN
+from .model import STATE_UNRECORDED_ATTRIBUTES, AlarmReminderItem
+
+_LOGGER = logging.getLogger(__name__)
+
+CONTROL_BUTTONS = [
+    {
+        "service": f"{DOMAIN}.stop",
+        "name": "Stop",
+        "icon": "mdi:stop"
+    },
+    {
+        "service": f"{DOMAIN}.snooze",
+        "name": "Snooze",
+        "icon": "mdi:snooze"
+    }
+]
+
+
+@callback
+def create_item_component(hass: HomeAssistant) -> EntityComponent:
+    """Create the component owning item entities and register their services."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component.async_register_entity_service("stop", {}, "async_stop")
+    component.async_register_entity_service(
+        "snooze",
+        {
+            vol.Optional("minutes", default=5): int,
+        },
+        "async_snooze"
+    )
+    component.async_register_entity_service("delete", {}, "async_delete")
+    return component
+
 
 class AlarmReminderEntity(Entity):
     """Representation of an Alarm or Reminder."""
 
-    def __init__(self, hass, item_id, data):
+    _unrecorded_attributes = STATE_UNRECORDED_ATTRIBUTES | {"control_buttons"}
+    _attr_should_poll = False
+
+    def __init__(self, data: AlarmReminderItem):
         """Initialize the entity."""
-        self.hass = hass
-        self.item_id = item_id
+        self.item_id = data.item_id
         self.data = data
-        self._attr_name = data.get("name", item_id)
-        self._attr_unique_id = item_id
-        self._attr_should_poll = False
-        
-    async def async_added_to_hass(self):
-        """Run when entity is added to registry."""
-        platform = entity_platform.async_get_current_platform()
-        
-        # Register entity services
-        platform.async_register_entity_service(
-            "stop",
-            {},
-            "async_stop"
-        )
-        
-        platform.async_register_entity_service(
-            "snooze",
-            {
-                vol.Optional("minutes", default=5): int,
-            },
-            "async_snooze"
-        )
+        self.entity_id = f"{DOMAIN}.{data.item_id}"
+        self._attr_unique_id = data.item_id
+        self._written = self._snapshot()
+
+    def _snapshot(self) -> tuple:
+        """Return the state and attributes the item currently publishes."""
+        return self.data.status, self.data.to_state_attrs()
+
+    @callback
+    def async_write_if_changed(self, data: AlarmReminderItem) -> None:
+        """Write the state only if the item's state or attributes changed."""
+        self.data = data
+        snapshot = self._snapshot()
+        if snapshot == self._written:
+            return
+        self._written = snapshot
+        self.async_write_ha_state()
 
     async def async_stop(self):
         """Stop the alarm/reminder."""
-        if self.data["is_alarm"]:
+        if self.data.is_alarm:
             await self.hass.services.async_call(
                 DOMAIN,
                 "stop_alarm",
@@ -55,7 +88,7 @@ class AlarmReminderEntity(Entity):
 
     async def async_snooze(self, minutes: int = 5):
         """Snooze the alarm/reminder."""
-        if self.data["is_alarm"]:
+        if self.data.is_alarm:
             await self.hass.services.async_call(
                 DOMAIN,
                 "snooze_alarm",
@@ -78,50 +111,28 @@ class AlarmReminderEntity(Entity):
 
     async def async_delete(self):
         """Delete the alarm/reminder."""
-        coordinator = self.hass.data[DOMAIN].get(next(iter(self.hass.data[DOMAIN])))
+        coordinator = self.hass.data[DOMAIN].get("coordinator")
         if coordinator:
-            await coordinator.delete_item(self.item_id)
+            await coordinator.delete_item(self.item_id, self.data.is_alarm)
 
     @property
     def name(self):
         """Return the name of the entity."""
-        return self._attr_name
+        return self.data.name
 
     @property
     def state(self):
         """Return the state of the entity."""
-        return self.data["status"]
+        return self._written[0]
 
     @property
-    def extra_state_attributes(self):
+    def extra_state_attributes(self) -> Dict[str, Any]:
         """Return entity specific state attributes."""
-        attrs = {
-            "scheduled_time": self.data["scheduled_time"].isoformat(),
-            "message": self.data["message"],
-            "repeat": self.data["repeat"],
-            "status": self.data["status"],
-            "satellite": self.data["satellite"],
-            "media_players": self.data.get("media_players", []),
-            "is_alarm": self.data["is_alarm"],
-            "name": self.data["name"],
-            "control_buttons": [
-                {
-                    "service": f"{DOMAIN}.stop",
-                    "name": "Stop",
-                    "icon": "mdi:stop"
-                },
-                {
-                    "service": f"{DOMAIN}.snooze",
-                    "name": "Snooze",
-                    "icon": "mdi:snooze"
-                }
-            ]
-        }
-        return attrs
+        return {**self._written[1], "control_buttons": CONTROL_BUTTONS}
 
     @property
     def icon(self):
         """Return the icon to use in the frontend."""
-        if self.data["is_alarm"]:
-            return "mdi:alarm-bell" if self.data["status"] == "active" else "mdi:alarm"
-        return "mdi:reminder"
\ No newline at end of file
+        if self.data.is_alarm:
+            return "mdi:alarm-bell" if self.data.status == "active" else "mdi:alarm"
+        return "mdi:reminder"
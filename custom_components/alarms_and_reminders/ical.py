@@ -0,0 +1,334 @@
+"""iCalendar (.ics) import and export for alarms and reminders.
+
+Files are read and written one content line at a time so large calendars
+never have to be held in memory as text.
+"""
+import os
+import re
+from datetime import datetime, timedelta
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from dateutil.rrule import rrulestr
+
+from homeassistant.util import dt as dt_util
+
+from .model import AlarmReminderItem, ItemStatus, Repeat
+from .recurrence import WEEKDAYS, bound_rrule_text
+
+PRODID = "-//Alarms and Reminders//Home Assistant//EN"
+
+# Extension properties carrying what iCalendar has no field for
+X_TYPE = "X-ALARMS-AND-REMINDERS-TYPE"
+X_SATELLITE = "X-ALARMS-AND-REMINDERS-SATELLITE"
+X_MEDIA_PLAYERS = "X-ALARMS-AND-REMINDERS-MEDIA-PLAYERS"
+
+# Longest content line in octets before it is folded (RFC 5545 3.1)
+MAX_LINE_OCTETS = 75
+
+_DURATION = re.compile(
+    r"^([+-])?P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$"
+)
+
+_REPEAT_BYDAY = {
+    Repeat.WEEKDAYS: "MO,TU,WE,TH,FR",
+    Repeat.WEEKENDS: "SA,SU",
+}
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join folded continuation lines back onto the line they belong to."""
+    current = None
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if line[:1] in (" ", "\t") and current is not None:
+            current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _parse_line(line: str) -> Tuple[str, Dict[str, str], str]:
+    """Split a content line into its name, parameters and value."""
+    quoted = False
+    for index, char in enumerate(line):
+        if char == '"':
+            quoted = not quoted
+        elif char == ":" and not quoted:
+            head, value = line[:index], line[index + 1:]
+            break
+    else:
+        raise ValueError(f"Malformed content line: {line[:40]}")
+
+    name, *params = head.split(";")
+    parsed = {}
+    for param in params:
+        key, _, param_value = param.partition("=")
+        parsed[key.upper()] = param_value.strip('"')
+    return name.upper(), parsed, value
+
+
+def _unescape(value: str) -> str:
+    """Undo TEXT value escaping."""
+    return re.sub(r"\\([\\;,nN])", lambda m: "\n" if m.group(1) in "nN" else m.group(1), value)
+
+
+def _escape(value: str) -> str:
+    """Escape a TEXT value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\n", "\\n")
+    )
+
+
+def iter_events(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Yield each VEVENT of a calendar as its properties and VALARMs.
+
+    Only the first occurrence of a property is kept. Components other than
+    VEVENT and VALARM (such as VTIMEZONE) and malformed lines are skipped.
+    """
+    event = None
+    alarm = None
+    skip_depth = 0
+    for line in _unfold(lines):
+        try:
+            name, params, value = _parse_line(line)
+        except ValueError:
+            continue
+        if skip_depth:
+            if name == "BEGIN":
+                skip_depth += 1
+            elif name == "END":
+                skip_depth -= 1
+            continue
+        if name == "BEGIN":
+            if value.upper() == "VEVENT" and event is None:
+                event = {"props": {}, "alarms": []}
+            elif value.upper() == "VALARM" and event is not None and alarm is None:
+                alarm = {}
+            elif value.upper() != "VCALENDAR":
+                skip_depth = 1
+        elif name == "END":
+            if value.upper() == "VALARM" and alarm is not None:
+                event["alarms"].append(alarm)
+                alarm = None
+            elif value.upper() == "VEVENT" and event is not None:
+                yield event
+                event = None
+        elif alarm is not None:
+            alarm.setdefault(name, (params, value))
+        elif event is not None:
+            event["props"].setdefault(name, (params, value))
+
+
+def _parse_datetime(params: Dict[str, str], value: str) -> datetime:
+    """Parse a DATE or DATE-TIME value into an aware datetime."""
+    if params.get("VALUE") == "DATE" or len(value) == 8:
+        return dt_util.as_local(datetime.strptime(value, "%Y%m%d"))
+    if value.endswith("Z"):
+        return datetime.strptime(value, "%Y%m%dT%H%M%SZ").replace(tzinfo=dt_util.UTC)
+    naive = datetime.strptime(value, "%Y%m%dT%H%M%S")
+    tz = dt_util.get_time_zone(params["TZID"]) if "TZID" in params else None
+    if tz is None:
+        return dt_util.as_local(naive)
+    return naive.replace(tzinfo=tz)
+
+
+def _parse_duration(value: str) -> timedelta:
+    """Parse a DURATION value such as -PT15M."""
+    match = _DURATION.match(value.strip().upper())
+    if match is None or not any(match.groups()[1:]):
+        raise ValueError(f"Invalid duration: {value}")
+    sign, weeks, days, hours, minutes, seconds = match.groups()
+    duration = timedelta(
+        weeks=int(weeks or 0),
+        days=int(days or 0),
+        hours=int(hours or 0),
+        minutes=int(minutes or 0),
+        seconds=int(seconds or 0),
+    )
+    return -duration if sign == "-" else duration
+
+
+def _fire_time(event: Dict[str, Any]) -> datetime:
+    """Return when an event should ring: its first VALARM, else its start."""
+    props = event["props"]
+    if "DTSTART" not in props:
+        raise ValueError("Event has no DTSTART")
+    start = _parse_datetime(*props["DTSTART"])
+    for alarm in event["alarms"]:
+        if "TRIGGER" not in alarm:
+            continue
+        params, value = alarm["TRIGGER"]
+        if params.get("VALUE") == "DATE-TIME":
+            return _parse_datetime(params, value)
+        anchor = start
+        if params.get("RELATED") == "END" and "DTEND" in props:
+            anchor = _parse_datetime(*props["DTEND"])
+        return anchor + _parse_duration(value)
+    return start
+
+
+def event_uid(event: Dict[str, Any]) -> Optional[str]:
+    """Return the UID of an event, if it has one."""
+    uid = event["props"].get("UID")
+    return uid[1] if uid else None
+
+
+def event_to_spec(event: Dict[str, Any], now: datetime, defaults: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a parsed VEVENT into bulk_set item data.
+
+    defaults supplies the type and target for events that do not carry
+    them. Recurring events that started in the past resume at their next
+    occurrence. Raises ValueError for events that cannot become an item.
+    """
+    props = event["props"]
+    if props.get("STATUS", ({}, ""))[1].upper() == "CANCELLED":
+        raise ValueError("Event is cancelled")
+
+    fire_time = _fire_time(event)
+    rrule_text = props["RRULE"][1] if "RRULE" in props else None
+    if rrule_text:
+        # Keep COUNT relative to the real start of the series
+        rrule_text = bound_rrule_text(rrule_text, fire_time)
+        if fire_time < now:
+            fire_time = rrulestr(rrule_text, dtstart=dt_util.as_local(fire_time)).after(now)
+            if fire_time is None:
+                raise ValueError("Recurring event has no future occurrences")
+    elif fire_time < now:
+        raise ValueError("Event is in the past")
+
+    local = dt_util.as_local(fire_time)
+    spec = {
+        "type": props[X_TYPE][1].lower() if X_TYPE in props else defaults["type"],
+        "time": local.strftime("%H:%M:%S"),
+        "date": local.date().isoformat(),
+    }
+    if "SUMMARY" in props:
+        spec["name"] = _unescape(props["SUMMARY"][1])
+    if "DESCRIPTION" in props:
+        spec["message"] = _unescape(props["DESCRIPTION"][1])
+    if rrule_text:
+        spec["rrule"] = rrule_text
+
+    if X_SATELLITE in props or X_MEDIA_PLAYERS in props:
+        if X_SATELLITE in props:
+            spec["satellite"] = props[X_SATELLITE][1]
+        if X_MEDIA_PLAYERS in props:
+            spec["media_player"] = props[X_MEDIA_PLAYERS][1].split(",")
+    else:
+        for key in ("satellite", "media_player"):
+            if defaults.get(key):
+                spec[key] = defaults[key]
+    return spec
+
+
+def convert_events(
+    events: Iterator[Dict[str, Any]], size: int, now: datetime, defaults: Dict[str, Any]
+) -> List[Dict[str, Any]]:
+    """Convert up to size events, returning each one's uid and spec or error."""
+    converted = []
+    for event in islice(events, size):
+        try:
+            converted.append({"uid": event_uid(event), "spec": event_to_spec(event, now, defaults)})
+        except ValueError as err:
+            converted.append({"uid": event_uid(event), "error": str(err)})
+    return converted
+
+
+def _item_rrule(item: AlarmReminderItem) -> Optional[str]:
+    """Return the RRULE equivalent of an item's repeat settings."""
+    if item.rrule:
+        return item.rrule
+    if item.repeat == Repeat.DAILY:
+        return "FREQ=DAILY"
+    if item.repeat in _REPEAT_BYDAY:
+        return f"FREQ=WEEKLY;BYDAY={_REPEAT_BYDAY[item.repeat]}"
+    if item.repeat == Repeat.WEEKLY:
+        return "FREQ=WEEKLY"
+    if item.repeat == Repeat.CUSTOM and item.repeat_days:
+        days = sorted(item.repeat_days, key=WEEKDAYS.index)
+        return "FREQ=WEEKLY;BYDAY=" + ",".join(day[:2].upper() for day in days)
+    return None
+
+
+def _fold(line: str) -> str:
+    """Fold a content line so no physical line exceeds MAX_LINE_OCTETS."""
+    if len(line.encode()) <= MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts = []
+    current = ""
+    limit = MAX_LINE_OCTETS
+    for char in line:
+        if len((current + char).encode()) > limit:
+            parts.append(current)
+            current = ""
+            # Continuation lines spend one octet on the leading space
+            limit = MAX_LINE_OCTETS - 1
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def item_to_vevent(item: AlarmReminderItem, stamp: str) -> List[str]:
+    """Return the content lines of the VEVENT for an item."""
+    local = dt_util.as_local(item.scheduled_time)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{item.item_id}@alarms_and_reminders",
+        f"DTSTAMP:{stamp}",
+        f"DTSTART;TZID={local.tzinfo}:{local:%Y%m%dT%H%M%S}",
+        f"SUMMARY:{_escape(item.name)}",
+    ]
+    if item.message:
+        lines.append(f"DESCRIPTION:{_escape(item.message)}")
+    rrule_text = _item_rrule(item)
+    if rrule_text:
+        lines.append(f"RRULE:{rrule_text}")
+    if item.status in (ItemStatus.STOPPED, ItemStatus.ERROR):
+        lines.append("STATUS:CANCELLED")
+    lines.append(f"{X_TYPE}:{'alarm' if item.is_alarm else 'reminder'}")
+    if item.satellite:
+        lines.append(f"{X_SATELLITE}:{item.satellite}")
+    if item.media_players:
+        lines.append(f"{X_MEDIA_PLAYERS}:{','.join(item.media_players)}")
+    lines += [
+        "BEGIN:VALARM",
+        f"ACTION:{'AUDIO' if item.is_alarm else 'DISPLAY'}",
+        "TRIGGER:PT0S",
+    ]
+    if not item.is_alarm:
+        lines.append(f"DESCRIPTION:{_escape(item.message or item.name)}")
+    lines += ["END:VALARM", "END:VEVENT"]
+    return lines
+
+
+def write_calendar(file: TextIO, items: Iterable[AlarmReminderItem]) -> int:
+    """Write items as a calendar one event at a time and return the count."""
+    stamp = f"{dt_util.utcnow():%Y%m%dT%H%M%SZ}"
+    file.write(_fold("BEGIN:VCALENDAR"))
+    file.write(_fold("VERSION:2.0"))
+    file.write(_fold(f"PRODID:{PRODID}"))
+    count = 0
+    for item in items:
+        file.writelines(_fold(line) for line in item_to_vevent(item, stamp))
+        count += 1
+    file.write(_fold("END:VCALENDAR"))
+    return count
+
+
+def write_calendar_file(path: Path, records: List[Tuple[str, Dict[str, Any]]]) -> int:
+    """Write stored item records to a calendar file and return the count."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="") as file:
+        count = write_calendar(
+            file,
+            (AlarmReminderItem.from_storage(item_id, record) for item_id, record in records),
+        )
+    os.replace(tmp_path, path)
+    return count
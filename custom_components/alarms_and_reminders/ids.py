@@ -0,0 +1,87 @@
+"""Item ID allocation for Alarms and Reminders."""
+import heapq
+from typing import Any, Container, Dict, List, Optional, Set, Tuple
+
+
+def split_id(item_id: str) -> Optional[Tuple[str, int]]:
+    """Split an allocated ID such as alarm_12 into its prefix and number."""
+    prefix, _, number = item_id.rpartition("_")
+    if not prefix or not number.isdigit() or number.startswith("0"):
+        return None
+    return prefix, int(number)
+
+
+class IdAllocator:
+    """Hands out <prefix>_<n> IDs from a per-prefix high-water mark and free-list.
+
+    Released numbers go on a min-heap and are reused lowest first, so IDs
+    stay as short as the old linear probing made them. A prefix whose
+    numbers have all been released is forgotten.
+    """
+
+    def __init__(self):
+        """Initialize allocator."""
+        self._high: Dict[str, int] = {}
+        self._free: Dict[str, List[int]] = {}
+        # Numbers on each free heap, so a double release is ignored
+        self._released: Dict[str, Set[int]] = {}
+
+    def allocate(self, prefix: str, taken: Container[str] = ()) -> str:
+        """Return an unused ID for a prefix, skipping IDs already in taken."""
+        free = self._free.get(prefix)
+        while free:
+            number = heapq.heappop(free)
+            self._released[prefix].discard(number)
+            item_id = f"{prefix}_{number}"
+            if item_id not in taken:
+                return item_id
+
+        high = self._high.get(prefix, 0) + 1
+        while f"{prefix}_{high}" in taken:
+            high += 1
+        self._high[prefix] = high
+        return f"{prefix}_{high}"
+
+    def release(self, item_id: str) -> None:
+        """Return an ID's number to its prefix's free-list."""
+        parts = split_id(item_id)
+        if parts is None:
+            return
+        prefix, number = parts
+        high = self._high.get(prefix, 0)
+        released = self._released.setdefault(prefix, set())
+        if number > high or number in released:
+            return
+        released.add(number)
+        free = self._free.setdefault(prefix, [])
+        heapq.heappush(free, number)
+        if len(free) >= high:
+            del self._high[prefix]
+            del self._free[prefix]
+            del self._released[prefix]
+
+    def observe(self, item_id: str) -> None:
+        """Raise the high-water mark past an ID that is in use."""
+        parts = split_id(item_id)
+        if parts is not None and parts[1] > self._high.get(parts[0], 0):
+            self._high[parts[0]] = parts[1]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the allocator state for storage."""
+        return {
+            "high": dict(self._high),
+            "free": {prefix: sorted(free) for prefix, free in self._free.items() if free},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "IdAllocator":
+        """Restore an allocator from stored state."""
+        allocator = cls()
+        if data:
+            allocator._high = {prefix: int(high) for prefix, high in data.get("high", {}).items()}
+            for prefix, free in data.get("free", {}).items():
+                if prefix in allocator._high:
+                    released = {int(number) for number in free}
+                    allocator._free[prefix] = sorted(released)
+                    allocator._released[prefix] = released
+        return allocator
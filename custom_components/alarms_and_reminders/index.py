@@ -0,0 +1,190 @@
+"""Secondary indexes over the coordinator's items."""
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .model import AlarmReminderItem, Repeat
+
+# (is_alarm, status) bucket key
+BucketKey = Tuple[bool, str]
+
+# (is_alarm, repeats) time list key and (timestamp, item_id) time list entry
+TimeKey = Tuple[bool, bool]
+TimeEntry = Tuple[float, str]
+
+
+def normalize_name(name: str) -> str:
+    """Return the key an item name is looked up by."""
+    return name.replace("_", " ").strip().lower()
+
+
+def targets(item: AlarmReminderItem) -> Tuple[str, ...]:
+    """Return the satellite and media players an item rings on."""
+    found = [item.satellite] if item.satellite else []
+    return tuple(dict.fromkeys(found + item.media_players))
+
+
+class ItemIndex:
+    """Name, (type, status) and target indexes kept up to date on every item change.
+
+    Buckets are dicts used as insertion-ordered sets so listings keep the
+    order items were created in.
+    """
+
+    def __init__(self):
+        """Initialize index."""
+        self._by_name: Dict[str, Dict[str, None]] = {}
+        self._buckets: Dict[BucketKey, Dict[str, None]] = {}
+        self._by_target: Dict[str, Dict[str, None]] = {}
+        # item_id -> (name key, bucket key, targets) it is currently indexed under
+        self._keys: Dict[str, Tuple[str, BucketKey, Tuple[str, ...]]] = {}
+
+    def __len__(self) -> int:
+        """Return number of indexed items."""
+        return len(self._keys)
+
+    def rebuild(self, items: Dict[str, AlarmReminderItem]) -> None:
+        """Index every item from scratch."""
+        self._by_name.clear()
+        self._buckets.clear()
+        self._by_target.clear()
+        self._keys.clear()
+        for item_id, item in items.items():
+            self.update(item_id, item)
+
+    def update(self, item_id: str, item: AlarmReminderItem) -> None:
+        """Index an item after it was added or changed."""
+        keys = (normalize_name(item.name), (item.is_alarm, item.status), targets(item))
+        if self._keys.get(item_id) == keys:
+            return
+        self.remove(item_id)
+        self._keys[item_id] = keys
+        self._by_name.setdefault(keys[0], {})[item_id] = None
+        self._buckets.setdefault(keys[1], {})[item_id] = None
+        for target in keys[2]:
+            self._by_target.setdefault(target, {})[item_id] = None
+
+    def remove(self, item_id: str) -> None:
+        """Forget a removed item."""
+        keys = self._keys.pop(item_id, None)
+        if keys is None:
+            return
+        name_key, bucket_key, item_targets = keys
+        for index, key in (
+            (self._by_name, name_key),
+            (self._buckets, bucket_key),
+            *((self._by_target, target) for target in item_targets),
+        ):
+            bucket = index[key]
+            bucket.pop(item_id, None)
+            if not bucket:
+                del index[key]
+
+    def find_by_name(self, name: str) -> Optional[str]:
+        """Return the first item with a name, ignoring case and underscores."""
+        ids = self._by_name.get(normalize_name(name))
+        return next(iter(ids)) if ids else None
+
+    def count(self, is_alarm: bool, statuses: Iterable[str]) -> int:
+        """Return the number of items of a type in any of the statuses."""
+        return sum(len(self._buckets.get((is_alarm, status), ())) for status in statuses)
+
+    def ids_for_target(self, target: str) -> List[str]:
+        """Return the ids of items ringing on a satellite or media player."""
+        return list(self._by_target.get(target, ()))
+
+    def ids(self, is_alarm: bool, statuses: Iterable[str]) -> List[str]:
+        """Return the ids of items of a type in any of the statuses."""
+        return [
+            item_id
+            for status in statuses
+            for item_id in self._buckets.get((is_alarm, status), ())
+        ]
+
+
+def repeats(item: AlarmReminderItem) -> bool:
+    """Return True if an item has a repeat rule."""
+    return bool(item.rrule) or item.repeat != Repeat.ONCE
+
+
+class TimeIndex:
+    """Items sorted by scheduled time, split by type and by whether they repeat.
+
+    One-off items only ever occur at their scheduled time, so a range query
+    is a bisect. A repeating item's scheduled time is its next occurrence,
+    so only repeating items scheduled before the end of a range can occur
+    in it.
+    """
+
+    def __init__(self):
+        """Initialize index."""
+        self._lists: Dict[TimeKey, List[TimeEntry]] = {}
+        # item_id -> (list key, entry) it is currently indexed under
+        self._keys: Dict[str, Tuple[TimeKey, TimeEntry]] = {}
+
+    def __len__(self) -> int:
+        """Return number of indexed items."""
+        return len(self._keys)
+
+    def rebuild(self, items: Dict[str, AlarmReminderItem]) -> None:
+        """Index every item from scratch, sorting each list once."""
+        self._lists.clear()
+        self._keys.clear()
+        for item_id, item in items.items():
+            key, entry = self._key(item_id, item)
+            self._keys[item_id] = (key, entry)
+            self._lists.setdefault(key, []).append(entry)
+        for entries in self._lists.values():
+            entries.sort()
+
+    @staticmethod
+    def _key(item_id: str, item: AlarmReminderItem) -> Tuple[TimeKey, TimeEntry]:
+        """Return the list key and entry of an item."""
+        return (item.is_alarm, repeats(item)), (item.scheduled_time.timestamp(), item_id)
+
+    def update(self, item_id: str, item: AlarmReminderItem) -> None:
+        """Index an item after it was added or changed."""
+        keys = self._key(item_id, item)
+        if self._keys.get(item_id) == keys:
+            return
+        self.remove(item_id)
+        self._keys[item_id] = keys
+        insort(self._lists.setdefault(keys[0], []), keys[1])
+
+    def remove(self, item_id: str) -> None:
+        """Forget a removed item."""
+        keys = self._keys.pop(item_id, None)
+        if keys is None:
+            return
+        entries = self._lists[keys[0]]
+        del entries[bisect_left(entries, keys[1])]
+
+    def between(
+        self, is_alarm: bool, start: datetime, end: datetime, repeating: bool = False
+    ) -> List[str]:
+        """Return ids of items scheduled in [start, end), earliest first."""
+        entries = self._lists.get((is_alarm, repeating), [])
+        low = bisect_left(entries, (start.timestamp(),))
+        high = bisect_left(entries, (end.timestamp(),))
+        return [item_id for _, item_id in entries[low:high]]
+
+    def before(self, is_alarm: bool, end: datetime, repeating: bool = True) -> List[str]:
+        """Return ids of items scheduled before end, earliest first."""
+        entries = self._lists.get((is_alarm, repeating), [])
+        high = bisect_left(entries, (end.timestamp(),))
+        return [item_id for _, item_id in entries[:high]]
+
+    def iter_from(self, is_alarm: bool, start: datetime, repeating: bool) -> Iterator[str]:
+        """Yield ids of items scheduled at or after start, earliest first."""
+        for _, item_id in self.iter_entries(is_alarm, repeating, (start.timestamp(),)):
+            yield item_id
+
+    def iter_entries(self, is_alarm: bool, repeating: bool, after: tuple) -> Iterator[TimeEntry]:
+        """Yield (timestamp, item_id) entries sorting after a position, earliest first.
+
+        A (timestamp,) position starts at that time; a full entry starts
+        just past that entry, which is how pages continue.
+        """
+        entries = self._lists.get((is_alarm, repeating), [])
+        for index in range(bisect_right(entries, after), len(entries)):
+            yield entries[index]
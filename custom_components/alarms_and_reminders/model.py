@@ -0,0 +1,155 @@
+"""Item model for Alarms and Reminders."""
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from typing import Any, Dict, List, Optional
+
+from homeassistant.util import dt as dt_util
+
+
+class ItemStatus(StrEnum):
+    """Lifecycle status of an item."""
+
+    SCHEDULED = "scheduled"
+    ACTIVE = "active"
+    STOPPED = "stopped"
+    ERROR = "error"
+
+
+class Repeat(StrEnum):
+    """Repeat setting of an item."""
+
+    ONCE = "once"
+    DAILY = "daily"
+    WEEKDAYS = "weekdays"
+    WEEKENDS = "weekends"
+    WEEKLY = "weekly"
+    CUSTOM = "custom"
+
+
+# State attributes kept out of the recorder: they only change on edits and
+# are always available from the current state, the item or storage.
+# last_stopped and last_rescheduled_from change on every stop and
+# reschedule, so they stay recorded as part of the item's history.
+STATE_UNRECORDED_ATTRIBUTES = frozenset({
+    "is_alarm",
+    "message",
+    "satellite",
+    "media_players",
+    "repeat",
+    "repeat_days",
+    "rrule",
+    "sound_file",
+    "notify_device",
+})
+
+
+def _enum_value(enum, value, default):
+    """Return the shared enum member for a stored value."""
+    try:
+        return enum(value)
+    except ValueError:
+        return default
+
+
+@dataclass(slots=True, eq=False)
+class AlarmReminderItem:
+    """An alarm or reminder.
+
+    Status and repeat are enum members, so every item shares the same
+    objects instead of holding its own strings.
+    """
+
+    item_id: str
+    name: str
+    is_alarm: bool
+    scheduled_time: datetime
+    status: ItemStatus = ItemStatus.SCHEDULED
+    message: str = ""
+    satellite: Optional[str] = None
+    media_players: List[str] = field(default_factory=list)
+    repeat: Repeat = Repeat.ONCE
+    repeat_days: List[str] = field(default_factory=list)
+    rrule: Optional[str] = None
+    sound_file: Optional[str] = None
+    notify_device: Optional[str] = None
+    last_stopped: Optional[str] = None
+    last_rescheduled_from: Optional[str] = None
+
+    @classmethod
+    def from_storage(cls, item_id: str, data: Dict[str, Any]) -> "AlarmReminderItem":
+        """Create an item from a stored record or state attributes."""
+        scheduled_time = data["scheduled_time"]
+        if isinstance(scheduled_time, str):
+            scheduled_time = dt_util.parse_datetime(scheduled_time)
+        return cls(
+            item_id=item_id,
+            name=data.get("name") or item_id,
+            is_alarm=bool(data.get("is_alarm")),
+            scheduled_time=scheduled_time,
+            status=_enum_value(ItemStatus, data.get("status"), ItemStatus.SCHEDULED),
+            message=data.get("message") or "",
+            satellite=data.get("satellite"),
+            media_players=list(data.get("media_players") or []),
+            repeat=_enum_value(Repeat, data.get("repeat"), Repeat.ONCE),
+            repeat_days=list(data.get("repeat_days") or []),
+            rrule=data.get("rrule"),
+            sound_file=data.get("sound_file"),
+            notify_device=data.get("notify_device"),
+            last_stopped=data.get("last_stopped"),
+            last_rescheduled_from=data.get("last_rescheduled_from"),
+        )
+
+    def to_storage(self) -> Dict[str, Any]:
+        """Return the JSON-ready record stored for the item."""
+        record = {
+            "scheduled_time": self.scheduled_time.isoformat(),
+            "satellite": self.satellite,
+            "media_players": list(self.media_players),
+            "message": self.message,
+            "is_alarm": self.is_alarm,
+            "repeat": self.repeat.value,
+            "repeat_days": list(self.repeat_days),
+            "rrule": self.rrule,
+            "status": self.status.value,
+            "name": self.name,
+            "entity_id": self.item_id,
+            "unique_id": self.item_id,
+            "sound_file": self.sound_file,
+        }
+        # Optional fields are only stored once set
+        if self.notify_device is not None:
+            record["notify_device"] = self.notify_device
+        if self.last_stopped is not None:
+            record["last_stopped"] = self.last_stopped
+        if self.last_rescheduled_from is not None:
+            record["last_rescheduled_from"] = self.last_rescheduled_from
+        return record
+
+    def to_state_attrs(self) -> Dict[str, Any]:
+        """Return the attributes of the item's state.
+
+        Status is the state itself and the ids are the entity id, so neither
+        is repeated; optional fields are only included once set.
+        """
+        attrs = {
+            "scheduled_time": self.scheduled_time.isoformat(),
+            "name": self.name,
+            "is_alarm": self.is_alarm,
+            "message": self.message,
+            "satellite": self.satellite,
+            "media_players": list(self.media_players),
+            "repeat": self.repeat.value,
+        }
+        for key in (
+            "repeat_days",
+            "rrule",
+            "sound_file",
+            "notify_device",
+            "last_stopped",
+            "last_rescheduled_from",
+        ):
+            value = getattr(self, key)
+            if value:
+                attrs[key] = list(value) if isinstance(value, list) else value
+        return attrs
@@ -0,0 +1,133 @@
+"""Coalesced publishing of item states for Alarms and Reminders."""
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN
+from .entity import AlarmReminderEntity, create_item_component
+from .model import AlarmReminderItem
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StatePublisher:
+    """Writes changed item states and fires one change event per flush.
+
+    Changes are collected as dirty item ids. They are flushed on the next
+    loop iteration, or after window seconds when a window is set, so a
+    burst of changes costs at most one state write per item and one
+    {DOMAIN}_state_changed event carrying all the changed ids. States are
+    owned by one AlarmReminderEntity per item, added to and removed from
+    the item entity component as items come and go.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        get_item: Callable[[str], Optional[AlarmReminderItem]],
+        window: float = 0,
+    ):
+        """Initialize publisher."""
+        self.hass = hass
+        self._get_item = get_item
+        self.window = window
+        # Dict used as an insertion-ordered set
+        self._dirty: Dict[str, None] = {}
+        self._handle = None
+        self.flush_count = 0
+        self.component = create_item_component(hass)
+        self._entities: Dict[str, AlarmReminderEntity] = {}
+        # Entities being added; removals wait for them to finish
+        self._adding: Optional[asyncio.Task] = None
+
+    @property
+    def pending(self) -> int:
+        """Return number of item ids waiting to be published."""
+        return len(self._dirty)
+
+    @callback
+    def async_mark(self, *item_ids: str) -> None:
+        """Publish items on the next flush; removed items lose their state."""
+        self._dirty.update(dict.fromkeys(item_ids))
+        if self._handle is None:
+            if self.window:
+                self._handle = self.hass.loop.call_later(self.window, self.async_flush)
+            else:
+                self._handle = self.hass.loop.call_soon(self.async_flush)
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the states of all dirty items and fire one change event."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if not self._dirty:
+            return
+        item_ids = list(self._dirty)
+        self._dirty.clear()
+
+        added: List[AlarmReminderEntity] = []
+        removed: List[AlarmReminderEntity] = []
+        for item_id in item_ids:
+            item = self._get_item(item_id)
+            entity = self._entities.get(item_id)
+            try:
+                if item is None:
+                    if entity is not None:
+                        removed.append(self._entities.pop(item_id))
+                    else:
+                        self._async_remove_registry_entry(item_id)
+                elif entity is None:
+                    entity = self._entities[item_id] = AlarmReminderEntity(item)
+                    added.append(entity)
+                elif entity.hass is not None:
+                    entity.async_write_if_changed(item)
+            except Exception as err:
+                _LOGGER.error("Error publishing state of %s: %s", item_id, err, exc_info=True)
+
+        if added:
+            self._adding = self.hass.async_create_task(
+                self.component.async_add_entities(added)
+            )
+        for entity in removed:
+            self.hass.async_create_task(self._async_remove_entity(entity, self._adding))
+
+        self.flush_count += 1
+        self.hass.bus.async_fire(f"{DOMAIN}_state_changed", {"item_ids": item_ids})
+
+    async def _async_remove_entity(
+        self, entity: AlarmReminderEntity, adding: Optional[asyncio.Task]
+    ) -> None:
+        """Remove an item entity and its registry entry."""
+        if adding is not None:
+            await adding
+        if entity.hass is None:
+            return
+        if entity.registry_entry is not None:
+            # The entity removes itself once its registry entry is gone
+            er.async_get(self.hass).async_remove(entity.entity_id)
+        else:
+            await entity.async_remove()
+
+    @callback
+    def _async_remove_registry_entry(self, item_id: str) -> None:
+        """Remove the registry entry of an item that has no entity."""
+        registry = er.async_get(self.hass)
+        if entity_id := registry.async_get_entity_id(DOMAIN, DOMAIN, item_id):
+            registry.async_remove(entity_id)
+
+    @callback
+    def async_remove_orphans(self) -> None:
+        """Remove registry entries of item entities whose item no longer exists.
+
+        Only the integration's own domain of the state machine is read, so
+        the cost follows the number of items, not the size of the instance.
+        """
+        registry = er.async_get(self.hass)
+        for entity_id in self.hass.states.async_entity_ids(DOMAIN):
+            entry = registry.async_get(entity_id)
+            if entry is not None and entry.platform == DOMAIN and self._get_item(entry.unique_id) is None:
+                registry.async_remove(entity_id)
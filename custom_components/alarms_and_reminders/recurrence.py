@@ -0,0 +1,153 @@
+"""Recurrence rules for repeating alarms and reminders."""
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
+
+from dateutil.rrule import rrule, rrulestr
+
+from homeassistant.util import dt as dt_util
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+# Bit n of a mask is set when the item repeats on weekday n (Monday == 0)
+ALL_DAYS = 0b1111111
+REPEAT_MASKS = {
+    "daily": ALL_DAYS,
+    "weekdays": 0b0011111,
+    "weekends": 0b1100000,
+}
+
+# Rules are parsed against a fixed aware DTSTART and rebound per item
+_RRULE_ANCHOR = datetime(2000, 1, 1, tzinfo=dt_util.UTC)
+
+
+def days_to_mask(days: Iterable[str]) -> int:
+    """Convert weekday abbreviations to a weekday bitmask."""
+    mask = 0
+    for day in days:
+        mask |= 1 << WEEKDAYS.index(day)
+    return mask
+
+
+class Recurrence:
+    """A compiled weekly repeat rule firing at a fixed local time of day."""
+
+    __slots__ = ("mask", "time")
+
+    def __init__(self, mask: int, at: time):
+        """Initialize recurrence."""
+        self.mask = mask
+        self.time = at
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"Recurrence(mask={self.mask:07b}, time={self.time})"
+
+    def next_after(self, after: datetime, inclusive: bool = False) -> datetime:
+        """Return the first occurrence after (or at, if inclusive) a moment."""
+        local = dt_util.as_local(after)
+        day = local.date()
+        if self.mask >> day.weekday() & 1:
+            candidate = self._at(day)
+            if candidate > local or (inclusive and candidate == local):
+                return candidate
+        return self._at(day + timedelta(days=self._days_until_next(day.weekday())))
+
+    def between(self, start: datetime, end: datetime) -> List[datetime]:
+        """Return the occurrences in [start, end)."""
+        occurrences = []
+        occurrence = self.next_after(start, inclusive=True)
+        while occurrence < end:
+            occurrences.append(occurrence)
+            occurrence = self.next_after(occurrence)
+        return occurrences
+
+    def _days_until_next(self, weekday: int) -> int:
+        """Return days from weekday to the next repeat day (1-7)."""
+        shift = weekday + 1
+        rotated = ((self.mask >> shift) | (self.mask << (7 - shift))) & ALL_DAYS
+        return (rotated & -rotated).bit_length()
+
+    def _at(self, day: date) -> datetime:
+        """Return the occurrence on a given local date."""
+        return dt_util.as_local(datetime.combine(day, self.time))
+
+
+@lru_cache(maxsize=256)
+def parse_rrule(text: str) -> rrule:
+    """Parse an RFC 5545 RRULE, sharing the result between items using it."""
+    rule = rrulestr(text, dtstart=_RRULE_ANCHOR)
+    if not isinstance(rule, rrule):
+        raise ValueError("Only a single RRULE is supported")
+    return rule
+
+
+def bound_rrule_text(text: str, dtstart: datetime) -> str:
+    """Replace COUNT with the equivalent UNTIL for a series starting at dtstart.
+
+    Rules are re-bound to their latest occurrence as they advance, which
+    would restart a COUNT; an UNTIL stays valid wherever the series resumes.
+    """
+    rule = parse_rrule(text)
+    if rule._count is None:
+        return text
+    last = rule.replace(dtstart=dt_util.as_local(dtstart))[-1]
+    parts = [part for part in text.split(";") if not part.upper().startswith("COUNT=")]
+    parts.append(f"UNTIL={dt_util.as_utc(last):%Y%m%dT%H%M%SZ}")
+    return ";".join(parts)
+
+
+class RRuleRecurrence:
+    """A compiled RRULE that advances incrementally from its last occurrence."""
+
+    __slots__ = ("rule",)
+
+    def __init__(self, rule: rrule):
+        """Initialize recurrence."""
+        self.rule = rule
+
+    def __repr__(self) -> str:
+        """Return a readable representation."""
+        return f"RRuleRecurrence(dtstart={self.rule._dtstart})"
+
+    def next_after(self, after: datetime, inclusive: bool = False) -> Optional[datetime]:
+        """Return the first occurrence after (or at, if inclusive) a moment."""
+        occurrence = self.rule.after(dt_util.as_local(after), inc=inclusive)
+        if occurrence is not None:
+            # Expand from here next time instead of from the original DTSTART
+            self.rule = self.rule.replace(dtstart=occurrence)
+        return occurrence
+
+    def between(self, start: datetime, end: datetime) -> List[datetime]:
+        """Return the occurrences in [start, end) without advancing the rule."""
+        return [
+            occurrence
+            for occurrence in self.rule.between(dt_util.as_local(start), dt_util.as_local(end), inc=True)
+            if occurrence < end
+        ]
+
+
+def compile_recurrence(
+    repeat: Optional[str],
+    repeat_days: Optional[Iterable[str]],
+    scheduled_time: datetime,
+    rrule_text: Optional[str] = None,
+) -> Optional[Union[Recurrence, RRuleRecurrence]]:
+    """Compile an item's repeat settings, or return None for one-off items."""
+    if rrule_text:
+        return RRuleRecurrence(
+            parse_rrule(rrule_text).replace(dtstart=dt_util.as_local(scheduled_time))
+        )
+
+    if repeat in REPEAT_MASKS:
+        mask = REPEAT_MASKS[repeat]
+    elif repeat == "weekly":
+        mask = 1 << dt_util.as_local(scheduled_time).weekday()
+    elif repeat == "custom":
+        mask = days_to_mask(repeat_days or [])
+    else:
+        return None
+
+    if not mask:
+        return None
+    return Recurrence(mask, dt_util.as_local(scheduled_time).time())
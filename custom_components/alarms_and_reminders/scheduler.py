@@ -0,0 +1,160 @@
+"""Trigger scheduler for alarms and reminders."""
+import heapq
+import itertools
+import logging
+import time
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+# Re-check the heap at least this often so the timer self-corrects after
+# wall clock changes or host suspend (loop timers run on the monotonic clock).
+MAX_TIMER_DELAY = 3600
+
+# Rebuild the heap once cancelled entries outnumber live ones.
+COMPACT_MIN_SIZE = 64
+
+
+class ItemScheduler:
+    """Schedules item triggers with a single loop timer.
+
+    Pending triggers are kept in a min-heap of (fire_time, item_id, generation)
+    and only the heap top has a timer armed. Each entry carries a unique
+    generation; cancelling an item forgets its live generation so the stale
+    heap entry is skipped when it reaches the top.
+    """
+
+    def __init__(self, hass: HomeAssistant, fire_callback: Callable[[str], None]):
+        """Initialize scheduler."""
+        self.hass = hass
+        self._fire_callback = fire_callback
+        self._heap: List[Tuple[float, str, int]] = []
+        self._generation = itertools.count(1)
+        # item_id -> generation of its live heap entry
+        self._pending: Dict[str, int] = {}
+        self._timer = None
+        self._timer_when: Optional[float] = None
+
+    def __len__(self) -> int:
+        """Return number of pending triggers."""
+        return len(self._pending)
+
+    def __contains__(self, item_id: str) -> bool:
+        """Return True if the item has a pending trigger."""
+        return item_id in self._pending
+
+    @property
+    def next_fire_time(self) -> Optional[datetime]:
+        """Return the time of the earliest pending trigger."""
+        self._drop_stale_top()
+        if not self._heap:
+            return None
+        return dt_util.utc_from_timestamp(self._heap[0][0])
+
+    @callback
+    def schedule(self, item_id: str, fire_time: datetime) -> None:
+        """Schedule (or move) the trigger for an item."""
+        when = fire_time.timestamp()
+        generation = next(self._generation)
+        self._pending[item_id] = generation
+        heapq.heappush(self._heap, (when, item_id, generation))
+        self._maybe_compact()
+
+        if self._timer_when is None or when < self._timer_when:
+            self._arm()
+
+    @callback
+    def schedule_many(self, triggers: Iterable[Tuple[str, datetime]]) -> None:
+        """Schedule (or move) the triggers for many items with a single heapify."""
+        earliest = None
+        for item_id, fire_time in triggers:
+            when = fire_time.timestamp()
+            generation = next(self._generation)
+            self._pending[item_id] = generation
+            self._heap.append((when, item_id, generation))
+            if earliest is None or when < earliest:
+                earliest = when
+        if earliest is None:
+            return
+        heapq.heapify(self._heap)
+        self._maybe_compact()
+
+        if self._timer_when is None or earliest < self._timer_when:
+            self._arm()
+
+    @callback
+    def cancel(self, item_id: str) -> bool:
+        """Cancel the pending trigger for an item."""
+        if item_id not in self._pending:
+            return False
+        del self._pending[item_id]
+        self._maybe_compact()
+        if not self._pending:
+            self._disarm()
+        return True
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the timer and drop all pending triggers."""
+        self._disarm()
+        self._heap.clear()
+        self._pending.clear()
+
+    def _is_live(self, entry: Tuple[float, str, int]) -> bool:
+        """Return True if a heap entry has not been cancelled or replaced."""
+        _, item_id, generation = entry
+        return self._pending.get(item_id) == generation
+
+    def _drop_stale_top(self) -> None:
+        """Pop cancelled entries off the top of the heap."""
+        while self._heap and not self._is_live(self._heap[0]):
+            heapq.heappop(self._heap)
+
+    def _maybe_compact(self) -> None:
+        """Rebuild the heap when it is mostly cancelled entries."""
+        if len(self._heap) > COMPACT_MIN_SIZE and len(self._heap) > 2 * len(self._pending):
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+
+    def _disarm(self) -> None:
+        """Cancel the armed loop timer."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._timer_when = None
+
+    def _arm(self) -> None:
+        """Arm the loop timer for the heap top."""
+        self._disarm()
+        self._drop_stale_top()
+        if not self._heap:
+            return
+        when = self._heap[0][0]
+        delay = min(max(when - time.time(), 0), MAX_TIMER_DELAY)
+        self._timer_when = when
+        self._timer = self.hass.loop.call_later(delay, self._fire_due)
+
+    @callback
+    def _fire_due(self) -> None:
+        """Fire every trigger that is due and re-arm for the next one."""
+        self._timer = None
+        self._timer_when = None
+        now = time.time()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            if self._is_live(entry):
+                del self._pending[entry[1]]
+                due.append(entry[1])
+
+        self._arm()
+
+        for item_id in due:
+            try:
+                self._fire_callback(item_id)
+            except Exception as err:
+                _LOGGER.error("Error firing trigger for %s: %s", item_id, err, exc_info=True)
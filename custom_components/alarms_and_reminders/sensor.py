@@ -1,19 +1,23 @@
 """Sensor platform for Alarms and Reminders."""
-from datetime import datetime
+from bisect import bisect_left, insort
+from itertools import islice
 import logging
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, ServiceCall, callback  
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
-from homeassistant.util import dt as dt_util
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .const import CONF_ACTIVE_ITEMS_LIMIT, DEFAULT_ACTIVE_ITEMS_LIMIT, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
+ACTIVE_STATUSES = ("scheduled", "active")
+# Seconds changes are collected for before the sensor state is written
+UPDATE_DEBOUNCE = 1
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -25,86 +29,133 @@ async def async_setup_entry(
         coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
         
         # Create and add sensor entities
+        limit = entry.options.get(CONF_ACTIVE_ITEMS_LIMIT, DEFAULT_ACTIVE_ITEMS_LIMIT)
         entities = [
-            ActiveItemsSensor(coordinator, is_alarm=True),
-            ActiveItemsSensor(coordinator, is_alarm=False)
+            ActiveItemsSensor(coordinator, is_alarm=True, limit=limit),
+            ActiveItemsSensor(coordinator, is_alarm=False, limit=limit)
         ]
         
         async_add_entities(entities)
 
-        # Store the async_add_entities callback in the coordinator
-        coordinator.async_add_entities = async_add_entities
-
     except Exception as err:
         _LOGGER.error("Error setting up sensor platform: %s", err)
 
 class ActiveItemsSensor(SensorEntity):
     """Base class for active items sensors."""
 
-    def __init__(self, coordinator, is_alarm: bool):
+    # The item list and button are bulky or static; the state is the count
+    _unrecorded_attributes = frozenset({"active_items", "stop_all_button"})
+
+    def __init__(self, coordinator, is_alarm: bool, limit: int = DEFAULT_ACTIVE_ITEMS_LIMIT):
         """Initialize the sensor."""
         self.coordinator = coordinator
         self.is_alarm = is_alarm
+        self.limit = limit
         self._attr_unique_id = f"alarms_and_reminders_active_{'alarms' if is_alarm else 'reminders'}"
         self._attr_name = f"Active {'Alarms' if is_alarm else 'Reminders'}"
         self._attr_icon = "mdi:alarm-multiple" if is_alarm else "mdi:reminder"
         self._attr_should_poll = False
         self._attr_native_unit_of_measurement = "active items"
+        # Attribute entries of this sensor's scheduled/active items, patched per change
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        # (timestamp, item_id) of the listed items in scheduled order
+        self._order: List[Tuple[float, str]] = []
+        self._keys: Dict[str, Tuple[float, str]] = {}
+        self._unsub_update = None
+
+    def _entry(self, item) -> Optional[Dict[str, Any]]:
+        """Return the attribute entry of an item, or None if it is not listed."""
+        if item is None or item.is_alarm != self.is_alarm or item.status not in ACTIVE_STATUSES:
+            return None
+        return {
+            "name": item.name,
+            "status": item.status,
+            "scheduled_time": item.scheduled_time.isoformat(),
+            "entity_id": f"{DOMAIN}.{item.item_id}",
+        }
+
+    @callback
+    def _async_patch(self, item_ids) -> bool:
+        """Patch the entries of changed items; return True if any changed."""
+        changed = False
+        for item_id in item_ids:
+            item = self.coordinator.get_item(item_id)
+            entry = self._entry(item)
+            if entry is None:
+                changed |= self._entries.pop(item_id, None) is not None
+                self._unorder(item_id)
+            elif self._entries.get(item_id) != entry:
+                self._entries[item_id] = entry
+                key = (item.scheduled_time.timestamp(), item_id)
+                if self._keys.get(item_id) != key:
+                    self._unorder(item_id)
+                    self._keys[item_id] = key
+                    insort(self._order, key)
+                changed = True
+        return changed
+
+    def _unorder(self, item_id: str) -> None:
+        """Drop an item from the scheduled order."""
+        key = self._keys.pop(item_id, None)
+        if key is not None:
+            del self._order[bisect_left(self._order, key)]
+
+    @callback
+    def _async_write_debounced(self, _now=None) -> None:
+        """Write the state once the debounce window has passed."""
+        self._unsub_update = None
+        self.async_write_ha_state()
         
     @property
     def native_value(self) -> int:
         """Return the state of the sensor."""
-        try:
-            count = sum(
-                1 for item in self.coordinator._active_items.values()
-                if (item["is_alarm"] == self.is_alarm and 
-                    item["status"] in ["scheduled", "active"])
-            )
-            return count
-        except Exception as err:
-            _LOGGER.error("Error calculating count: %s", err)
-            return 0
+        return len(self._entries)
 
     async def async_added_to_hass(self):
         """Register callbacks."""
+        self._async_patch(self.coordinator.item_ids(self.is_alarm, ACTIVE_STATUSES))
+
         @callback
         def _state_changed(event):
-            """Handle state changes."""
-            self.async_schedule_update_ha_state(True)
+            """Patch changed items and schedule a debounced state write."""
+            if not self._async_patch(event.data.get("item_ids", ())):
+                return
+            if self._unsub_update is None:
+                self._unsub_update = async_call_later(
+                    self.hass, UPDATE_DEBOUNCE, self._async_write_debounced
+                )
+
+        @callback
+        def _cancel_update():
+            """Cancel a pending state write."""
+            if self._unsub_update is not None:
+                self._unsub_update()
+                self._unsub_update = None
 
         self.async_on_remove(
             self.hass.bus.async_listen(f"{DOMAIN}_state_changed", _state_changed)
         )
+        self.async_on_remove(_cancel_update)
 
     @property
     def extra_state_attributes(self):
-        """Return entity specific state attributes."""
-        try:
-            active_items = {
-                item_id: {
-                    "name": item["name"],
-                    "status": item["status"],
-                    "scheduled_time": item["scheduled_time"].isoformat(),
-"entity_id": f"{DOMAIN}.{item_id}"
-                }
-                for item_id, item in self.coordinator._active_items.items()
-                if item["is_alarm"] == self.is_alarm and 
-                   item["status"] in ["scheduled", "active"]
-            }
-            return {
-                "active_items": active_items,
-                "stop_all_button": {
-                    "service": f"{DOMAIN}.stop_all_{'alarms' if self.is_alarm else 'reminders'}",
-                    "name": f"Stop All {'Alarms' if self.is_alarm else 'Reminders'}"
-                }
+        """Return entity specific state attributes.
+
+        active_items lists only the next `limit` items by scheduled time;
+        page through the rest with the alarms_and_reminders/items websocket
+        command.
+        """
+        return {
+            "active_items": {
+                item_id: self._entries[item_id]
+                for _, item_id in islice(self._order, self.limit)
+            },
+            "total_items": len(self._entries),
+            "stop_all_button": {
+                "service": f"{DOMAIN}.stop_all_{'alarms' if self.is_alarm else 'reminders'}",
+                "name": f"Stop All {'Alarms' if self.is_alarm else 'Reminders'}"
             }
-        except Exception as err:
-            _LOGGER.error("Error getting attributes: %s", err)
-            return {}
-
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        self.async_write_ha_state()
+        }
 
     async def schedule_item(self, call: ServiceCall, is_alarm: bool, target: dict) -> None:
         """Schedule an alarm or reminder."""
@@ -0,0 +1,248 @@
+"""SQLite storage backend for Alarms and Reminders."""
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
+
+from .const import DEFAULT_SAVE_DELAY
+from .model import AlarmReminderItem
+from .storage import AlarmReminderStorage, BaseItemStorage
+
+_LOGGER = logging.getLogger(__name__)
+
+SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    item_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Version 1 also copied is_alarm, status and scheduled_time into indexed
+# columns that nothing read; items are queried from the coordinator's indexes
+_MIGRATE_V1 = """
+BEGIN;
+CREATE TABLE items_v2 (
+    item_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+INSERT INTO items_v2 (item_id, data) SELECT item_id, data FROM items;
+DROP TABLE items;
+ALTER TABLE items_v2 RENAME TO items;
+UPDATE meta SET value = '2' WHERE key = 'schema_version';
+COMMIT;
+"""
+
+_UPSERT = (
+    "INSERT INTO items (item_id, data) VALUES (?, ?) "
+    "ON CONFLICT(item_id) DO UPDATE SET data = excluded.data"
+)
+
+Row = Tuple[str, str]
+
+
+def _to_row(item_id: str, record: Dict[str, Any]) -> Row:
+    """Return the table row for a stored record."""
+    return item_id, json_bytes(record).decode("utf-8")
+
+
+class SqliteAlarmReminderStorage(BaseItemStorage):
+    """Store alarms and reminders as one row per item in a SQLite database.
+
+    Every change is a single-row upsert or delete. All database calls run
+    in the executor under the storage lock. The rows last read or written
+    are mirrored in memory, so lookups and queries never hit the disk; the
+    coordinator's indexes serve list_items and the sensors.
+    """
+
+    def __init__(self, hass: HomeAssistant, save_delay: float = DEFAULT_SAVE_DELAY):
+        """Initialize storage."""
+        super().__init__(hass, save_delay)
+        self.storage_dir = Path(hass.config.path(".storage"))
+        self.db_file = self.storage_dir / "alarms_and_reminders.db"
+        self._conn: Optional[sqlite3.Connection] = None
+        # item_id -> stored record, mirroring the items table
+        self._records: Dict[str, Dict[str, Any]] = {}
+        self._unsub_close: Optional[CALLBACK_TYPE] = None
+
+    @callback
+    def get_item(self, item_id: str) -> Optional[AlarmReminderItem]:
+        """Return a copy of a stored item, or None if it is not stored."""
+        record = self._records.get(item_id)
+        if record is None:
+            return None
+        return self._from_record(item_id, record)
+
+    def _iter_records(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        """Return (item_id, record) pairs for every stored item."""
+        return self._records.items()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self._conn is None:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            row = conn.execute(
+                "SELECT value FROM meta WHERE key = 'schema_version'"
+            ).fetchone()
+            if row is not None and row[0] == "1":
+                conn.executescript(_MIGRATE_V1)
+            self._conn = conn
+        return self._conn
+
+    async def _async_execute(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run a database call in the executor.
+
+        The first call opens the connection, so the listener closing it when
+        Home Assistant stops is registered here.
+        """
+        if self._unsub_close is None:
+            self._unsub_close = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_close_at_stop
+            )
+        return await self.hass.async_add_executor_job(target, *args)
+
+    async def _async_close_at_stop(self, _event: Event) -> None:
+        """Write pending changes and close the connection when Home Assistant stops."""
+        self._unsub_close = None
+        await self.async_flush()
+        await self.async_close()
+
+    def _is_migrated(self) -> bool:
+        """Return True once the JSON files have been imported."""
+        row = self._connect().execute(
+            "SELECT value FROM meta WHERE key = 'schema_version'"
+        ).fetchone()
+        return row is not None
+
+    def _write_rows(
+        self,
+        records: Dict[str, Dict[str, Any]],
+        deleted: Iterable[str],
+        replace: bool = False,
+    ) -> None:
+        """Upsert and delete rows in a single transaction."""
+        rows = [_to_row(item_id, record) for item_id, record in records.items()]
+        conn = self._connect()
+        with conn:
+            if replace:
+                conn.execute("DELETE FROM items")
+            conn.executemany(_UPSERT, rows)
+            conn.executemany(
+                "DELETE FROM items WHERE item_id = ?", [(item_id,) for item_id in deleted]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('schema_version', ?)",
+                (str(SCHEMA_VERSION),),
+            )
+
+    def _read_records(self, query: str, params: Tuple = ()) -> Dict[str, Dict[str, Any]]:
+        """Return the stored records selected by a query."""
+        rows = self._connect().execute(query, params).fetchall()
+        return {item_id: json_loads(data) for item_id, data in rows}
+
+    def _apply_records(
+        self, records: Dict[str, Dict[str, Any]], deleted: Iterable[str]
+    ) -> None:
+        """Mirror written records in memory."""
+        self._records.update(records)
+        for item_id in deleted:
+            self._records.pop(item_id, None)
+
+    async def _async_migrate(self) -> None:
+        """Import items from the JSON storage files on first use."""
+        if await self._async_execute(self._is_migrated):
+            return
+        items = await AlarmReminderStorage(self.hass).async_load()
+        records = {item_id: self._to_record(data) for item_id, data in items.items()}
+        await self._async_execute(self._write_rows, records, ())
+        if records:
+            _LOGGER.info("Migrated %d alarms and reminders to SQLite storage", len(records))
+
+    async def async_load(self) -> Dict[str, AlarmReminderItem]:
+        """Load items from storage."""
+        try:
+            async with self._lock:
+                await self._async_migrate()
+                self._records = await self._async_execute(
+                    self._read_records, "SELECT item_id, data FROM items"
+                )
+            return {
+                item_id: self._from_record(item_id, record)
+                for item_id, record in self._records.items()
+            }
+        except Exception as err:
+            _LOGGER.error("Error loading from storage: %s", err, exc_info=True)
+            return {}
+
+    async def async_save(self, items: Dict[str, AlarmReminderItem]) -> None:
+        """Replace the stored items."""
+        try:
+            records = {item_id: self._to_record(data) for item_id, data in items.items()}
+            async with self._lock:
+                await self._async_execute(self._write_rows, records, (), True)
+            self._records = records
+            self.write_count += 1
+        except Exception as err:
+            _LOGGER.error("Error saving to storage: %s", err, exc_info=True)
+
+    async def _async_write_changes(
+        self, items: Dict[str, AlarmReminderItem], item_ids: Iterable[str]
+    ) -> None:
+        """Upsert changed items and delete removed ones in one transaction."""
+        try:
+            records = {}
+            deleted = []
+            for item_id in item_ids:
+                if item_id in items:
+                    records[item_id] = self._to_record(items[item_id])
+                else:
+                    deleted.append(item_id)
+            async with self._lock:
+                await self._async_execute(self._write_rows, records, deleted)
+            self._apply_records(records, deleted)
+            self.write_count += 1
+        except Exception as err:
+            _LOGGER.error("Error saving to storage: %s", err, exc_info=True)
+
+    async def async_update_item(self, item_id: str, data: AlarmReminderItem) -> None:
+        """Update a single item in storage."""
+        try:
+            records = {item_id: self._to_record(data)}
+            async with self._lock:
+                await self._async_execute(self._write_rows, records, ())
+            self._apply_records(records, ())
+        except Exception as err:
+            _LOGGER.error("Error updating item in storage: %s", err, exc_info=True)
+
+    async def async_delete_item(self, item_id: str) -> None:
+        """Delete an item from storage."""
+        try:
+            async with self._lock:
+                await self._async_execute(self._write_rows, {}, [item_id])
+            self._apply_records({}, [item_id])
+        except Exception as err:
+            _LOGGER.error("Error deleting item from storage: %s", err, exc_info=True)
+
+    async def async_close(self) -> None:
+        """Close the database connection."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        async with self._lock:
+            if self._conn is not None:
+                await self.hass.async_add_executor_job(self._conn.close)
+                self._conn = None
@@ -1,27 +1,354 @@
 """Storage handling for Alarms and Reminders."""
+import hashlib
 import logging
-from typing import Dict, Any
+import os
+import re
+from typing import Callable, Dict, Any, Iterable, List, Optional, Tuple
 import json
 from pathlib import Path
 import asyncio
-import aiofiles
 
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.json import JSONEncoder, json_bytes
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 from datetime import datetime
 
+from .const import DEFAULT_SAVE_DELAY, STORAGE_BACKEND_SQLITE
+from .model import AlarmReminderItem
+
 _LOGGER = logging.getLogger(__name__)
 
-class AlarmReminderStorage:
-    """Class to handle storage of alarms and reminders."""
+STATUSES = ["active", "scheduled", "stopped"]
+
+# Fields a "status" journal record may carry instead of a full upsert
+STATUS_FIELDS = {"status", "last_stopped", "last_rescheduled_from"}
+
+# Fold the journal into the snapshot files once it grows past this size
+JOURNAL_COMPACT_BYTES = 256 * 1024
+
+# Snapshot files are written as {"checksum": <sha256 of data>, "data": ...}
+_ENVELOPE_PREFIX = re.compile(rb'\{"checksum":"([0-9a-f]{64})","data":')
+
+
+class CorruptStorageError(Exception):
+    """Raised when a snapshot file fails validation."""
+
+
+def _with_suffix(path: Path, suffix: str) -> Path:
+    """Return path with an extra suffix appended to its name."""
+    return path.with_name(path.name + suffix)
+
+
+def _encode_snapshot(data: Dict[str, Any]) -> bytes:
+    """Serialize snapshot data wrapped with its checksum."""
+    payload = json_bytes(data)
+    checksum = hashlib.sha256(payload).hexdigest().encode("ascii")
+    return b'{"checksum":"' + checksum + b'","data":' + payload + b"}"
+
+
+def _decode_snapshot(content: bytes) -> Dict[str, Any]:
+    """Parse snapshot file content, validating its checksum if present."""
+    match = _ENVELOPE_PREFIX.match(content)
+    if match is None:
+        # Files written before checksums were added
+        return json_loads(content)
+    payload = content[match.end():].rstrip()
+    if not payload.endswith(b"}"):
+        raise CorruptStorageError("snapshot is truncated")
+    payload = payload[:-1]
+    if hashlib.sha256(payload).hexdigest().encode("ascii") != match.group(1):
+        raise CorruptStorageError("checksum mismatch")
+    return json_loads(payload)
+
+
+def _read_snapshot(path: Path) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """Read a snapshot, falling back to older generations if it is damaged.
+
+    Returns the data (None if no snapshot exists) and whether a fallback
+    generation was used.
+    """
+    temp = _with_suffix(path, ".tmp")
+    candidates = [path] if path.exists() else [temp]
+    candidates.append(_with_suffix(path, ".bak"))
+
+    damaged = False
+    for index, candidate in enumerate(candidates):
+        if not candidate.exists():
+            continue
+        try:
+            data = _decode_snapshot(candidate.read_bytes())
+        except (ValueError, CorruptStorageError) as err:
+            _LOGGER.warning("Ignoring damaged storage file %s: %s", candidate, err)
+            damaged = True
+            continue
+        return data, index > 0 or candidate == temp
+
+    if damaged:
+        _LOGGER.error("No valid copy of %s could be loaded", path)
+    return None, False
+
+
+def _write_snapshot_files(snapshots: Dict[Path, Dict[str, Any]], journal: Path) -> None:
+    """Encode and atomically replace snapshot files, keeping the previous generation.
+
+    Each file is written to a temp file, fsynced and renamed over the live
+    file after the live file is moved to .bak. The journal folded into the
+    new snapshot becomes journal.bak, so .bak snapshots plus journal.bak
+    plus the live journal always describe the current state.
+    """
+    for path, data in snapshots.items():
+        content = _encode_snapshot(data)
+        temp = _with_suffix(path, ".tmp")
+        with open(temp, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.replace(path, _with_suffix(path, ".bak"))
+        os.replace(temp, path)
+
+    journal_backup = _with_suffix(journal, ".bak")
+    if journal.exists():
+        os.replace(journal, journal_backup)
+    elif journal_backup.exists():
+        journal_backup.unlink()
+
+    _fsync_dir(journal.parent)
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist renames within a directory."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _append_journal(journal: Path, records: List[Dict[str, Any]]) -> int:
+    """Append records to the journal with a single fsync for the batch.
+
+    Returns the number of bytes written.
+    """
+    payload = b"".join(json_bytes(record) + b"\n" for record in records)
+    with open(journal, "ab") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(payload)
+
 
-    def __init__(self, hass: HomeAssistant):
+def _read_journals(journals: List[Path]) -> Tuple[List[Dict[str, Any]], int]:
+    """Return parsed journal records in replay order and the size of the live journal."""
+    records: List[Dict[str, Any]] = []
+    size = 0
+    for journal in journals:
+        if not journal.exists():
+            continue
+        content = journal.read_bytes()
+        if journal == journals[-1]:
+            size = len(content)
+        for line_number, line in enumerate(content.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json_loads(line))
+            except ValueError as err:
+                _LOGGER.warning(
+                    "Skipping unreadable record on line %d of %s: %s",
+                    line_number,
+                    journal.name,
+                    err
+                )
+    return records, size
+
+
+def _write_export(path: Path, data: Dict[str, Any]) -> None:
+    """Write an indented, human-readable copy of the stored items."""
+    path.write_text(json.dumps(data, cls=JSONEncoder, indent=4), encoding="utf-8")
+
+
+def _organize(records: Iterable[Tuple[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """Group stored records by item type and status."""
+    organized: Dict[str, Dict[str, Any]] = {
+        "alarms": {status: {} for status in STATUSES},
+        "reminders": {status: {} for status in STATUSES},
+    }
+    for item_id, record in records:
+        item_type = "alarms" if record.get("is_alarm") else "reminders"
+        status = record.get("status", "scheduled")
+        organized[item_type].setdefault(status, {})[item_id] = record
+    return organized
+
+
+class BaseItemStorage:
+    """Common interface and delayed-save handling for storage backends."""
+
+    def __init__(self, hass: HomeAssistant, save_delay: float = DEFAULT_SAVE_DELAY):
         """Initialize storage."""
         self.hass = hass
+        self.save_delay = save_delay
+        self._lock = asyncio.Lock()
+        self._data_func: Optional[Callable[[], Dict[str, AlarmReminderItem]]] = None
+        self._dirty: set = set()
+        self._dirty_all = False
+        self._unsub_delay: Optional[CALLBACK_TYPE] = None
+        self._unsub_stop: Optional[CALLBACK_TYPE] = None
+        self.write_count = 0
+
+    async def async_load(self) -> Dict[str, AlarmReminderItem]:
+        """Load items from storage."""
+        raise NotImplementedError
+
+    async def async_save(self, items: Dict[str, AlarmReminderItem]) -> None:
+        """Replace the stored items."""
+        raise NotImplementedError
+
+    async def async_update_item(self, item_id: str, data: AlarmReminderItem) -> None:
+        """Update a single item in storage."""
+        raise NotImplementedError
+
+    async def async_delete_item(self, item_id: str) -> None:
+        """Delete an item from storage."""
+        raise NotImplementedError
+
+    async def _async_write_changes(
+        self, items: Dict[str, AlarmReminderItem], item_ids: Iterable[str]
+    ) -> None:
+        """Persist the named items, deleting those no longer in items."""
+        raise NotImplementedError
+
+    async def async_close(self) -> None:
+        """Release resources held by the backend."""
+
+    def get_item(self, item_id: str) -> Optional[AlarmReminderItem]:
+        """Return a copy of a stored item, or None if it is not stored."""
+        raise NotImplementedError
+
+    def _iter_records(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        """Return (item_id, record) pairs for every stored item."""
+        raise NotImplementedError
+
+    async def async_export(self, path: Path) -> int:
+        """Write a human-readable copy of the stored items, grouped by type and status.
+
+        Returns the number of items written.
+        """
+        records = list(self._iter_records())
+        await self.hass.async_add_executor_job(_write_export, path, _organize(records))
+        return len(records)
+
+    async def async_resync(self) -> Dict[str, AlarmReminderItem]:
+        """Write pending changes and reload every item from disk."""
+        await self.async_flush()
+        return await self.async_load()
+
+    @callback
+    def async_delay_save(
+        self,
+        data_func: Callable[[], Dict[str, AlarmReminderItem]],
+        item_ids: Optional[Iterable[str]] = None,
+        delay: Optional[float] = None,
+    ) -> None:
+        """Save changed items once no further changes arrive for the quiet window.
+
+        item_ids names the items that were added, changed or removed; without
+        it the whole store is rewritten. Every call restarts the window, so a
+        burst of mutations results in a single write.
+        """
+        self._data_func = data_func
+        if item_ids is None:
+            self._dirty_all = True
+        else:
+            self._dirty.update(item_ids)
+        self._async_cancel_delay()
+        self._unsub_delay = async_call_later(
+            self.hass,
+            self.save_delay if delay is None else delay,
+            self._async_delayed_write,
+        )
+        if self._unsub_stop is None:
+            self._unsub_stop = self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP, self._async_stop_write
+            )
+
+    @property
+    def dirty(self) -> bool:
+        """Return True if a delayed save is pending."""
+        return self._data_func is not None
+
+    async def async_flush(self) -> None:
+        """Write a pending delayed save immediately."""
+        self._async_cancel_delay()
+        if self._unsub_stop is not None:
+            self._unsub_stop()
+            self._unsub_stop = None
+        if self._data_func is None:
+            return
+        items = self._data_func()
+        dirty, dirty_all = self._dirty, self._dirty_all
+        self._data_func = None
+        self._dirty = set()
+        self._dirty_all = False
+
+        if dirty_all:
+            await self.async_save(items)
+        else:
+            await self._async_write_changes(items, dirty)
+
+    @callback
+    def _async_cancel_delay(self) -> None:
+        """Cancel the pending delayed write timer."""
+        if self._unsub_delay is not None:
+            self._unsub_delay()
+            self._unsub_delay = None
+
+    async def _async_delayed_write(self, _now: datetime) -> None:
+        """Write once the quiet window has passed."""
+        self._unsub_delay = None
+        await self.async_flush()
+
+    async def _async_stop_write(self, _event: Event) -> None:
+        """Flush pending changes when Home Assistant stops."""
+        self._unsub_stop = None
+        await self.async_flush()
+        await self.async_close()
+
+    @staticmethod
+    def _to_record(item: AlarmReminderItem) -> Dict[str, Any]:
+        """Return the JSON-ready record stored for an item."""
+        return item.to_storage()
+
+    @staticmethod
+    def _from_record(item_id: str, record: Dict[str, Any]) -> AlarmReminderItem:
+        """Return an item from its stored record."""
+        return AlarmReminderItem.from_storage(item_id, record)
+
+
+class AlarmReminderStorage(BaseItemStorage):
+    """Class to handle storage of alarms and reminders.
+
+    The alarms and reminders files hold a snapshot of every item. Changes
+    made after the snapshot are appended to a journal as one NDJSON record
+    per item, and the journal is folded back into the snapshot once it
+    passes JOURNAL_COMPACT_BYTES.
+    """
+
+    def __init__(self, hass: HomeAssistant, save_delay: float = DEFAULT_SAVE_DELAY):
+        """Initialize storage."""
+        super().__init__(hass, save_delay)
         self.storage_dir = Path(hass.config.path(".storage"))
         self.alarms_file = self.storage_dir / "alarms_and_reminders.alarms.json"
         self.reminders_file = self.storage_dir / "alarms_and_reminders.reminders.json"
+        self.journal_file = self.storage_dir / "alarms_and_reminders.journal"
         self._items = {
             "alarms": {
                 "active": {},
@@ -34,108 +361,231 @@ class AlarmReminderStorage:
                 "stopped": {}
             }
         }
-        self._lock = asyncio.Lock()
+        # item_id -> status bucket in _items holding it
+        self._locations: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._journal_bytes = 0
+        self._compact_task: Optional[asyncio.Task] = None
+
+    async def _async_write_changes(
+        self, items: Dict[str, AlarmReminderItem], item_ids: Iterable[str]
+    ) -> None:
+        """Append a journal record for each changed item."""
+        try:
+            async with self._lock:
+                records = []
+                for item_id in item_ids:
+                    record = self._apply_change(item_id, items.get(item_id))
+                    if record is not None:
+                        records.append(record)
+                await self._async_append(records)
+        except Exception as err:
+            _LOGGER.error("Error saving to storage: %s", err, exc_info=True)
+
+    async def async_close(self) -> None:
+        """Wait for a running compaction to finish."""
+        if self._compact_task is not None:
+            await self._compact_task
+
+    @callback
+    def get_item(self, item_id: str) -> Optional[AlarmReminderItem]:
+        """Return a copy of a stored item, or None if it is not stored."""
+        bucket = self._locations.get(item_id)
+        if bucket is None:
+            return None
+        return self._from_record(item_id, bucket[item_id])
+
+    def _iter_records(self) -> Iterable[Tuple[str, Dict[str, Any]]]:
+        """Return (item_id, record) pairs for every stored item."""
+        return ((item_id, bucket[item_id]) for item_id, bucket in self._locations.items())
+
+    def _find(self, item_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Return the status bucket currently holding an item."""
+        return self._locations.get(item_id)
+
+    def _reindex(self) -> None:
+        """Rebuild the item location index from the snapshot image."""
+        self._locations = {
+            item_id: bucket
+            for item_type in ("alarms", "reminders")
+            for bucket in self._items[item_type].values()
+            for item_id in bucket
+        }
+
+    def _place(self, item_id: str, record: Dict[str, Any]) -> None:
+        """Put a stored record into its type and status bucket."""
+        self._remove(item_id)
+        item_type = "alarms" if record.get("is_alarm") else "reminders"
+        status = record.get("status", "scheduled")
+        bucket = self._items[item_type].setdefault(status, {})
+        bucket[item_id] = record
+        self._locations[item_id] = bucket
+
+    def _remove(self, item_id: str) -> bool:
+        """Remove an item from the snapshot image."""
+        bucket = self._locations.pop(item_id, None)
+        if bucket is None:
+            return False
+        del bucket[item_id]
+        return True
+
+    def _apply_change(
+        self, item_id: str, data: Optional[AlarmReminderItem]
+    ) -> Optional[Dict[str, Any]]:
+        """Apply an item change to the snapshot image and return its journal record."""
+        bucket = self._find(item_id)
+        previous = bucket.get(item_id) if bucket is not None else None
+
+        if data is None:
+            if not self._remove(item_id):
+                return None
+            return {"op": "delete", "id": item_id}
+
+        record = self._to_record(data)
+        if previous == record:
+            return None
+
+        self._place(item_id, record)
+        if previous is not None and previous.keys() == record.keys():
+            changed = {key for key in record if previous[key] != record[key]}
+            if changed <= STATUS_FIELDS:
+                return {
+                    "op": "status",
+                    "id": item_id,
+                    "fields": {key: record[key] for key in changed},
+                }
+        return {"op": "upsert", "id": item_id, "data": record}
 
-    async def async_load(self) -> Dict[str, Dict[str, Any]]:
+    def _replay(self, record: Dict[str, Any]) -> None:
+        """Apply a journal record read at startup to the snapshot image."""
+        item_id = record["id"]
+        if record["op"] == "upsert":
+            self._place(item_id, record["data"])
+        elif record["op"] == "delete":
+            self._remove(item_id)
+        elif record["op"] == "status":
+            bucket = self._find(item_id)
+            if bucket is not None:
+                stored = dict(bucket[item_id])
+                stored.update(record["fields"])
+                self._place(item_id, stored)
+
+    async def _async_append(self, records: List[Dict[str, Any]]) -> None:
+        """Append records to the journal, compacting it once it is large."""
+        if not records:
+            return
+        self._journal_bytes += await self.hass.async_add_executor_job(
+            _append_journal, self.journal_file, records
+        )
+        self.write_count += 1
+        self._async_schedule_compaction()
+
+    @callback
+    def _async_schedule_compaction(self) -> None:
+        """Start a background compaction once the journal passes its threshold."""
+        if self._journal_bytes < JOURNAL_COMPACT_BYTES:
+            return
+        if self._compact_task is not None and not self._compact_task.done():
+            return
+        self._compact_task = self.hass.async_create_background_task(
+            self._async_compact(), "alarms_and_reminders storage compaction"
+        )
+
+    async def _async_compact(self) -> None:
+        """Fold the journal into new snapshot files."""
+        try:
+            async with self._lock:
+                await self._async_write_snapshot()
+            _LOGGER.debug("Compacted alarms and reminders journal")
+        except Exception as err:
+            _LOGGER.error("Error compacting storage journal: %s", err, exc_info=True)
+
+    async def _async_write_snapshot(self) -> None:
+        """Write the snapshot image to the snapshot files and reset the journal."""
+        # Encoded in the executor; the image only changes under the lock
+        snapshots = {
+            self.alarms_file: self._items["alarms"],
+            self.reminders_file: self._items["reminders"],
+        }
+        await self.hass.async_add_executor_job(
+            _write_snapshot_files, snapshots, self.journal_file
+        )
+        self._journal_bytes = 0
+        self.write_count += 1
+
+    async def async_load(self) -> Dict[str, AlarmReminderItem]:
         """Load items from storage."""
         try:
             async with self._lock:
                 flattened_items = {}
-                
-                # Load alarms
-                if self.alarms_file.exists():
-                    async with aiofiles.open(self.alarms_file, 'r') as f:
-                        content = await f.read()
-                        alarms_data = json.loads(content)
-                        
-                        # Ensure all status categories exist
-                        for status in ["active", "scheduled", "stopped"]:
-                            if status not in alarms_data:
-                                alarms_data[status] = {}
-                        
-                        self._items["alarms"] = alarms_data
-                        # Flatten active items for coordinator
-                        for status in ["active", "scheduled", "stopped"]:
-                            flattened_items.update(alarms_data[status])
-
-                # Load reminders
-                if self.reminders_file.exists():
-                    async with aiofiles.open(self.reminders_file, 'r') as f:
-                        content = await f.read()
-                        reminders_data = json.loads(content)
-                        
-                        # Ensure all status categories exist
-                        for status in ["active", "scheduled", "stopped"]:
-                            if status not in reminders_data:
-                                reminders_data[status] = {}
-                        
-                        self._items["reminders"] = reminders_data
-                        # Flatten active items for coordinator
-                        for status in ["active", "scheduled", "stopped"]:
-                            flattened_items.update(reminders_data[status])
-
-                # Convert datetime strings to objects
-                for item_id, data in flattened_items.items():
-                    if "scheduled_time" in data:
-                        data["scheduled_time"] = dt_util.parse_datetime(data["scheduled_time"])
-
-                return flattened_items
+                used_fallback = False
+
+                # Load alarms and reminders snapshots
+                for item_type, path in (
+                    ("alarms", self.alarms_file),
+                    ("reminders", self.reminders_file),
+                ):
+                    data, fallback = await self.hass.async_add_executor_job(
+                        _read_snapshot, path
+                    )
+                    used_fallback |= fallback
+                    if data is None:
+                        continue
+
+                    # Ensure all status categories exist
+                    for status in STATUSES:
+                        if status not in data:
+                            data[status] = {}
+
+                    self._items[item_type] = data
+                self._reindex()
+
+                # Replay changes made since the snapshot; an older snapshot
+                # generation also needs the journal it was compacted with
+                journals = [self.journal_file]
+                if used_fallback:
+                    _LOGGER.warning("Recovered alarms and reminders from backup storage files")
+                    journals.insert(0, _with_suffix(self.journal_file, ".bak"))
+                records, self._journal_bytes = await self.hass.async_add_executor_job(
+                    _read_journals, journals
+                )
+                for record in records:
+                    try:
+                        self._replay(record)
+                    except (KeyError, TypeError) as err:
+                        _LOGGER.warning("Skipping invalid journal record %s: %s", record, err)
+
+                # Flatten items for coordinator
+                for item_id, bucket in self._locations.items():
+                    flattened_items[item_id] = self._from_record(item_id, bucket[item_id])
+
+            self._async_schedule_compaction()
+            return flattened_items
 
         except Exception as err:
             _LOGGER.error("Error loading from storage: %s", err, exc_info=True)
             return {}
 
-    async def async_save(self, items: Dict[str, Dict[str, Any]]) -> None:
+    async def async_save(self, items: Dict[str, AlarmReminderItem]) -> None:
         """Save items to storage with proper organization."""
         try:
             async with self._lock:
                 # Organize items by type and status
-                organized = {
-                    "alarms": {
-                        "active": {},
-                        "scheduled": {},
-                        "stopped": {}
-                    },
-                    "reminders": {
-                        "active": {},
-                        "scheduled": {},
-                        "stopped": {}
-                    }
-                }
-
-                for item_id, data in items.items():
-                    # Create a copy for storage
-                    storage_data = dict(data)
-                    
-                    # Convert datetime to string
-                    if "scheduled_time" in storage_data:
-                        if isinstance(storage_data["scheduled_time"], datetime):
-                            storage_data["scheduled_time"] = storage_data["scheduled_time"].isoformat()
-                    
-                    # Sort into correct category
-                    item_type = "alarms" if data.get("is_alarm") else "reminders"
-                    status = data.get("status", "scheduled")
-                    organized[item_type][status][item_id] = storage_data
-
-                # Save alarms
-                async with aiofiles.open(self.alarms_file, 'w') as f:
-                    await f.write(json.dumps(organized["alarms"], cls=JSONEncoder, indent=4))
-
-                # Save reminders
-                async with aiofiles.open(self.reminders_file, 'w') as f:
-                    await f.write(json.dumps(organized["reminders"], cls=JSONEncoder, indent=4))
-
-                self._items = organized
+                self._items = _organize(
+                    (item_id, self._to_record(data)) for item_id, data in items.items()
+                )
+                self._reindex()
+                await self._async_write_snapshot()
 
         except Exception as err:
             _LOGGER.error("Error saving to storage: %s", err, exc_info=True)
 
-    async def async_update_item(self, item_id: str, data: Dict[str, Any]) -> None:
+    async def async_update_item(self, item_id: str, data: AlarmReminderItem) -> None:
         """Update a single item in storage."""
         try:
             async with self._lock:
-                self._items[item_id] = data
-                await self.async_save(self._items)
+                record = self._apply_change(item_id, data)
+                if record is not None:
+                    await self._async_append([record])
         except Exception as err:
             _LOGGER.error("Error updating item in storage: %s", err, exc_info=True)
 
@@ -143,9 +593,9 @@ class AlarmReminderStorage:
         """Delete an item from storage."""
         try:
             async with self._lock:
-                if item_id in self._items:
-                    del self._items[item_id]
-                    await self.async_save(self._items)
+                record = self._apply_change(item_id, None)
+                if record is not None:
+                    await self._async_append([record])
         except Exception as err:
             _LOGGER.error("Error deleting item from storage: %s", err, exc_info=True)
 
@@ -208,4 +658,14 @@ class AlarmReminderStorage:
                 )
 
         except Exception as err:
-            _LOGGER.error("Error loading items: %s", err, exc_info=True)
\ No newline at end of file
+            _LOGGER.error("Error loading items: %s", err, exc_info=True)
+
+def create_storage(
+    hass: HomeAssistant, backend: str, save_delay: float = DEFAULT_SAVE_DELAY
+) -> BaseItemStorage:
+    """Return the storage backend selected in the integration options."""
+    if backend == STORAGE_BACKEND_SQLITE:
+        from .sqlite_storage import SqliteAlarmReminderStorage
+
+        return SqliteAlarmReminderStorage(hass, save_delay)
+    return AlarmReminderStorage(hass, save_delay)
@@ -0,0 +1,66 @@
+"""Websocket API for Alarms and Reminders."""
+import logging
+from typing import Any, Dict
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+
+from .const import DEFAULT_LIST_LIMIT, DOMAIN, MAX_LIST_LIMIT
+from .coordinator import InvalidCursorError
+from .model import ItemStatus
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_setup_websocket(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_items)
+    websocket_api.async_register_command(hass, websocket_item)
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): f"{DOMAIN}/items",
+    vol.Optional("item_type"): vol.In(("alarm", "reminder")),
+    vol.Optional("status"): vol.All(cv.ensure_list, [vol.In(list(ItemStatus))]),
+    vol.Optional("limit", default=DEFAULT_LIST_LIMIT): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_LIST_LIMIT)
+    ),
+    vol.Optional("cursor"): str,
+})
+@callback
+def websocket_items(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> None:
+    """Return one page of items in scheduled time order."""
+    coordinator = hass.data[DOMAIN]["coordinator"]
+    try:
+        page = coordinator.list_items(
+            is_alarm=msg["item_type"] == "alarm" if "item_type" in msg else None,
+            statuses=msg.get("status"),
+            limit=msg["limit"],
+            cursor=msg.get("cursor"),
+        )
+    except InvalidCursorError:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, "Invalid cursor")
+        return
+    connection.send_result(msg["id"], page)
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): f"{DOMAIN}/item",
+    vol.Required("item_id"): str,
+})
+@callback
+def websocket_item(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: Dict[str, Any]
+) -> None:
+    """Return all details of one item."""
+    item = hass.data[DOMAIN]["coordinator"].get_item(msg["item_id"])
+    if item is None:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, "Item not found")
+        return
+    connection.send_result(msg["id"], {"item_id": item.item_id, **item.to_storage()})
@@ -1,7 +1,13 @@
 """Common fixtures for testing."""
 import os
 import pytest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+
+from custom_components import alarms_and_reminders
+from custom_components.alarms_and_reminders.const import DOMAIN
+from custom_components.alarms_and_reminders.coordinator import AlarmAndReminderCoordinator
 
 pytest_plugins = "pytest_homeassistant_custom_component"
 
@@ -25,6 +31,33 @@ async def auto_enable_custom_integrations(hass):
     yield
 
 
+@pytest.fixture
+async def coordinator(hass: HomeAssistant, tmp_path) -> AlarmAndReminderCoordinator:
+    """Return a coordinator storing items in a temporary config directory."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    announcer = MagicMock()
+    announcer.announce_on_satellite = AsyncMock()
+    media_handler = MagicMock(alarm_sound="birds.mp3", reminder_sound="ringtone.mp3")
+    coordinator = AlarmAndReminderCoordinator(hass, media_handler, announcer)
+    await coordinator.async_load_items()
+    yield coordinator
+    coordinator.async_shutdown()
+    await coordinator.storage.async_flush()
+
+
+@pytest.fixture
+async def integration(hass: HomeAssistant, tmp_path) -> AlarmAndReminderCoordinator:
+    """Set up the integration and its services in a temporary config directory."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    assert await alarms_and_reminders.async_setup(hass, {})
+    coordinator = hass.data[DOMAIN]["coordinator"]
+    yield coordinator
+    coordinator.async_shutdown()
+    await coordinator.storage.async_flush()
+
+
 async def async_setup(hass, config):
     hass.data[DOMAIN] = {}
     return True
\ No newline at end of file
@@ -0,0 +1,48 @@
+"""Test the alarms and reminders calendar."""
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.util import dt as dt_util
+
+from custom_components.alarms_and_reminders.calendar import AlarmsAndRemindersCalendar
+from custom_components.alarms_and_reminders.const import DOMAIN
+
+
+def _set_alarm(when: datetime, **data) -> ServiceCall:
+    return ServiceCall(DOMAIN, "set_alarm", {"time": when.time(), "date": when.date(), **data})
+
+
+async def test_events_expand_repeating_items(hass: HomeAssistant, coordinator) -> None:
+    """Test range queries return one-off rings and expanded repeats in time order."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    start = dt_util.start_of_local_day() + timedelta(days=1)
+    daily = await coordinator.schedule_item(
+        _set_alarm(start + timedelta(hours=7), name="Wake", repeat="daily"), True, target
+    )
+    once = await coordinator.schedule_item(_set_alarm(start + timedelta(days=1, hours=9)), True, target)
+    later = await coordinator.schedule_item(_set_alarm(start + timedelta(days=10)), True, target)
+    await coordinator.stop_item(later, True)
+    calendar = AlarmsAndRemindersCalendar(coordinator, is_alarm=True)
+
+    events = await calendar.async_get_events(hass, start, start + timedelta(days=3))
+    assert [(event.uid, event.start) for event in events] == [
+        (daily, start + timedelta(hours=7)),
+        (daily, start + timedelta(days=1, hours=7)),
+        (once, start + timedelta(days=1, hours=9)),
+        (daily, start + timedelta(days=2, hours=7)),
+    ]
+    assert events[0].summary == "Wake"
+    assert events[2].recurrence_id is None
+
+    events = await calendar.async_get_events(
+        hass, start + timedelta(days=5), start + timedelta(days=20)
+    )
+    assert {event.uid for event in events} == {daily}
+    assert len(events) == 15
+    assert calendar.event.start == start + timedelta(hours=7)
+
+    await coordinator.stop_item(daily, True)
+    assert calendar.event.uid == once
+    assert await AlarmsAndRemindersCalendar(coordinator, is_alarm=False).async_get_events(
+        hass, start, start + timedelta(days=3)
+    ) == []
@@ -0,0 +1,196 @@
+"""Test the alarms and reminders coordinator."""
+import asyncio
+from datetime import time, timedelta
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import async_capture_events
+
+from custom_components.alarms_and_reminders.announcer import signal_stopped
+from custom_components.alarms_and_reminders.const import DOMAIN
+from custom_components.alarms_and_reminders.coordinator import STOP_ACK_TIMEOUT
+from custom_components.alarms_and_reminders.model import ItemStatus
+
+
+def _set_alarm(hass: HomeAssistant, **data) -> ServiceCall:
+    when = dt_util.now() + timedelta(hours=1)
+    return ServiceCall(DOMAIN, "set_alarm", {"time": when.time().replace(microsecond=0), **data})
+
+
+async def test_schedule_stop_and_delete(hass: HomeAssistant, coordinator) -> None:
+    """Test an alarm moves through its lifecycle and the indexes follow."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    item_id = await coordinator.schedule_item(_set_alarm(hass), True, target)
+    assert item_id == "alarm_1"
+    assert coordinator.count_items(True, (ItemStatus.SCHEDULED,)) == 1
+    await hass.async_block_till_done()
+    state = hass.states.get(f"{DOMAIN}.alarm_1")
+    assert state.state == "scheduled"
+    # Only the fields that change over an item's life are recorded
+    recorded = set(state.attributes) - state.state_info["unrecorded_attributes"]
+    assert recorded == {"scheduled_time", "name", "friendly_name", "icon"}
+
+    await coordinator.stop_item("alarm_1", True)
+    item = coordinator._active_items["alarm_1"]
+    assert item.status is ItemStatus.STOPPED
+    assert coordinator.count_items(True, (ItemStatus.SCHEDULED,)) == 0
+    assert "alarm_1" not in coordinator.scheduler
+
+    await coordinator.delete_item("alarm_1", True)
+    assert coordinator.count_items(True, (ItemStatus.STOPPED,)) == 0
+    assert await coordinator.schedule_item(_set_alarm(hass), True, target) == "alarm_1"
+
+
+async def test_trigger_announces_and_stop_rearms_repeating(hass: HomeAssistant, coordinator) -> None:
+    """Test a triggered repeating alarm rings and moves on when stopped."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    item_id = await coordinator.schedule_item(_set_alarm(hass, repeat="daily"), True, target)
+    first_time = coordinator._active_items[item_id].scheduled_time
+
+    async def _ring_until_stopped(stop_event, **kwargs) -> None:
+        await stop_event.wait()
+
+    coordinator.announcer.announce_on_satellite.side_effect = _ring_until_stopped
+    coordinator.scheduler.cancel(item_id)
+    coordinator._async_fire_item(item_id)
+    await asyncio.sleep(0)
+    coordinator.announcer.announce_on_satellite.assert_awaited_once()
+    assert coordinator.count_items(True, (ItemStatus.ACTIVE,)) == 1
+
+    await coordinator.stop_item(item_id, True)
+    item = coordinator._active_items[item_id]
+    assert item.status is ItemStatus.SCHEDULED
+    assert item.scheduled_time == first_time + timedelta(days=1)
+    assert item_id in coordinator.scheduler
+
+
+async def test_stop_waits_for_playback_to_acknowledge(hass: HomeAssistant, coordinator) -> None:
+    """Test stopping returns once playback has torn down, not after a fixed sleep."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    item_id = await coordinator.schedule_item(_set_alarm(hass), True, target)
+    torn_down = asyncio.Event()
+
+    async def _ring_until_stopped(stop_event, stopped, **kwargs) -> None:
+        await stop_event.wait()
+        await asyncio.sleep(0)
+        torn_down.set()
+        signal_stopped(stopped)
+
+    coordinator.announcer.announce_on_satellite.side_effect = _ring_until_stopped
+    coordinator.scheduler.cancel(item_id)
+    coordinator._async_fire_item(item_id)
+    await asyncio.sleep(0)
+    assert coordinator.registry_counts["playback_sessions"] == 1
+
+    await asyncio.wait_for(coordinator.stop_item(item_id, True), STOP_ACK_TIMEOUT)
+    assert torn_down.is_set()
+    await hass.async_block_till_done()
+    assert coordinator.registry_counts["playback_sessions"] == 0
+    assert coordinator.registry_counts["trigger_tasks"] == 0
+
+
+async def test_stop_and_delete_all_in_one_batch(hass: HomeAssistant, coordinator) -> None:
+    """Test batch stop and delete tear items down together with one sensor refresh."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    item_ids = [await coordinator.schedule_item(_set_alarm(hass), True, target) for _ in range(3)]
+    reminder_id = await coordinator.schedule_item(_set_alarm(hass, name="pills"), False, target)
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, f"{DOMAIN}_state_changed")
+
+    await coordinator.stop_all_items(True)
+    await hass.async_block_till_done()
+    assert len(events) == 1
+    assert coordinator.count_items(True, (ItemStatus.STOPPED,)) == 3
+    assert coordinator.count_items(False, (ItemStatus.SCHEDULED,)) == 1
+    assert all(hass.states.get(f"{DOMAIN}.{item_id}").state == "stopped" for item_id in item_ids)
+
+    await coordinator.delete_all_items(True)
+    await hass.async_block_till_done()
+    assert len(events) == 2
+    assert list(coordinator._active_items) == [reminder_id]
+    assert hass.states.get(f"{DOMAIN}.{item_ids[0]}") is None
+    assert await coordinator.schedule_item(_set_alarm(hass), True, target) == "alarm_1"
+
+
+async def test_burst_of_changes_publishes_once(hass: HomeAssistant, coordinator) -> None:
+    """Test a burst of item changes coalesces into one state write per item and one event."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    events = async_capture_events(hass, f"{DOMAIN}_state_changed")
+    item_ids = [await coordinator.schedule_item(_set_alarm(hass), True, target) for _ in range(250)]
+    for item_id in item_ids:
+        await coordinator.stop_item(item_id, True)
+    assert coordinator.publisher.pending == 250
+
+    await hass.async_block_till_done()
+    assert coordinator.publisher.flush_count == 1
+    assert len(events) == 1
+    assert events[0].data["item_ids"] == item_ids
+    assert hass.states.get(f"{DOMAIN}.{item_ids[-1]}").state == "stopped"
+
+
+async def test_item_entities_follow_items(hass: HomeAssistant, coordinator) -> None:
+    """Test items own registered entities that only write when they change."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    registry = er.async_get(hass)
+    orphan = registry.async_get_or_create(DOMAIN, DOMAIN, "alarm_9", suggested_object_id="alarm_9")
+    # Left by the registry at startup for entries without an entity
+    hass.states.async_set(orphan.entity_id, "unavailable", {"restored": True})
+    item_id = await coordinator.schedule_item(_set_alarm(hass, name="Wake up"), True, target)
+    await hass.async_block_till_done()
+    entity_id = registry.async_get_entity_id(DOMAIN, DOMAIN, item_id)
+    assert entity_id == f"{DOMAIN}.{item_id}"
+    assert hass.states.get(entity_id).name == "Wake up"
+    writes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    coordinator._async_publish(item_id)
+    await hass.async_block_till_done()
+    assert writes == []
+    await coordinator.stop_item(item_id, True)
+    await hass.async_block_till_done()
+    assert [event.data["new_state"].state for event in writes] == ["stopped"]
+
+    # Reloading restores entities from storage and drops registry orphans
+    await coordinator.storage.async_flush()
+    await coordinator.async_load_items()
+    await hass.async_block_till_done()
+    assert registry.async_get(orphan.entity_id) is None
+    assert hass.states.get(orphan.entity_id) is None
+    assert hass.states.get(entity_id).state == "stopped"
+
+    await coordinator.delete_item(item_id, True)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id) is None
+    assert registry.async_get(entity_id) is None
+
+
+def _next_saturday():
+    today = dt_util.now().date()
+    return today + timedelta(days=(5 - today.weekday()) % 7 or 7)
+
+
+async def test_edit_time_snaps_to_repeat_rule(hass: HomeAssistant, coordinator) -> None:
+    """Test an edited weekdays alarm moves off a day its rule excludes."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    item_id = await coordinator.schedule_item(_set_alarm(hass, repeat="weekdays"), True, target)
+    saturday = _next_saturday()
+
+    await coordinator.edit_item(item_id, {"time": time(7, 0), "date": saturday}, True)
+    item = coordinator._active_items[item_id]
+    assert item.scheduled_time.date() == saturday + timedelta(days=2)
+    assert item.scheduled_time.time() == time(7, 0)
+    assert coordinator.scheduler.next_fire_time == item.scheduled_time
+
+
+async def test_reschedule_snaps_to_repeat_rule(hass: HomeAssistant, coordinator) -> None:
+    """Test a rescheduled weekdays alarm moves off a day its rule excludes."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    item_id = await coordinator.schedule_item(_set_alarm(hass, repeat="weekdays"), True, target)
+    saturday = _next_saturday()
+
+    await coordinator.reschedule_item(item_id, {"time": time(7, 0), "date": saturday}, True)
+    item = coordinator._active_items[item_id]
+    assert item.scheduled_time.date() == saturday + timedelta(days=2)
+    assert item.scheduled_time.time() == time(7, 0)
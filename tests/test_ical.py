@@ -0,0 +1,94 @@
+"""Test iCalendar import and export."""
+import io
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.alarms_and_reminders.ical import event_to_spec, iter_events, write_calendar
+from custom_components.alarms_and_reminders.model import AlarmReminderItem, Repeat
+
+CALENDAR = """BEGIN:VCALENDAR\r
+VERSION:2.0\r
+BEGIN:VTIMEZONE\r
+TZID:Europe/Berlin\r
+BEGIN:STANDARD\r
+DTSTART:19701025T030000\r
+END:STANDARD\r
+END:VTIMEZONE\r
+BEGIN:VEVENT\r
+UID:early@example.com\r
+DTSTART;TZID=Europe/Berlin:20200106T060000\r
+SUMMARY:Early shift\\, ward 3\r
+DESCRIPTION:Bring the\r
+  badge\r
+RRULE:FREQ=WEEKLY;BYDAY=MO,TU\r
+BEGIN:VALARM\r
+ACTION:AUDIO\r
+TRIGGER:-PT45M\r
+END:VALARM\r
+END:VEVENT\r
+BEGIN:VEVENT\r
+UID:old@example.com\r
+DTSTART:20200101T080000Z\r
+END:VEVENT\r
+END:VCALENDAR\r
+"""
+
+
+def test_parse_recurring_event_with_valarm() -> None:
+    """Test an old recurring event resumes at its next ring time."""
+    events = list(iter_events(io.StringIO(CALENDAR)))
+    assert [event["props"]["UID"][1] for event in events] == ["early@example.com", "old@example.com"]
+
+    now = dt_util.now()
+    spec = event_to_spec(events[0], now, {"type": "alarm", "satellite": "assist_satellite.bedroom"})
+    assert spec["name"] == "Early shift, ward 3"
+    assert spec["message"] == "Bring the badge"
+    assert spec["satellite"] == "assist_satellite.bedroom"
+    assert spec["rrule"] == "FREQ=WEEKLY;BYDAY=MO,TU"
+    ring = dt_util.as_local(dt_util.parse_datetime(f"{spec['date']}T{spec['time']}"))
+    ring_berlin = ring.astimezone(dt_util.get_time_zone("Europe/Berlin"))
+    assert ring > now
+    assert ring_berlin.weekday() in (0, 1)
+    assert (ring_berlin.hour, ring_berlin.minute) == (5, 15)
+
+    with pytest.raises(ValueError, match="past"):
+        event_to_spec(events[1], now, {"type": "alarm"})
+
+
+def test_export_round_trip() -> None:
+    """Test exported items parse back with their type, target and repeat."""
+    when = dt_util.now().replace(microsecond=0) + timedelta(days=1)
+    items = [
+        AlarmReminderItem(
+            item_id="alarm_1",
+            name="Wake up",
+            is_alarm=True,
+            scheduled_time=when,
+            satellite="assist_satellite.bedroom",
+            repeat=Repeat.WEEKDAYS,
+        ),
+        AlarmReminderItem(
+            item_id="pills",
+            name="Pills",
+            is_alarm=False,
+            scheduled_time=when,
+            message="Take the blue one; " + "x" * 80,
+            media_players=["media_player.den", "media_player.kitchen"],
+        ),
+    ]
+    file = io.StringIO()
+    assert write_calendar(file, items) == 2
+    assert all(len(line.encode()) <= 75 for line in file.getvalue().split("\r\n"))
+
+    file.seek(0)
+    specs = [event_to_spec(event, dt_util.now(), {"type": "alarm"}) for event in iter_events(file)]
+    assert specs[0]["type"] == "alarm"
+    assert specs[0]["rrule"] == "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR"
+    assert specs[0]["satellite"] == "assist_satellite.bedroom"
+    assert specs[1]["type"] == "reminder"
+    assert specs[1]["message"] == items[1].message
+    assert specs[1]["media_player"] == ["media_player.den", "media_player.kitchen"]
+    assert (specs[1]["date"], specs[1]["time"]) == (when.date().isoformat(), when.strftime("%H:%M:%S"))
@@ -0,0 +1,44 @@
+"""Test item ID allocation."""
+from custom_components.alarms_and_reminders.ids import IdAllocator
+
+
+def test_allocates_reuses_and_restores_ids() -> None:
+    """Test released numbers are reused lowest first and state round-trips."""
+    ids = IdAllocator()
+    assert [ids.allocate("alarm") for _ in range(4)] == [
+        "alarm_1", "alarm_2", "alarm_3", "alarm_4"
+    ]
+    assert ids.allocate("wake_up", taken={"wake_up_1"}) == "wake_up_2"
+
+    ids.release("alarm_3")
+    ids.release("alarm_2")
+    ids.release("not_numbered")
+    restored = IdAllocator.from_dict(ids.as_dict())
+    assert restored.allocate("alarm") == "alarm_2"
+    assert restored.allocate("alarm", taken={"alarm_3"}) == "alarm_5"
+
+    restored.observe("alarm_9")
+    assert restored.allocate("alarm") == "alarm_10"
+
+
+def test_forgets_prefix_once_every_number_is_released() -> None:
+    """Test a prefix starts from 1 again after all its IDs are released."""
+    ids = IdAllocator()
+    ids.allocate("gym")
+    ids.allocate("gym")
+    ids.release("gym_1")
+    ids.release("gym_2")
+    assert ids.as_dict() == {"high": {}, "free": {}}
+    assert ids.allocate("gym") == "gym_1"
+
+
+def test_double_release_is_ignored() -> None:
+    """Test releasing an ID twice does not free the prefix while IDs are in use."""
+    ids = IdAllocator()
+    ids.allocate("alarm")
+    ids.allocate("alarm")
+    ids.release("alarm_1")
+    ids.release("alarm_1")
+    assert ids.as_dict() == {"high": {"alarm": 2}, "free": {"alarm": [1]}}
+    assert ids.allocate("alarm") == "alarm_1"
+    assert ids.allocate("alarm") == "alarm_3"
@@ -0,0 +1,62 @@
+"""Test the coordinator item indexes."""
+from datetime import timedelta
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.alarms_and_reminders.index import ItemIndex, TimeIndex
+from custom_components.alarms_and_reminders.model import AlarmReminderItem, ItemStatus, Repeat
+
+
+def _item(item_id: str, name: str, is_alarm: bool, status: ItemStatus) -> AlarmReminderItem:
+    return AlarmReminderItem(item_id, name, is_alarm, dt_util.now(), status)
+
+
+def test_index_follows_item_changes() -> None:
+    """Test name and (type, status) lookups track updates and removals."""
+    index = ItemIndex()
+    index.rebuild(
+        {
+            "alarm_1": _item("alarm_1", "Wake Up", True, ItemStatus.SCHEDULED),
+            "alarm_2": _item("alarm_2", "gym", True, ItemStatus.STOPPED),
+            "reminder_1": _item("reminder_1", "Pills", False, ItemStatus.SCHEDULED),
+        }
+    )
+
+    assert index.find_by_name("wake_up") == "alarm_1"
+    assert index.count(True, ("scheduled", "active")) == 1
+    assert index.ids(False, ("scheduled",)) == ["reminder_1"]
+
+    index.update("alarm_2", _item("alarm_2", "Gym", True, ItemStatus.ACTIVE))
+    assert index.ids(True, ("scheduled", "active")) == ["alarm_1", "alarm_2"]
+    assert index.count(True, ("stopped",)) == 0
+
+    index.update("alarm_1", _item("alarm_1", "Early", True, ItemStatus.SCHEDULED))
+    assert index.find_by_name("Wake Up") is None
+    assert index.find_by_name("EARLY") == "alarm_1"
+
+    index.remove("alarm_2")
+    index.remove("alarm_2")
+    assert index.find_by_name("gym") is None
+    assert len(index) == 2
+
+
+def test_time_index_range_queries() -> None:
+    """Test time lookups stay sorted as items move and split out repeating items."""
+    now = dt_util.now()
+    items = {
+        f"alarm_{hour}": AlarmReminderItem(f"alarm_{hour}", "", True, now + timedelta(hours=hour))
+        for hour in (5, 1, 3)
+    }
+    items["daily"] = AlarmReminderItem("daily", "", True, now + timedelta(hours=2), repeat=Repeat.DAILY)
+    index = TimeIndex()
+    index.rebuild(items)
+
+    assert index.between(True, now, now + timedelta(hours=4)) == ["alarm_1", "alarm_3"]
+    assert index.before(True, now + timedelta(hours=4)) == ["daily"]
+    assert index.between(False, now, now + timedelta(days=1)) == []
+
+    items["alarm_1"].scheduled_time = now + timedelta(hours=6)
+    index.update("alarm_1", items["alarm_1"])
+    index.remove("alarm_5")
+    assert list(index.iter_from(True, now, repeating=False)) == ["alarm_3", "alarm_1"]
+    assert len(index) == 3
@@ -0,0 +1,66 @@
+"""Test recurrence rules."""
+from datetime import datetime, time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.alarms_and_reminders.recurrence import (
+    bound_rrule_text,
+    compile_recurrence,
+    parse_rrule,
+)
+
+
+def _local(*args) -> datetime:
+    return dt_util.as_local(datetime(*args))
+
+
+async def test_one_off_items_do_not_repeat(hass: HomeAssistant) -> None:
+    """Test once and empty custom rules compile to nothing."""
+    start = _local(2024, 3, 4, 7, 30)
+    assert compile_recurrence("once", None, start) is None
+    assert compile_recurrence("custom", [], start) is None
+
+
+async def test_weekdays_skip_weekend(hass: HomeAssistant) -> None:
+    """Test a weekday alarm fired on Friday re-arms for Monday."""
+    friday = _local(2024, 3, 8, 7, 30)
+    recurrence = compile_recurrence("weekdays", None, friday)
+
+    assert recurrence.time == time(7, 30)
+    assert recurrence.next_after(friday) == _local(2024, 3, 11, 7, 30)
+    assert recurrence.next_after(friday, inclusive=True) == friday
+
+
+async def test_weekly_and_custom(hass: HomeAssistant) -> None:
+    """Test weekly repeats on the same weekday and custom days wrap around."""
+    wednesday = _local(2024, 3, 6, 21, 0)
+    assert compile_recurrence("weekly", None, wednesday).next_after(wednesday) == _local(2024, 3, 13, 21, 0)
+
+    recurrence = compile_recurrence("custom", ["mon", "sat"], wednesday)
+    assert recurrence.next_after(wednesday) == _local(2024, 3, 9, 21, 0)
+    assert recurrence.next_after(_local(2024, 3, 9, 22, 0)) == _local(2024, 3, 11, 21, 0)
+
+
+async def test_daily_keeps_wall_clock_time_across_dst(hass: HomeAssistant) -> None:
+    """Test daily alarms keep their local time when the UTC offset changes."""
+    before_dst = _local(2024, 3, 9, 7, 0)
+    after_dst = compile_recurrence("daily", None, before_dst).next_after(before_dst)
+
+    assert after_dst == _local(2024, 3, 10, 7, 0)
+    assert after_dst.utcoffset() != before_dst.utcoffset()
+
+
+async def test_rrule_advances_from_last_occurrence(hass: HomeAssistant) -> None:
+    """Test RRULE items share the parsed rule and honour COUNT."""
+    start = _local(2024, 3, 4, 7, 0)
+    text = bound_rrule_text("FREQ=WEEKLY;BYDAY=MO,TH;COUNT=3", start)
+    assert "COUNT" not in text
+
+    recurrence = compile_recurrence("once", None, start, text)
+    assert recurrence.next_after(start, inclusive=True) == start
+    assert recurrence.next_after(start) == _local(2024, 3, 7, 7, 0)
+    assert recurrence.next_after(_local(2024, 3, 7, 7, 0)) == _local(2024, 3, 11, 7, 0)
+    assert recurrence.next_after(_local(2024, 3, 11, 7, 0)) is None
+
+    assert parse_rrule(text) is parse_rrule(text)
@@ -0,0 +1,87 @@
+"""Test the trigger scheduler."""
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.alarms_and_reminders.scheduler import COMPACT_MIN_SIZE, ItemScheduler
+
+
+async def test_fires_due_items_and_skips_cancelled(hass: HomeAssistant) -> None:
+    """Test due items fire in one pass and cancelled items never fire."""
+    fired = []
+    scheduler = ItemScheduler(hass, fired.append)
+    now = dt_util.utcnow()
+
+    scheduler.schedule("alarm_1", now - timedelta(seconds=2))
+    scheduler.schedule("alarm_2", now - timedelta(seconds=1))
+    scheduler.schedule("alarm_3", now - timedelta(seconds=1))
+    scheduler.schedule("alarm_4", now + timedelta(hours=1))
+    assert scheduler.cancel("alarm_3")
+    assert not scheduler.cancel("alarm_3")
+
+    async_fire_time_changed(hass, now)
+    await hass.async_block_till_done()
+
+    assert fired == ["alarm_1", "alarm_2"]
+    assert len(scheduler) == 1
+    assert "alarm_4" in scheduler
+    assert abs(scheduler.next_fire_time - (now + timedelta(hours=1))) < timedelta(seconds=1)
+    scheduler.async_stop()
+
+
+async def test_reschedule_replaces_previous_trigger(hass: HomeAssistant) -> None:
+    """Test scheduling an item again moves its trigger."""
+    fired = []
+    scheduler = ItemScheduler(hass, fired.append)
+    now = dt_util.utcnow()
+
+    scheduler.schedule("alarm_1", now - timedelta(seconds=1))
+    scheduler.schedule("alarm_1", now + timedelta(hours=1))
+
+    async_fire_time_changed(hass, now)
+    await hass.async_block_till_done()
+
+    assert fired == []
+    assert len(scheduler) == 1
+    scheduler.async_stop()
+    assert len(scheduler) == 0
+    assert scheduler.next_fire_time is None
+
+
+async def test_moving_one_item_keeps_heap_compact(hass: HomeAssistant) -> None:
+    """Test repeated moves of one item do not pile up stale heap entries."""
+    fired = []
+    scheduler = ItemScheduler(hass, fired.append)
+    now = dt_util.utcnow()
+
+    for minutes in range(10 * COMPACT_MIN_SIZE):
+        scheduler.schedule("alarm_1", now + timedelta(minutes=minutes + 1))
+
+    assert len(scheduler) == 1
+    assert len(scheduler._heap) <= COMPACT_MIN_SIZE + 1
+    assert abs(scheduler.next_fire_time - (now + timedelta(minutes=10 * COMPACT_MIN_SIZE))) < timedelta(seconds=1)
+    scheduler.async_stop()
+
+
+async def test_schedule_many_arms_for_earliest(hass: HomeAssistant) -> None:
+    """Test a bulk insert fires in time order and moves earlier-armed items."""
+    fired = []
+    scheduler = ItemScheduler(hass, fired.append)
+    now = dt_util.utcnow()
+
+    scheduler.schedule("alarm_1", now + timedelta(hours=1))
+    scheduler.schedule_many([
+        ("alarm_2", now - timedelta(seconds=1)),
+        ("alarm_1", now - timedelta(seconds=2)),
+        ("alarm_3", now + timedelta(hours=2)),
+    ])
+    assert len(scheduler) == 3
+
+    async_fire_time_changed(hass, now)
+    await hass.async_block_till_done()
+
+    assert fired == ["alarm_1", "alarm_2"]
+    assert list(scheduler._pending) == ["alarm_3"]
+    scheduler.async_stop()
@@ -0,0 +1,71 @@
+"""Test the alarms and reminders sensors."""
+from datetime import timedelta
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.util import dt as dt_util
+
+from pytest_homeassistant_custom_component.common import (
+    MockEntityPlatform,
+    async_capture_events,
+    async_fire_time_changed,
+)
+
+from custom_components.alarms_and_reminders.const import DOMAIN
+from custom_components.alarms_and_reminders.sensor import ActiveItemsSensor, UPDATE_DEBOUNCE
+
+
+def _set_alarm(minutes: int = 0, **data) -> ServiceCall:
+    when = dt_util.now() + timedelta(hours=1, minutes=minutes)
+    return ServiceCall(DOMAIN, "set_alarm", {"time": when.time().replace(microsecond=0), **data})
+
+
+async def test_attributes_capped_patched_and_writes_debounced(hass: HomeAssistant, coordinator) -> None:
+    """Test a burst of changes writes the state once, listing only the next items."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    first = await coordinator.schedule_item(_set_alarm(), True, target)
+    sensor = ActiveItemsSensor(coordinator, is_alarm=True)
+    await MockEntityPlatform(hass).async_add_entities([sensor])
+    state = hass.states.get(sensor.entity_id)
+    assert state.state == "1"
+    assert state.attributes["active_items"][first]["status"] == "scheduled"
+    writes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    item_ids = [
+        await coordinator.schedule_item(_set_alarm(minutes), True, target) for minutes in range(1, 201)
+    ]
+    await coordinator.stop_item(first, True)
+    await coordinator.schedule_item(_set_alarm(name="pills"), False, target)
+    # The publisher flushes on one loop iteration and its listeners run on the next
+    await hass.async_block_till_done()
+    await hass.async_block_till_done()
+    assert not [event for event in writes if event.data["entity_id"] == sensor.entity_id]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=UPDATE_DEBOUNCE * 5))
+    await hass.async_block_till_done()
+    assert len([event for event in writes if event.data["entity_id"] == sensor.entity_id]) == 1
+    state = hass.states.get(sensor.entity_id)
+    assert state.state == "200"
+    assert list(state.attributes["active_items"]) == item_ids[:sensor.limit]
+    assert state.attributes["total_items"] == 200
+
+    await coordinator.delete_all_items(False)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=UPDATE_DEBOUNCE * 10))
+    await hass.async_block_till_done()
+    assert len([event for event in writes if event.data["entity_id"] == sensor.entity_id]) == 1
+
+
+async def test_state_write_before_publisher_flush(hass: HomeAssistant, coordinator) -> None:
+    """Test a state write between a change and its flush lists the cached items."""
+    target = {"satellite": "assist_satellite.kitchen", "media_players": []}
+    first = await coordinator.schedule_item(_set_alarm(), True, target)
+    sensor = ActiveItemsSensor(coordinator, is_alarm=True)
+    await MockEntityPlatform(hass).async_add_entities([sensor])
+    coordinator.publisher.window = 5
+
+    await coordinator.schedule_item(_set_alarm(minutes=-30), True, target)
+    sensor.async_write_ha_state()
+    state = hass.states.get(sensor.entity_id)
+    assert list(state.attributes["active_items"]) == [first]
+    assert state.attributes["total_items"] == 1
+    await sensor.async_remove()
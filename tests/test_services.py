@@ -0,0 +1,201 @@
+"""Test the Alarms and Reminders services."""
+import json
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.alarms_and_reminders import async_setup_entry
+from custom_components.alarms_and_reminders.const import (
+    DOMAIN,
+    SERVICE_BULK_SET,
+    SERVICE_EXPORT_ICS,
+    SERVICE_EXPORT_ITEMS,
+    SERVICE_IMPORT_ICS,
+    SERVICE_LIST_ITEMS,
+    SERVICE_RESYNC,
+)
+from custom_components.alarms_and_reminders.websocket import websocket_item, websocket_items
+
+EVENT_COUNT = 600
+
+
+async def test_bulk_set(hass: HomeAssistant, tmp_path, integration) -> None:
+    """Test bulk_set validates every item and reports a result for each."""
+    when = (dt_util.now() + timedelta(hours=1)).strftime("%H:%M:%S")
+    (tmp_path / "alarms.yaml").write_text(
+        f"items:\n  - type: alarm\n    time: '{when}'\n    satellite: assist_satellite.bedroom\n"
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        {
+            "items": [
+                {"type": "alarm", "time": when, "satellite": "assist_satellite.kitchen"},
+                {"type": "reminder", "time": when, "satellite": "assist_satellite.kitchen"},
+                {"type": "reminder", "time": when, "name": "Pills", "media_player": "media_player.den"},
+                {"type": "timer", "time": when},
+            ],
+            "file": "alarms.yaml",
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    results = response["results"]
+    assert [result["success"] for result in results] == [True, False, True, False, True]
+    assert [result.get("item_id") for result in results] == ["alarm_1", None, "pills", None, "alarm_2"]
+    coordinator = hass.data[DOMAIN]["coordinator"]
+    assert len(coordinator.scheduler) == 3
+    await hass.async_block_till_done()
+    assert hass.states.get(f"{DOMAIN}.pills").state == "scheduled"
+
+    # Resync writes the pending items and reads them back from disk
+    await hass.services.async_call(DOMAIN, SERVICE_RESYNC, {}, blocking=True)
+    assert coordinator.storage.get_item("pills").name == "Pills"
+    assert sorted(coordinator._active_items) == ["alarm_1", "alarm_2", "pills"]
+    assert len(coordinator.scheduler) == 3
+
+
+async def test_import_and_export_ics(hass: HomeAssistant, tmp_path, integration) -> None:
+    """Test a calendar file imports through the bulk path and exports again."""
+    start = dt_util.utcnow() + timedelta(days=1)
+    events = "".join(
+        "BEGIN:VEVENT\r\n"
+        f"UID:shift-{index}\r\n"
+        f"DTSTART:{start + timedelta(minutes=index):%Y%m%dT%H%M%SZ}\r\n"
+        f"SUMMARY:Shift {index}\r\n"
+        "END:VEVENT\r\n"
+        for index in range(EVENT_COUNT)
+    )
+    (tmp_path / "shifts.ics").write_text(
+        f"BEGIN:VCALENDAR\r\n{events}BEGIN:VEVENT\r\nUID:bad\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_IMPORT_ICS,
+        {"file": "shifts.ics", "satellite": "assist_satellite.bedroom"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["imported"] == EVENT_COUNT
+    assert response["failed"] == [{"uid": "bad", "error": "Event has no DTSTART"}]
+    coordinator = hass.data[DOMAIN]["coordinator"]
+    assert len(coordinator.scheduler) == EVENT_COUNT
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_EXPORT_ICS, {"file": "export.ics"}, blocking=True, return_response=True
+    )
+    assert response["exported"] == EVENT_COUNT
+    assert (tmp_path / "export.ics").read_text().count("BEGIN:VEVENT") == EVENT_COUNT
+
+    response = await hass.services.async_call(
+        DOMAIN, SERVICE_EXPORT_ITEMS, {"file": "export.json"}, blocking=True, return_response=True
+    )
+    assert response["exported"] == EVENT_COUNT
+    assert len(json.loads((tmp_path / "export.json").read_text())["alarms"]["scheduled"]) == EVENT_COUNT
+
+
+async def test_list_items_pages_in_time_order(hass: HomeAssistant, integration) -> None:
+    """Test list_items filters by target and window and pages with a cursor."""
+    start = dt_util.start_of_local_day() + timedelta(days=1)
+    items = [
+        {
+            "type": "alarm",
+            "date": (start + timedelta(hours=hour)).date().isoformat(),
+            "time": f"{hour:02}:00",
+            "satellite": "assist_satellite.kitchen" if hour % 2 else "assist_satellite.bedroom",
+        }
+        for hour in (9, 3, 7, 1, 5, 2)
+    ]
+    await hass.services.async_call(
+        DOMAIN, SERVICE_BULK_SET, {"items": items}, blocking=True, return_response=True
+    )
+
+    async def _list(**data) -> dict:
+        return await hass.services.async_call(
+            DOMAIN, SERVICE_LIST_ITEMS, data, blocking=True, return_response=True
+        )
+
+    page = await _list(target="assist_satellite.kitchen", limit=2)
+    assert [item["scheduled_time"][11:16] for item in page["items"]] == ["01:00", "03:00"]
+    page = await _list(target="assist_satellite.kitchen", limit=2, cursor=page["next_cursor"])
+    assert [item["scheduled_time"][11:16] for item in page["items"]] == ["05:00", "07:00"]
+    page = await _list(target="assist_satellite.kitchen", limit=2, cursor=page["next_cursor"])
+    assert [item["scheduled_time"][11:16] for item in page["items"]] == ["09:00"]
+    assert page["next_cursor"] is None
+
+    page = await _list(
+        type="alarm",
+        status=["scheduled"],
+        start=(start + timedelta(hours=2)).isoformat(),
+        end=(start + timedelta(hours=7)).isoformat(),
+    )
+    assert [item["scheduled_time"][11:16] for item in page["items"]] == ["02:00", "03:00", "05:00"]
+    assert page["items"][0]["satellite"] == "assist_satellite.bedroom"
+    assert (await _list(type="reminder"))["items"] == []
+
+    for cursor in ("garbage", "1.5", "inf|alarm_1"):
+        with pytest.raises(vol.Invalid):
+            await _list(cursor=cursor)
+    # Only cursor errors are reported as such
+    with patch.object(integration, "list_items", side_effect=ValueError("bug")):
+        with pytest.raises(ValueError, match="bug"):
+            await _list()
+
+
+async def test_websocket_pages_items(hass: HomeAssistant, integration) -> None:
+    """Test the websocket commands page through items and return one item's details."""
+    start = dt_util.start_of_local_day() + timedelta(days=1)
+    items = [
+        {"type": "alarm", "date": start.date().isoformat(), "time": f"{hour:02}:00", "satellite": "assist_satellite.kitchen"}
+        for hour in (5, 1, 3)
+    ]
+    await hass.services.async_call(
+        DOMAIN, SERVICE_BULK_SET, {"items": items}, blocking=True, return_response=True
+    )
+    connection = MagicMock()
+
+    websocket_items(hass, connection, {"id": 1, "item_type": "alarm", "limit": 2})
+    page = connection.send_result.call_args.args[1]
+    assert [item["scheduled_time"][11:16] for item in page["items"]] == ["01:00", "03:00"]
+    websocket_items(hass, connection, {"id": 2, "limit": 2, "cursor": page["next_cursor"]})
+    page = connection.send_result.call_args.args[1]
+    assert [item["item_id"] for item in page["items"]] == ["alarm_1"]
+    assert page["next_cursor"] is None
+
+    websocket_item(hass, connection, {"id": 3, "item_id": "alarm_1"})
+    assert connection.send_result.call_args.args[1]["satellite"] == "assist_satellite.kitchen"
+    websocket_item(hass, connection, {"id": 4, "item_id": "alarm_9"})
+    assert connection.send_error.call_args.args[1] == "not_found"
+
+
+async def test_entry_setup_keeps_pending_saves(hass: HomeAssistant, integration) -> None:
+    """Test items saved before the config entry is set up survive the storage swap."""
+    when = (dt_util.now() + timedelta(hours=1)).strftime("%H:%M:%S")
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_BULK_SET,
+        {"items": [{"type": "alarm", "time": when, "satellite": "assist_satellite.kitchen"}]},
+        blocking=True,
+        return_response=True,
+    )
+    coordinator = hass.data[DOMAIN]["coordinator"]
+    assert coordinator.storage.dirty
+
+    entry = MockConfigEntry(domain=DOMAIN, data={})
+    entry.add_to_hass(hass)
+    with patch(
+        "homeassistant.config_entries.ConfigEntries.async_forward_entry_setups",
+        new=AsyncMock(return_value=None),
+    ):
+        assert await async_setup_entry(hass, entry)
+    assert list(coordinator._active_items) == ["alarm_1"]
+    assert coordinator.storage.get_item("alarm_1") is not None
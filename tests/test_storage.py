@@ -0,0 +1,201 @@
+"""Test storage of alarms and reminders."""
+import hashlib
+import json
+import sqlite3
+from datetime import timedelta
+
+import pytest
+
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.alarms_and_reminders import storage as storage_module
+from custom_components.alarms_and_reminders.model import AlarmReminderItem, ItemStatus
+from custom_components.alarms_and_reminders.sqlite_storage import SqliteAlarmReminderStorage
+from custom_components.alarms_and_reminders.storage import AlarmReminderStorage
+
+
+def _item(name: str, is_alarm: bool = True, status: str = "scheduled") -> AlarmReminderItem:
+    return AlarmReminderItem(
+        item_id=name,
+        name=name,
+        is_alarm=is_alarm,
+        scheduled_time=dt_util.now().replace(microsecond=0) + timedelta(hours=1),
+        status=ItemStatus(status),
+        satellite="assist_satellite.kitchen",
+    )
+
+
+@pytest.fixture
+def storage(hass: HomeAssistant, tmp_path) -> AlarmReminderStorage:
+    """Return storage writing to a temporary config directory."""
+    hass.config.config_dir = str(tmp_path)
+    (tmp_path / ".storage").mkdir()
+    return AlarmReminderStorage(hass, save_delay=2)
+
+
+async def test_burst_of_changes_is_written_once(hass: HomeAssistant, storage) -> None:
+    """Test delayed saves coalesce into a single write."""
+    items = {}
+    for number in range(200):
+        items[f"alarm_{number}"] = _item(f"alarm_{number}")
+        storage.async_delay_save(lambda: items, [f"alarm_{number}"])
+
+    assert storage.write_count == 0
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    await hass.async_block_till_done()
+
+    assert storage.write_count == 1
+    assert not storage.dirty
+    loaded = await AlarmReminderStorage(hass).async_load()
+    assert set(loaded) == set(items)
+
+
+async def test_flush_writes_pending_changes(hass: HomeAssistant, storage) -> None:
+    """Test flushing writes immediately and only once."""
+    items = {"reminder_1": _item("reminder_1", is_alarm=False)}
+    storage.async_delay_save(lambda: items)
+
+    await storage.async_flush()
+    await storage.async_flush()
+
+    assert storage.write_count == 1
+    loaded = await AlarmReminderStorage(hass).async_load()
+    assert loaded["reminder_1"].scheduled_time == items["reminder_1"].scheduled_time
+
+
+async def test_journal_records_changes_and_replays(hass: HomeAssistant, storage) -> None:
+    """Test each change appends one record and startup replays them."""
+    items = {"alarm_1": _item("alarm_1"), "alarm_2": _item("alarm_2")}
+    await storage.async_save(items)
+
+    items["alarm_1"].status = ItemStatus.STOPPED
+    del items["alarm_2"]
+    storage.async_delay_save(lambda: items, ["alarm_1", "alarm_2"])
+    await storage.async_flush()
+
+    records = storage.journal_file.read_text().splitlines()
+    assert len(records) == 2
+    assert '"op":"status"' in "".join(records)
+    assert '"op":"delete"' in "".join(records)
+
+    loaded = await AlarmReminderStorage(hass).async_load()
+    assert set(loaded) == {"alarm_1"}
+    assert loaded["alarm_1"].status == "stopped"
+
+
+async def test_journal_is_compacted(hass: HomeAssistant, storage, monkeypatch) -> None:
+    """Test the journal is folded into the snapshot past its threshold."""
+    monkeypatch.setattr(storage_module, "JOURNAL_COMPACT_BYTES", 1)
+    items = {"reminder_1": _item("reminder_1", is_alarm=False)}
+
+    await storage.async_update_item("reminder_1", items["reminder_1"])
+    await storage._compact_task
+
+    assert not storage.journal_file.exists()
+    loaded = await AlarmReminderStorage(hass).async_load()
+    assert set(loaded) == {"reminder_1"}
+
+
+async def test_damaged_snapshot_falls_back_to_backup(hass: HomeAssistant, storage) -> None:
+    """Test a corrupted snapshot is recovered from the previous generation."""
+    items = {"alarm_1": _item("alarm_1")}
+    await storage.async_save(items)
+    items["alarm_2"] = _item("alarm_2")
+    await storage.async_update_item("alarm_2", items["alarm_2"])
+    await storage.async_save(items)
+
+    content = storage.alarms_file.read_text()
+    storage.alarms_file.write_text(content[: len(content) // 2])
+
+    loaded = await AlarmReminderStorage(hass).async_load()
+    assert set(loaded) == {"alarm_1", "alarm_2"}
+
+
+async def test_sqlite_migrates_json_and_writes_rows(hass: HomeAssistant, storage) -> None:
+    """Test the SQLite backend imports the JSON files and upserts single rows."""
+    await storage.async_save(
+        {"alarm_1": _item("alarm_1"), "reminder_1": _item("reminder_1", is_alarm=False)}
+    )
+
+    sqlite = SqliteAlarmReminderStorage(hass)
+    loaded = await sqlite.async_load()
+    assert loaded.keys() == {"alarm_1", "reminder_1"}
+    assert loaded["alarm_1"].scheduled_time.tzinfo is not None
+
+    await sqlite.async_update_item("alarm_1", _item("alarm_1", status="stopped"))
+    await sqlite.async_delete_item("reminder_1")
+    assert sqlite.get_item("alarm_1").status == "stopped"
+    assert sqlite.get_item("reminder_1") is None
+    await sqlite.async_close()
+
+    # Already migrated: the JSON files are not imported again
+    sqlite = SqliteAlarmReminderStorage(hass)
+    assert list(await sqlite.async_load()) == ["alarm_1"]
+
+    # The connection is closed at stop even without a pending save
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+    assert sqlite._conn is None
+
+
+async def test_sqlite_upgrades_version_1_tables(hass: HomeAssistant, storage) -> None:
+    """Test a version 1 database keeps its rows without the copied columns."""
+    record = storage._to_record(_item("alarm_1"))
+    conn = sqlite3.connect(storage.storage_dir / "alarms_and_reminders.db")
+    conn.executescript(
+        "CREATE TABLE items (item_id TEXT PRIMARY KEY, is_alarm INTEGER NOT NULL, "
+        "status TEXT NOT NULL, scheduled_time REAL, data TEXT NOT NULL);"
+        "CREATE INDEX items_type_status ON items (is_alarm, status);"
+        "CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);"
+        "INSERT INTO meta VALUES ('schema_version', '1');"
+    )
+    with conn:
+        conn.execute(
+            "INSERT INTO items VALUES ('alarm_1', 1, 'scheduled', 0, ?)", (json.dumps(record),)
+        )
+    conn.close()
+
+    sqlite = SqliteAlarmReminderStorage(hass)
+    assert list(await sqlite.async_load()) == ["alarm_1"]
+    await sqlite.async_update_item("alarm_2", _item("alarm_2"))
+    columns = sqlite._conn.execute("PRAGMA table_info(items)").fetchall()
+    assert [column[1] for column in columns] == ["item_id", "data"]
+    await sqlite.async_close()
+
+
+async def test_get_item_is_served_from_memory(hass: HomeAssistant, storage, monkeypatch) -> None:
+    """Test keyed lookups follow writes without re-reading the files."""
+    await storage.async_save({"alarm_1": _item("alarm_1")})
+    await storage.async_update_item("alarm_1", _item("alarm_1", status="stopped"))
+
+    def _fail(*args):
+        raise AssertionError("storage files were read")
+
+    monkeypatch.setattr(storage_module, "_read_snapshot", _fail)
+    assert storage.get_item("alarm_1").status == "stopped"
+    assert storage.get_item("alarm_1").scheduled_time.tzinfo is not None
+    assert storage.get_item("alarm_missing") is None
+
+    await storage.async_delete_item("alarm_1")
+    assert storage.get_item("alarm_1") is None
+
+
+async def test_export_and_pretty_printed_snapshots(hass: HomeAssistant, storage, tmp_path) -> None:
+    """Test the readable export and that indented snapshot files still load."""
+    await storage.async_save({"alarm_1": _item("alarm_1")})
+
+    export = tmp_path / "export.json"
+    await storage.async_export(export)
+    assert "\n    " in export.read_text()
+    assert list(json.loads(export.read_text())["alarms"]["scheduled"]) == ["alarm_1"]
+
+    # Snapshots written before the compact encoding was used
+    payload = json.dumps(json.loads(export.read_text())["alarms"], indent=4)
+    checksum = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    storage.alarms_file.write_text(f'{{"checksum":"{checksum}","data":{payload}}}')
+
+    loaded = await AlarmReminderStorage(hass).async_load()
+    assert list(loaded) == ["alarm_1"]